@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from . import planners
-from .planners import plan_duplicate_blocks
-from .plans import load_plan, save_plan
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only
+    from . import planners
+    from .planners import plan_duplicate_blocks
+    from .plans import load_plan, save_plan
 
 __all__ = [
     "__version__",
@@ -15,3 +19,23 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+# Resolved on first access so ``import ai_clean.<module>`` (and the CLI) does
+# not pay for the planners and pydantic models up front.
+_LAZY_EXPORTS = {
+    "planners": ("ai_clean.planners", None),
+    "plan_duplicate_blocks": ("ai_clean.planners", "plan_duplicate_blocks"),
+    "save_plan": ("ai_clean.plans", "save_plan"),
+    "load_plan": ("ai_clean.plans", "load_plan"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
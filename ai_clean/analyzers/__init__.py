@@ -3,7 +3,7 @@
 from .advanced import collect_advanced_cleanup_ideas
 from .docstrings import find_docstring_gaps
 from .duplicate import find_duplicate_blocks
-from .orchestrator import analyze_repo
+from .orchestrator import analyze_repo, iter_findings
 from .organize import propose_organize_groups
 from .structure import find_structure_issues
 
@@ -13,5 +13,6 @@ __all__ = [
     "find_docstring_gaps",
     "find_duplicate_blocks",
     "find_structure_issues",
+    "iter_findings",
     "propose_organize_groups",
 ]
@@ -0,0 +1,177 @@
+"""On-disk cache of per-file analyzer results.
+
+The cache lives at ``<metadata root>/cache/analysis.json`` and stores the
+:class:`~ai_clean.analyzers.corpus.FileTask` results of every analyzed file.
+An entry is reused when the file's ``mtime_ns`` and size match, or when they
+differ but the SHA-1 of its contents does not. Results are keyed by the task
+key, which already encodes every setting the collector depends on, so changing
+an analyzer threshold only recomputes the tasks that read it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Hashable, Iterable, Sequence
+
+from ai_clean.analyzers.corpus import FileTask, SourceCorpus, SourceFile
+
+LOGGER = logging.getLogger(__name__)
+
+# Bump whenever a collector's output format or semantics change.
+CACHE_VERSION = 2
+
+
+def default_cache_path(metadata_root: Path) -> Path:
+    """Return the analysis cache location under ``metadata_root``."""
+
+    return metadata_root / "cache" / "analysis.json"
+
+
+class AnalysisCache:
+    """Load, apply, and persist cached per-file analyzer results."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._stats: dict[str, tuple[int, int]] = {}
+        self._planned: set[str] = set()
+        self._loaded = False
+
+    def prime(
+        self,
+        corpus: SourceCorpus,
+        assignments: Iterable[tuple[Sequence[SourceFile], Sequence[FileTask]]],
+    ) -> None:
+        """Prime ``corpus`` with cached results for unchanged files."""
+
+        self._load(corpus.root)
+        for files, tasks in assignments:
+            for source in files:
+                path = source.relative_path.as_posix()
+                self._planned.add(path)
+                self._prime_file(source, path, tasks)
+
+    def save(self, corpus: SourceCorpus) -> None:
+        """Write results for the primed files and evict files that disappeared."""
+
+        existing = {
+            source.relative_path.as_posix(): source for source in corpus.files()
+        }
+        entries: dict[str, dict[str, Any]] = {}
+        for path, entry in self._entries.items():
+            if path in existing and path not in self._planned:
+                entries[path] = entry
+
+        for path in sorted(self._planned):
+            source = existing[path]
+            stat = self._stats.get(path)
+            if stat is None:
+                continue
+            try:
+                digest = source.content_hash
+            except OSError:
+                continue
+            previous = self._entries.get(path)
+            results: dict[str, Any] = {}
+            if previous is not None and previous.get("sha1") == digest:
+                results.update(previous.get("results", {}))
+            for key, value in source.completed().items():
+                results[_encode_key(key)] = value
+            if not results:
+                continue
+            entries[path] = {
+                "mtime_ns": stat[0],
+                "size": stat[1],
+                "sha1": digest,
+                "results": results,
+            }
+
+        payload = {
+            "version": CACHE_VERSION,
+            "root": str(corpus.root),
+            "files": entries,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_suffix(".json.tmp")
+            temporary.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(temporary, self.path)
+        except OSError as exc:
+            LOGGER.warning("Could not write analysis cache %s: %s", self.path, exc)
+            return
+        self._entries = entries
+
+    def _prime_file(
+        self, source: SourceFile, path: str, tasks: Sequence[FileTask]
+    ) -> None:
+        if path not in self._stats:
+            try:
+                stat = source.absolute_path.stat()
+            except OSError:
+                return
+            self._stats[path] = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(path)
+        if entry is None:
+            self.misses += len(tasks)
+            return
+        if not self._is_current(source, path, entry):
+            self.misses += len(tasks)
+            # The file changed; collectors may update these incrementally.
+            results = entry.get("results", {})
+            for task in tasks:
+                encoded = _encode_key(task.key)
+                if encoded in results:
+                    source.prime_stale(task.key, results[encoded])
+            return
+        results = entry.get("results", {})
+        for task in tasks:
+            encoded = _encode_key(task.key)
+            if encoded in results and not source.has_result(task.key):
+                source.prime(task.key, results[encoded])
+                self.hits += 1
+            elif encoded not in results:
+                self.misses += 1
+
+    def _is_current(self, source: SourceFile, path: str, entry: dict[str, Any]) -> bool:
+        mtime_ns, size = self._stats[path]
+        if entry.get("mtime_ns") == mtime_ns and entry.get("size") == size:
+            source.prime_content_hash(str(entry.get("sha1")))
+            return True
+        if entry.get("size") != size:
+            return False
+        try:
+            return source.content_hash == entry.get("sha1")
+        except OSError:
+            return False
+
+    def _load(self, root: Path) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable analysis cache %s: %s", self.path, exc)
+            return
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != CACHE_VERSION
+            or payload.get("root") != str(root)
+            or not isinstance(payload.get("files"), dict)
+        ):
+            return
+        self._entries = payload["files"]
+
+
+def _encode_key(key: Hashable) -> str:
+    return repr(key)
+
+
+__all__ = ["AnalysisCache", "CACHE_VERSION", "default_cache_path"]
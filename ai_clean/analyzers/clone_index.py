@@ -0,0 +1,354 @@
+"""Persistent index of duplicate-analyzer windows for instant clone lookups.
+
+The index lives at ``<metadata root>/cache/duplicates.db`` (SQLite in WAL
+mode) and maps every window hash of the duplicate analyzer to the file and
+lines it covers. :meth:`CloneIndex.refresh` brings it up to date
+incrementally: files whose ``mtime_ns`` and size (or, failing that, SHA-1)
+are unchanged keep their rows, changed and new files are re-hashed, and
+deleted files are dropped. :meth:`CloneIndex.lookup_clones` then answers
+"where else is this block?" with indexed hash lookups, confirming each match
+on normalized text like the analyzer does, so hash collisions are never
+reported.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+
+from ai_clean.analyzers.corpus import (
+    FileTask,
+    SourceCorpus,
+    SourceFile,
+    resolve_corpus,
+)
+from ai_clean.analyzers.duplicate import (
+    _TOKEN_LINES_TASK,
+    _make_window,
+    _token_lines,
+    _window_task,
+)
+from ai_clean.config import AiCleanConfig, DuplicateAnalyzerConfig
+from ai_clean.metadata import resolve_metadata_paths
+
+# Bump whenever the stored rows change meaning.
+INDEX_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha1 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS windows (
+    hash INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    ordinal INTEGER NOT NULL,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS windows_hash ON windows (hash);
+CREATE INDEX IF NOT EXISTS windows_file ON windows (file_id, ordinal);
+"""
+
+
+def default_index_path(metadata_root: Path) -> Path:
+    """Return the duplicate index location under ``metadata_root``."""
+
+    return metadata_root / "cache" / "duplicates.db"
+
+
+def open_clone_index(root: Path, config: AiCleanConfig) -> CloneIndex:
+    """Open the duplicate index stored under the metadata root for ``root``."""
+
+    metadata_root, _, _, _ = resolve_metadata_paths(root, config)
+    return CloneIndex(
+        default_index_path(metadata_root), root, config.analyzers.duplicate
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class IndexUpdate:
+    """File counts from one :meth:`CloneIndex.refresh`."""
+
+    added: int
+    updated: int
+    removed: int
+    unchanged: int
+
+
+@dataclass(frozen=True, slots=True)
+class CloneMatch:
+    """Lines of the queried file and another place holding the same code."""
+
+    start_line: int
+    end_line: int
+    path: str
+    clone_start_line: int
+    clone_end_line: int
+
+
+class CloneIndex:
+    """Window hashes of every file under ``root``, stored in ``db_path``."""
+
+    def __init__(
+        self, db_path: Path, root: Path, settings: DuplicateAnalyzerConfig
+    ) -> None:
+        self.db_path = db_path
+        self.root = root
+        self.settings = settings
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._reset_if_stale()
+
+    def __enter__(self) -> CloneIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def refresh(self, *, corpus: SourceCorpus | None = None) -> IndexUpdate:
+        """Re-hash changed and new files and drop deleted ones."""
+
+        settings = self.settings
+        sources = resolve_corpus(self.root, corpus, settings.ignore_dirs).files(
+            settings.ignore_dirs
+        )
+        known = {
+            path: (file_id, mtime_ns, size, digest)
+            for file_id, path, mtime_ns, size, digest in self._conn.execute(
+                "SELECT id, path, mtime_ns, size, sha1 FROM files"
+            )
+        }
+        task = _index_task(settings)
+        added = updated = unchanged = 0
+        with self._conn:
+            for source in sources:
+                path = source.relative_path.as_posix()
+                try:
+                    stat = os.stat(source.absolute_path)
+                    row = known.pop(path, None)
+                    if row is not None and row[1:3] == (stat.st_mtime_ns, stat.st_size):
+                        unchanged += 1
+                        continue
+                    digest = source.content_hash
+                    rows = (
+                        None if row and row[3] == digest else source.run_transient(task)
+                    )
+                except OSError:
+                    continue
+                finally:
+                    source.release()
+                if row is None:
+                    file_id = self._conn.execute(
+                        "INSERT INTO files (path, mtime_ns, size, sha1) "
+                        "VALUES (?, ?, ?, ?)",
+                        (path, stat.st_mtime_ns, stat.st_size, digest),
+                    ).lastrowid
+                    added += 1
+                else:
+                    file_id = row[0]
+                    self._conn.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ?, sha1 = ? "
+                        "WHERE id = ?",
+                        (stat.st_mtime_ns, stat.st_size, digest, file_id),
+                    )
+                    if rows is None:
+                        unchanged += 1
+                        continue
+                    self._conn.execute(
+                        "DELETE FROM windows WHERE file_id = ?", (file_id,)
+                    )
+                    updated += 1
+                self._conn.executemany(
+                    "INSERT INTO windows "
+                    "(hash, file_id, ordinal, start_line, end_line) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(value, file_id, *rest) for value, *rest in rows],
+                )
+            for file_id, *_ in known.values():
+                self._conn.execute("DELETE FROM windows WHERE file_id = ?", (file_id,))
+                self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+        return IndexUpdate(added, updated, len(known), unchanged)
+
+    def lookup_clones(
+        self, path: str, start_line: int = 1, end_line: int | None = None
+    ) -> list[CloneMatch]:
+        """Return other places holding code from ``path`` lines ``start``-``end``.
+
+        ``path`` is POSIX and relative to ``root``; ``end_line`` defaults to
+        the end of the file. Windows inside the range are matched, or the
+        windows containing it when it is shorter than one window. Consecutive
+        matching windows are reported as one region. Call :meth:`refresh`
+        first for results that reflect the files on disk.
+        """
+
+        row = self._conn.execute(
+            "SELECT id FROM files WHERE path = ?", (path,)
+        ).fetchone()
+        if row is None:
+            return []
+        file_id = row[0]
+        last = end_line if end_line is not None else 2**62
+        windows = self._conn.execute(
+            "SELECT ordinal, hash FROM windows WHERE file_id = ? "
+            "AND start_line >= ? AND end_line <= ? ORDER BY ordinal",
+            (file_id, start_line, last),
+        ).fetchall()
+        if not windows:
+            windows = self._conn.execute(
+                "SELECT ordinal, hash FROM windows WHERE file_id = ? "
+                "AND start_line <= ? AND end_line >= ? ORDER BY ordinal",
+                (file_id, start_line, last),
+            ).fetchall()
+
+        # Group matches by (clone file, ordinal offset) into consecutive runs.
+        runs: dict[tuple[str, int], list[list[int]]] = {}
+        for ordinal, value in windows:
+            for other_path, other_id, other_ordinal in self._conn.execute(
+                "SELECT files.path, files.id, windows.ordinal FROM windows "
+                "JOIN files ON files.id = windows.file_id WHERE windows.hash = ?",
+                (value,),
+            ):
+                if other_id == file_id and other_ordinal == ordinal:
+                    continue
+                chains = runs.setdefault((other_path, other_ordinal - ordinal), [])
+                if chains and chains[-1][-1] == ordinal - 1:
+                    chains[-1].append(ordinal)
+                else:
+                    chains.append([ordinal])
+
+        sources: dict[str, SourceFile] = {}
+        matches: list[CloneMatch] = []
+        for (other_path, offset), chains in runs.items():
+            for chain in chains:
+                match = self._confirm(
+                    sources, path, other_path, chain[0], offset, len(chain)
+                )
+                if match is not None:
+                    matches.append(match)
+        for source in sources.values():
+            source.release()
+        matches.sort(
+            key=lambda match: (match.start_line, match.path, match.clone_start_line)
+        )
+        return matches
+
+    def _confirm(
+        self,
+        sources: dict[str, SourceFile],
+        path: str,
+        other_path: str,
+        ordinal: int,
+        offset: int,
+        count: int,
+    ) -> CloneMatch | None:
+        """Build the match for ``count`` windows if their text really agrees."""
+
+        length = count + self.settings.window_size - 1
+        source = self._source(sources, path)
+        other_source = self._source(sources, other_path)
+        try:
+            text, window = _make_window(
+                source, 0, ordinal, length, _token_lines(source, self.settings)
+            )
+            other_text, other = _make_window(
+                other_source,
+                0,
+                ordinal + offset,
+                length,
+                _token_lines(other_source, self.settings),
+            )
+        except (OSError, IndexError):
+            return None
+        if text != other_text:
+            return None
+        return CloneMatch(
+            window.start_line,
+            window.end_line,
+            other_path,
+            other.start_line,
+            other.end_line,
+        )
+
+    def _source(self, sources: dict[str, SourceFile], path: str) -> SourceFile:
+        source = sources.get(path)
+        if source is None:
+            source = sources[path] = SourceFile(self.root / path, Path(path))
+        return source
+
+    def _reset_if_stale(self) -> None:
+        expected = json.dumps(
+            {
+                "version": INDEX_VERSION,
+                "root": str(self.root),
+                "window_size": self.settings.window_size,
+                "mode": self.settings.mode,
+                "ignore_dirs": list(self.settings.ignore_dirs),
+            },
+            sort_keys=True,
+        )
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'settings'"
+        ).fetchone()
+        if row is not None and row[0] == expected:
+            return
+        self._conn.execute("DELETE FROM windows")
+        self._conn.execute("DELETE FROM files")
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('settings', ?)",
+            (expected,),
+        )
+
+
+def _index_task(settings: DuplicateAnalyzerConfig) -> FileTask:
+    return FileTask(
+        key=("duplicate.index_rows", settings.window_size, settings.mode),
+        collect=_collect_index_rows,
+        args=(settings,),
+    )
+
+
+def _collect_index_rows(
+    source: SourceFile, settings: DuplicateAnalyzerConfig
+) -> list[tuple[int, int, int, int]]:
+    """Return ``(hash, ordinal, start line, end line)`` for every window."""
+
+    hashes, ordinals = source.run(_window_task(settings))
+    size = settings.window_size
+    if settings.mode == "tokens":
+        units = source.run(_TOKEN_LINES_TASK)
+        return [
+            (value, ordinal, units[ordinal][0], units[ordinal + size - 1][0])
+            for value, ordinal in zip(hashes, ordinals)
+        ]
+    return [
+        (value, ordinal, ordinal + 1, ordinal + size)
+        for value, ordinal in zip(hashes, ordinals)
+    ]
+
+
+__all__ = [
+    "CloneIndex",
+    "CloneMatch",
+    "INDEX_VERSION",
+    "IndexUpdate",
+    "default_index_path",
+    "open_clone_index",
+]
@@ -0,0 +1,502 @@
+"""Shared source corpus handed to every analyzer during a single run.
+
+The corpus walks the repository once (see :mod:`ai_clean.analyzers.walker`),
+memory-maps each Python file instead of copying it into a ``bytes`` object,
+and decodes and parses it lazily on first use. :attr:`SourceFile.line_count`
+counts line breaks in the mapped bytes, and :meth:`SourceFile.line_slice`
+decodes just the requested lines through a line-offset table. Directories
+named in ``prune_dirs`` are never entered, and git-ignored files are left
+out. Analyzers request their own file view via :meth:`SourceCorpus.files`,
+which applies the analyzer-specific ``ignore_dirs`` filter on top of the
+shared walk.
+
+Per-file analyzer work is expressed as :class:`FileTask` objects. Results are
+memoized on each :class:`SourceFile`, which lets the orchestrator compute them
+elsewhere (for example in worker processes) and prime the memo before the
+analyzers aggregate findings.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import logging
+import mmap
+import re
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, NamedTuple
+
+from ai_clean.analyzers.walker import walk_python_files
+
+LOGGER = logging.getLogger(__name__)
+
+# Every line boundary ``str.splitlines`` knows besides ``\n``, as UTF-8 bytes.
+# Files containing any of them are rare and take the decoding path.
+_OTHER_LINE_BREAKS = (
+    b"\r",
+    b"\x0b",
+    b"\x0c",
+    b"\x1c",
+    b"\x1d",
+    b"\x1e",
+    b"\xc2\x85",
+    b"\xe2\x80\xa8",
+    b"\xe2\x80\xa9",
+)
+# Each mapping holds a file descriptor, so a corpus keeps at most this many.
+_MAX_OPEN_MAPS = 256
+# Newlines are counted in slices of this size so no full copy of a file exists.
+_COUNT_CHUNK = 1 << 20
+_NEWLINE = re.compile(b"\n")
+
+
+class FileTask(NamedTuple):
+    """Picklable description of one per-file computation.
+
+    ``collect`` must be a module-level function called as
+    ``collect(source, *args)`` and return plain, picklable data. ``key`` must
+    uniquely identify the computation including every argument it depends on.
+    """
+
+    key: Hashable
+    collect: Callable[..., Any]
+    args: tuple[Any, ...] = ()
+
+
+class FileTaskError(RuntimeError):
+    """Raised when a primed task result records a failure from another process."""
+
+
+class _FailedTask:
+    __slots__ = ("message",)
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+
+def _decode(data: Any) -> str:
+    text = str(data, "utf-8", "ignore")
+    # Match ``Path.read_text`` universal-newline translation.
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class SourceFile:
+    """A discovered Python file with lazily cached text, lines, and AST.
+
+    The file is memory-mapped on first access. The mapping is released once
+    the text has been decoded (nothing needs the raw bytes after that) or
+    when its corpus has too many files mapped; it is remapped if needed again.
+    """
+
+    __slots__ = (
+        "absolute_path",
+        "relative_path",
+        "_corpus",
+        "_map",
+        "_plain",
+        "_count",
+        "_starts",
+        "_text",
+        "_digest",
+        "_lines",
+        "_tree",
+        "_parsed",
+        "_results",
+        "_stale",
+    )
+
+    def __init__(
+        self,
+        absolute_path: Path,
+        relative_path: Path,
+        corpus: "SourceCorpus | None" = None,
+    ) -> None:
+        self.absolute_path = absolute_path
+        self.relative_path = relative_path
+        self._corpus = corpus
+        self._map: mmap.mmap | bytes | None = None
+        self._plain: bool | None = None
+        self._count: int | None = None
+        self._starts: array[int] | None = None
+        self._text: str | None = None
+        self._digest: str | None = None
+        self._lines: list[str] | None = None
+        self._tree: ast.Module | None = None
+        self._parsed = False
+        self._results: dict[Hashable, Any] = {}
+        self._stale: dict[Hashable, Any] | None = None
+
+    @property
+    def text(self) -> str:
+        """Return the decoded file contents, reading from disk only once."""
+
+        if self._text is None:
+            self._text = _decode(self._buffer())
+            self.release()
+        return self._text
+
+    @property
+    def content_hash(self) -> str:
+        """Return the SHA-1 hex digest of the raw file bytes."""
+
+        if self._digest is None:
+            self._buffer()
+        assert self._digest is not None
+        return self._digest
+
+    @property
+    def lines(self) -> list[str]:
+        """Return ``text.splitlines()``, computed once per file."""
+
+        if self._lines is None:
+            self._lines = self.text.splitlines()
+        return self._lines
+
+    @property
+    def line_count(self) -> int:
+        """Return ``len(lines)``, counted in the raw bytes when not yet decoded."""
+
+        if self._count is None and self._text is None:
+            data = self._plain_bytes()
+            if data is not None:
+                tail = data[data.rfind(b"\n") + 1 :]
+                # The unterminated tail is a line only if something decodes.
+                newlines = sum(
+                    data[offset : offset + _COUNT_CHUNK].count(b"\n")
+                    for offset in range(0, len(data), _COUNT_CHUNK)
+                )
+                self._count = newlines + bool(_decode(tail))
+        return len(self.lines) if self._count is None else self._count
+
+    def line_slice(self, start: int, end: int) -> list[str]:
+        """Return ``lines[start:end]``, decoding only those lines if needed.
+
+        ``start`` and ``end`` are non-negative, 0-based indexes.
+        """
+
+        starts = self._line_starts() if self._text is None else None
+        if starts is None:
+            return self.lines[start:end]
+        if start >= min(end, len(starts)):
+            return []
+        data = self._buffer()
+        stop = starts[end] if end < len(starts) else len(data)
+        view = memoryview(data)
+        try:
+            chunk = view[starts[start] : stop]
+            try:
+                return _decode(chunk).splitlines()
+            finally:
+                chunk.release()
+        finally:
+            view.release()
+
+    def release(self) -> None:
+        """Unmap the file; later accesses map it again if they need bytes."""
+
+        if self._map is None:
+            return
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._map = None
+        if self._corpus is not None:
+            self._corpus._open_maps.pop(self, None)
+
+    def _buffer(self) -> mmap.mmap | bytes:
+        if self._map is not None:
+            if self._corpus is not None:
+                self._corpus._open_maps.move_to_end(self)
+            return self._map
+        with self.absolute_path.open("rb") as handle:
+            try:
+                data: mmap.mmap | bytes = mmap.mmap(
+                    handle.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:  # empty files cannot be mapped
+                data = b""
+        if self._digest is None:
+            self._digest = hashlib.sha1(data).hexdigest()
+        self._map = data
+        if self._corpus is not None:
+            self._corpus.reads += 1
+            self._corpus.bytes_read += len(data)
+            self._corpus._map_opened(self)
+        return data
+
+    def _plain_bytes(self) -> mmap.mmap | bytes | None:
+        """Return the mapped bytes if newline is their only line break."""
+
+        if self._plain is False:
+            return None
+        data = self._buffer()
+        if self._plain is None:
+            self._plain = all(data.find(mark) == -1 for mark in _OTHER_LINE_BREAKS)
+        return data if self._plain else None
+
+    def _line_starts(self) -> array[int] | None:
+        if self._starts is None:
+            data = self._plain_bytes()
+            if data is None:
+                return None
+            # Matching in the buffer itself avoids copying the file or its lines.
+            starts = array("Q", [0])
+            starts.extend(match.end() for match in _NEWLINE.finditer(data))
+            if starts[-1] == len(data):
+                starts.pop()  # the file length, not the start of a line
+            if starts and not _decode(data[starts[-1] :]):
+                starts.pop()
+            self._starts = starts
+        return self._starts
+
+    @property
+    def tree(self) -> ast.Module | None:
+        """Return the parsed module, or ``None`` when the file has a syntax error."""
+
+        if not self._parsed:
+            source = self.text
+            try:
+                self._tree = ast.parse(
+                    source, filename=str(self.relative_path), type_comments=True
+                )
+            except SyntaxError:
+                self._tree = None
+            self._parsed = True
+            if self._corpus is not None:
+                self._corpus.parses += 1
+        return self._tree
+
+    def run(self, task: FileTask) -> Any:
+        """Return the memoized result of ``task``, computing it on first use."""
+
+        if task.key in self._results:
+            result = self._results[task.key]
+            if isinstance(result, _FailedTask):
+                raise FileTaskError(result.message)
+            return result
+        result = task.collect(self, *task.args)
+        self._results[task.key] = result
+        return result
+
+    def run_transient(self, task: FileTask) -> Any:
+        """Return ``task``'s result without keeping what computing it loaded.
+
+        A memoized result is returned as usual. Otherwise the result, any
+        results memoized while computing it, and text or AST loaded for it are
+        dropped afterwards, so a scan over a large tree holds one file's data
+        at a time.
+        """
+
+        if task.key in self._results:
+            return self.run(task)
+        decoded, parsed, known = (
+            self._text is not None,
+            self._parsed,
+            set(self._results),
+        )
+        try:
+            return task.collect(self, *task.args)
+        finally:
+            for key in set(self._results) - known:
+                del self._results[key]
+            if not decoded:
+                self._text = self._lines = None
+            if not parsed:
+                self._tree, self._parsed = None, False
+            self.release()
+
+    def prime(self, key: Hashable, result: Any) -> None:
+        """Store a result computed elsewhere so :meth:`run` can reuse it."""
+
+        self._results[key] = result
+
+    def prime_stale(self, key: Hashable, result: Any) -> None:
+        """Record ``key``'s result for an earlier version of this file.
+
+        Collectors that can update a previous result incrementally (see
+        :mod:`ai_clean.analyzers.outline`) pick it up with :meth:`take_stale`.
+        """
+
+        if self._stale is None:
+            self._stale = {}
+        self._stale[key] = result
+
+    def take_stale(self, key: Hashable) -> Any:
+        """Return and forget the stale result for ``key``, or ``None``."""
+
+        if self._stale is None:
+            return None
+        return self._stale.pop(key, None)
+
+    def stale_results(self) -> dict[Hashable, Any]:
+        """Return the stale results not yet taken by a collector."""
+
+        return dict(self._stale or {})
+
+    def prime_failure(self, key: Hashable, message: str) -> None:
+        """Record that computing ``key`` failed with ``message``."""
+
+        self._results[key] = _FailedTask(message)
+
+    def prime_content_hash(self, digest: str) -> None:
+        """Record a content hash computed elsewhere without reading the file."""
+
+        if self._digest is None:
+            self._digest = digest
+
+    def has_result(self, key: Hashable) -> bool:
+        """Return whether ``key`` is memoized, successfully or not."""
+
+        return key in self._results
+
+    def completed(self) -> dict[Hashable, Any]:
+        """Return the memoized results of every task that succeeded."""
+
+        return {
+            key: result
+            for key, result in self._results.items()
+            if not isinstance(result, _FailedTask)
+        }
+
+
+class SourceCorpus:
+    """Single-pass view of the Python files under ``root``.
+
+    Directories named in ``prune_dirs`` are skipped during the walk rather
+    than filtered afterwards; pass only names every consumer of the corpus
+    ignores. With ``gitignore`` the walk honors git's ignore rules. After the
+    walk, ``skipped_dirs`` and ``skipped_files`` count what it left out.
+    """
+
+    def __init__(
+        self, root: Path, prune_dirs: Iterable[str] = (), gitignore: bool = True
+    ) -> None:
+        self.root = root
+        self.prune_dirs = frozenset(prune_dirs)
+        self.gitignore = gitignore
+        self.reads = 0
+        self.bytes_read = 0
+        self.parses = 0
+        self.skipped_dirs = 0
+        self.skipped_files = 0
+        self._files: list[SourceFile] | None = None
+        self._open_maps: OrderedDict[SourceFile, None] = OrderedDict()
+
+    def subset(self, paths: Iterable[str]) -> "SourceCorpus":
+        """Return a view limited to ``paths`` (POSIX, relative to ``root``).
+
+        The view shares this corpus's files, so reads, parses, and memoized
+        task results are reused in both directions.
+        """
+
+        wanted = set(paths)
+        view = SourceCorpus(self.root, self.prune_dirs, self.gitignore)
+        view._files = [
+            source
+            for source in self._discover()
+            if source.relative_path.as_posix() in wanted
+        ]
+        return view
+
+    def refresh(self, paths: Iterable[str]) -> None:
+        """Drop everything cached for ``paths`` (POSIX, relative to ``root``).
+
+        Paths that still exist get a fresh :class:`SourceFile`, which rereads
+        and reparses on next use and keeps the old results as stale ones
+        (see :meth:`SourceFile.prime_stale`); paths that are gone or under
+        ``prune_dirs`` leave the corpus. A corpus that has not been walked yet
+        is left alone.
+        """
+
+        if self._files is None:
+            return
+        changed = set(paths)
+        files = []
+        replaced: dict[str, SourceFile] = {}
+        for source in self._files:
+            if source.relative_path.as_posix() in changed:
+                source.release()
+                replaced[source.relative_path.as_posix()] = source
+            else:
+                files.append(source)
+        for path in changed:
+            candidate = self.root / path
+            if any(part in self.prune_dirs for part in Path(path).parts[:-1]):
+                continue
+            if candidate.name.endswith(".py") and candidate.is_file():
+                fresh = SourceFile(candidate, Path(path), self)
+                old = replaced.get(path)
+                if old is not None:
+                    for key, result in old.completed().items():
+                        fresh.prime_stale(key, result)
+                files.append(fresh)
+        files.sort(key=lambda source: source.relative_path.as_posix())
+        self._files = files
+
+    def release(self) -> None:
+        """Unmap every mapped file; cached text, ASTs, and results are kept."""
+
+        for source in list(self._open_maps):
+            source.release()
+
+    def _map_opened(self, source: SourceFile) -> None:
+        self._open_maps[source] = None
+        while len(self._open_maps) > _MAX_OPEN_MAPS:
+            oldest = next(iter(self._open_maps))
+            oldest.release()
+
+    def files(self, ignore_dirs: Iterable[str] = ()) -> list[SourceFile]:
+        """Return files sorted by relative path, skipping ``ignore_dirs`` parents."""
+
+        ignored = set(ignore_dirs)
+        if not ignored:
+            return list(self._discover())
+        return [
+            source
+            for source in self._discover()
+            if not any(part in ignored for part in source.relative_path.parts[:-1])
+        ]
+
+    def _discover(self) -> list[SourceFile]:
+        if self._files is not None:
+            return self._files
+
+        walk = walk_python_files(
+            self.root, prune_dirs=self.prune_dirs, gitignore=self.gitignore
+        )
+        self.skipped_dirs = walk.skipped_dirs
+        self.skipped_files = walk.skipped_files
+        LOGGER.info(
+            "Found %s Python files under %s (%s walk); skipped %s dirs, %s files",
+            len(walk.files),
+            self.root,
+            walk.mode,
+            walk.skipped_dirs,
+            walk.skipped_files,
+        )
+        self._files = [
+            SourceFile(self.root / relative, relative, self) for relative in walk.files
+        ]
+        return self._files
+
+
+def resolve_corpus(
+    root: Path, corpus: SourceCorpus | None, prune_dirs: Iterable[str] = ()
+) -> SourceCorpus:
+    """Return ``corpus`` or a fresh one for callers that run a single analyzer.
+
+    A fresh corpus prunes ``prune_dirs`` (usually the analyzer's
+    ``ignore_dirs``) during the walk.
+    """
+
+    return corpus if corpus is not None else SourceCorpus(root, prune_dirs)
+
+
+__all__ = [
+    "FileTask",
+    "FileTaskError",
+    "SourceCorpus",
+    "SourceFile",
+    "resolve_corpus",
+]
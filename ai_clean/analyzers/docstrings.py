@@ -12,19 +12,25 @@ import ast
 from dataclasses import dataclass
 from hashlib import sha1
 from pathlib import Path
-from typing import Iterable
-
+from typing import Sequence
+
+from ai_clean.analyzers.corpus import (
+    FileTask,
+    SourceCorpus,
+    SourceFile,
+    resolve_corpus,
+)
+from ai_clean.analyzers.outline import (
+    Outline,
+    collect_outline,
+    has_module_docstring,
+    outline_rows,
+)
 from ai_clean.config import DocstringAnalyzerConfig
 from ai_clean.models import Finding, FindingLocation
 
 
-@dataclass(frozen=True)
-class _FileEntry:
-    absolute_path: Path
-    relative_path: Path
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _SymbolRecord:
     qualified_name: str
     symbol_name: str
@@ -35,23 +41,25 @@ class _SymbolRecord:
     docstring: str | None
 
 
-def find_docstring_gaps(root: Path, settings: DocstringAnalyzerConfig) -> list[Finding]:
+def find_docstring_gaps(
+    root: Path,
+    settings: DocstringAnalyzerConfig,
+    *,
+    corpus: SourceCorpus | None = None,
+) -> list[Finding]:
     """Return docstring-related findings for the provided root."""
 
-    file_entries = _iter_python_files(root, settings.ignore_dirs)
+    file_entries = _select_files(
+        resolve_corpus(root, corpus, settings.ignore_dirs), settings
+    )
     findings: list[Finding] = []
     for entry in file_entries:
-        source = entry.absolute_path.read_text(encoding="utf-8", errors="ignore")
-        lines = source.splitlines() or [""]
-        try:
-            tree = ast.parse(
-                source, filename=str(entry.relative_path), type_comments=True
-            )
-        except SyntaxError:
+        summary = entry.run(_SYMBOLS_TASK)
+        if summary is None:
             continue
+        line_count, outline = summary
 
-        module_doc = ast.get_docstring(tree, clean=True)
-        if module_doc is None or not module_doc.strip():
+        if not has_module_docstring(outline):
             findings.append(
                 _build_finding(
                     category="missing_docstring",
@@ -66,18 +74,11 @@ def find_docstring_gaps(root: Path, settings: DocstringAnalyzerConfig) -> list[F
                     symbol_name=entry.relative_path.stem,
                     symbol_type="module",
                     docstring_preview="",
-                    lines_of_code=len(lines),
+                    lines_of_code=line_count,
                 )
             )
 
-        collector = _DocstringCollector()
-        collector.visit(tree)
-        records = sorted(
-            collector.results,
-            key=lambda record: (record.start_line, record.qualified_name),
-        )
-
-        for record in records:
+        for record in (_SymbolRecord(*row) for row in outline_rows(outline)):
             if (
                 settings.important_symbols_only
                 and record.lines_of_code < settings.min_symbol_lines
@@ -110,23 +111,61 @@ def find_docstring_gaps(root: Path, settings: DocstringAnalyzerConfig) -> list[F
     return findings
 
 
-def _iter_python_files(root: Path, ignore_dirs: Iterable[str]) -> list[_FileEntry]:
-    if not root.exists():
-        return []
+def _select_files(
+    corpus: SourceCorpus, settings: DocstringAnalyzerConfig
+) -> list[SourceFile]:
+    return corpus.files(settings.ignore_dirs)
+
+
+def _file_tasks(settings: DocstringAnalyzerConfig) -> tuple[FileTask, ...]:
+    return (_SYMBOLS_TASK,)
+
+
+def _collect_symbols(source: SourceFile) -> tuple[int, Outline] | None:
+    stale = source.take_stale(_SYMBOLS_KEY)
+    previous = stale[1] if stale is not None else None
+    outline = collect_outline(source, previous, _symbol_rows, _shift_symbol)
+    if outline is None:
+        return None
+    return max(source.line_count, 1), outline
+
+
+def _symbol_rows(node: ast.stmt) -> list[tuple[object, ...]]:
+    collector = _DocstringCollector()
+    collector.visit(node)
+    records = sorted(
+        collector.results,
+        key=lambda record: (record.start_line, record.qualified_name),
+    )
+    return [
+        (
+            record.qualified_name,
+            record.symbol_name,
+            record.symbol_type,
+            record.start_line,
+            record.end_line,
+            record.lines_of_code,
+            record.docstring,
+        )
+        for record in records
+    ]
+
+
+def _shift_symbol(row: Sequence[object], delta: int) -> tuple[object, ...]:
+    record = _SymbolRecord(*row)
+    return (
+        record.qualified_name,
+        record.symbol_name,
+        record.symbol_type,
+        record.start_line + delta,
+        record.end_line + delta,
+        record.lines_of_code,
+        record.docstring,
+    )
 
-    ignored = set(ignore_dirs)
-    entries: list[_FileEntry] = []
-    for candidate in root.rglob("*.py"):
-        try:
-            relative = candidate.relative_to(root)
-        except ValueError:  # pragma: no cover - defensive
-            continue
-        if any(part in ignored for part in relative.parts[:-1]):
-            continue
-        entries.append(_FileEntry(absolute_path=candidate, relative_path=relative))
 
-    entries.sort(key=lambda entry: entry.relative_path.as_posix())
-    return entries
+_SYMBOLS_KEY = ("docstrings.symbols",)
+_SYMBOLS_TASK = FileTask(key=_SYMBOLS_KEY, collect=_collect_symbols)
 
 
 class _DocstringCollector(ast.NodeVisitor):
@@ -229,12 +268,12 @@ def _build_finding(
     lines_of_code: int,
 ) -> Finding:
     identifier = _doc_identifier(category, relative_path, qualified_name)
-    return Finding(
+    return Finding.trusted(
         id=identifier,
         category=category,
         description=description,
         locations=[
-            FindingLocation(
+            FindingLocation.trusted(
                 path=relative_path,
                 start_line=start_line,
                 end_line=end_line,
@@ -2,82 +2,148 @@
 
 from __future__ import annotations
 
+import io
+import keyword
 import textwrap
-from collections import defaultdict
+import tokenize
+from array import array
+from collections import Counter, defaultdict
 from dataclasses import dataclass
-from hashlib import sha1
+from hashlib import blake2b, sha1
+from itertools import groupby, repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterator, Sequence
 
+from ai_clean.analyzers.corpus import (
+    FileTask,
+    SourceCorpus,
+    SourceFile,
+    resolve_corpus,
+)
+from ai_clean.analyzers.spill import HashSpill
 from ai_clean.config import DuplicateAnalyzerConfig
 from ai_clean.models import Finding, FindingLocation
 
+# Mersenne prime modulus keeps rolling hashes in 61 bits (fits array("Q")).
+_HASH_MODULUS = (1 << 61) - 1
+_HASH_BASE = 1_000_003
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class _Window:
-    normalized_text: str
-    relative_path: Path
+    """One occurrence of a clone; ``file_index`` indexes the scanned sources.
+
+    The normalized text is the key of the group holding the window rather than
+    a field, so each distinct text is stored once however often it recurs.
+    """
+
+    file_index: int
     start_line: int
     end_line: int
+    ordinal: int
 
 
 def find_duplicate_blocks(
-    root: Path, settings: DuplicateAnalyzerConfig
+    root: Path,
+    settings: DuplicateAnalyzerConfig,
+    *,
+    corpus: SourceCorpus | None = None,
 ) -> list[Finding]:
-    """Scan ``root`` for duplicate windows of Python code."""
+    """Scan ``root`` for duplicate windows of Python code.
 
-    file_entries = _iter_python_files(root, settings.ignore_dirs)
-    window_records: list[_Window] = []
-    for absolute_path, relative_path in file_entries:
-        window_records.extend(
-            _build_windows(absolute_path, relative_path, settings.window_size)
-        )
+    Windows are fingerprinted with a rolling hash over per-line hashes, so only
+    ``(hash, file, line)`` triples are held for the whole tree. Normalized text
+    is built only for windows whose hash recurs often enough to matter, and the
+    final grouping uses that text, so hash collisions never merge windows.
 
-    window_records.sort(
-        key=lambda item: (
-            item.normalized_text,
-            item.relative_path.as_posix(),
-            item.start_line,
-        )
-    )
+    With ``max_memory_mb`` set, the triples are spilled to hash-partitioned
+    temporary files instead (see :mod:`ai_clean.analyzers.spill`), and each
+    file's hashes are dropped once spilled. Candidate text is then built one
+    file at a time without memoizing token lines, but the text of every
+    recurring window is still grouped in memory, so the budget bounds hashing
+    and counting rather than peak memory.
+
+    In ``tokens`` mode a window spans ``window_size`` code lines whose tokens
+    are abstracted (identifiers and literals replaced by placeholders), so
+    renamed clones and blank-line or comment differences still match.
+    """
 
+    sources = _select_files(
+        resolve_corpus(root, corpus, settings.ignore_dirs), settings
+    )
+    task = _window_task(settings)
+    candidates = (
+        _spilled_candidates(sources, task, settings)
+        if settings.max_memory_mb
+        else _recurring_windows(sources, task, settings)
+    )
     grouped: dict[str, list[_Window]] = defaultdict(list)
-    for window in window_records:
-        grouped[window.normalized_text].append(window)
+    # Both candidate sources yield each file's windows together.
+    for file_index, windows in groupby(candidates, key=itemgetter(0)):
+        source = sources[file_index]
+        token_lines = _token_lines(source, settings)
+        for _, ordinal in windows:
+            text, window = _make_window(
+                source, file_index, ordinal, settings.window_size, token_lines
+            )
+            grouped[text].append(window)
+    # Sources are sorted by relative path, so file indexes sort like paths.
+    clone_classes = [
+        (normalized_text, sorted(grouped[normalized_text], key=_window_order))
+        for normalized_text in sorted(grouped)
+        if len(grouped[normalized_text]) >= settings.min_occurrences
+    ]
+    del grouped
 
     findings: list[Finding] = []
-    for normalized_text, windows in grouped.items():
-        if len(windows) < settings.min_occurrences:
-            continue
-
-        sorted_windows = sorted(
-            windows,
-            key=lambda entry: (
-                entry.relative_path.as_posix(),
-                entry.start_line,
-            ),
+    regions = _merge_regions(clone_classes, sources, settings)
+    for group_key, sorted_windows, merged_count in regions:
+        first = sorted_windows[0]
+        normalized_text = (
+            group_key
+            if settings.mode == "lines"
+            else _normalize_block(
+                sources[first.file_index].line_slice(
+                    first.start_line - 1, first.end_line
+                )
+            )
         )
         preview = _preview_line(normalized_text)
-        finding_id = f"dup-{sha1(normalized_text.encode('utf-8')).hexdigest()[:8]}"
-        relative_paths = [entry.relative_path.as_posix() for entry in sorted_windows]
+        finding_id = f"dup-{sha1(group_key.encode('utf-8')).hexdigest()[:8]}"
+        relative_paths = [
+            sources[entry.file_index].relative_path.as_posix()
+            for entry in sorted_windows
+        ]
         locations = [
-            FindingLocation(
-                path=entry.relative_path,
+            FindingLocation.trusted(
+                path=sources[entry.file_index].relative_path,
                 start_line=entry.start_line,
                 end_line=entry.end_line,
             )
             for entry in sorted_windows
         ]
-        description = (
-            f"Found {len(sorted_windows)} duplicate windows starting with '{preview}'"
-        )
+        if merged_count == 1:
+            description = (
+                f"Found {len(sorted_windows)} duplicate windows "
+                f"starting with '{preview}'"
+            )
+        else:
+            region_lines = sorted_windows[0].end_line - sorted_windows[0].start_line + 1
+            description = (
+                f"Found {len(sorted_windows)} duplicate {region_lines}-line regions "
+                f"starting with '{preview}'"
+            )
         metadata = {
             "window_size": settings.window_size,
             "normalized_preview": normalized_text,
             "relative_paths": relative_paths,
+            "merged_windows": merged_count,
         }
+        if settings.mode != "lines":
+            metadata["mode"] = settings.mode
         findings.append(
-            Finding(
+            Finding.trusted(
                 id=finding_id,
                 category="duplicate_block",
                 description=description,
@@ -90,60 +156,281 @@ def find_duplicate_blocks(
     return findings
 
 
-def _iter_python_files(
-    root: Path, ignore_dirs: Iterable[str]
-) -> list[tuple[Path, Path]]:
-    if not root.exists():
-        return []
+def _recurring_windows(
+    sources: Sequence[SourceFile], task: FileTask, settings: DuplicateAnalyzerConfig
+) -> Iterator[tuple[int, int]]:
+    """Yield ``(file index, ordinal)`` of windows whose hash recurs, in memory."""
 
-    ignored = {name for name in ignore_dirs}
-    discovered: list[tuple[Path, Path]] = []
-    for candidate in root.rglob("*.py"):
-        try:
-            relative = candidate.relative_to(root)
-        except ValueError:  # pragma: no cover - defensive
-            continue
-        if any(part in ignored for part in relative.parts[:-1]):
-            continue
-        discovered.append((candidate, relative))
+    hashes = array("Q")
+    file_indexes = array("I")
+    ordinals = array("I")
+    for index, source in enumerate(sources):
+        window_hashes, window_ordinals = source.run(task)
+        hashes.extend(window_hashes)
+        ordinals.extend(window_ordinals)
+        file_indexes.extend(repeat(index, len(window_hashes)))
+
+    counts = Counter(hashes)
+    for position, value in enumerate(hashes):
+        if counts[value] >= settings.min_occurrences:
+            yield file_indexes[position], ordinals[position]
+
+
+def _spilled_candidates(
+    sources: Sequence[SourceFile], task: FileTask, settings: DuplicateAnalyzerConfig
+) -> Iterator[tuple[int, int]]:
+    """Yield the same windows as :func:`_recurring_windows` via spill files."""
+
+    with HashSpill(settings.max_memory_mb * 1024 * 1024) as spill:
+        for index, source in enumerate(sources):
+            window_hashes, window_ordinals = source.run_transient(task)
+            spill.add(
+                window_hashes, [index << 32 | ordinal for ordinal in window_ordinals]
+            )
+        payloads = spill.recurring(settings.min_occurrences)
+    # File order keeps each file's windows together when building their text.
+    for payload in sorted(payloads):
+        yield payload >> 32, payload & 0xFFFFFFFF
 
-    discovered.sort(key=lambda item: item[1].as_posix())
-    return discovered
 
+def _window_order(window: _Window) -> tuple[int, int]:
+    return (window.file_index, window.start_line)
 
-def _build_windows(path: Path, relative: Path, window_size: int) -> list[_Window]:
-    contents = path.read_text(encoding="utf-8", errors="ignore")
-    lines = contents.splitlines()
-    if window_size <= 0 or len(lines) < window_size:
-        return []
 
-    windows: list[_Window] = []
-    for start_index in range(0, len(lines) - window_size + 1):
-        block = lines[start_index : start_index + window_size]
-        if _is_comment_only(block):
+def _merge_regions(
+    clone_classes: Sequence[tuple[str, Sequence[_Window]]],
+    sources: Sequence[SourceFile],
+    settings: DuplicateAnalyzerConfig,
+) -> list[tuple[str, list[_Window], int]]:
+    """Extend overlapping clone classes into maximal duplicate regions.
+
+    A class whose occurrences all sit exactly one line (one code line in
+    ``tokens`` mode) below another class's occurrences continues that class's
+    region. Chains are merged into one
+    class spanning the first window's start to the last window's end. Chains
+    whose members' full regions normalize differently (possible only when the
+    overlap is blank) are kept as separate windows. Each result is the region's
+    normalized text, its windows, and the number of windows merged into it.
+    """
+
+    def signature(windows: Sequence[_Window], shift: int) -> tuple:
+        return tuple((window.file_index, window.ordinal + shift) for window in windows)
+
+    by_signature = {
+        signature(windows, 0): (text, windows) for text, windows in clone_classes
+    }
+    regions: list[tuple[str, list[_Window], int]] = []
+    for text, windows in clone_classes:
+        if signature(windows, -1) in by_signature:
             continue
-        normalized = textwrap.dedent("\n".join(block)).rstrip()
-        if not normalized.strip():
+        chain = [(text, windows)]
+        while (successor := by_signature.get(signature(chain[-1][1], 1))) is not None:
+            chain.append(successor)
+        if len(chain) == 1:
+            regions.append((text, list(windows), 1))
             continue
-        windows.append(
-            _Window(
-                normalized_text=normalized,
-                relative_path=relative,
-                start_line=start_index + 1,
-                end_line=start_index + window_size,
+
+        span = chain[-1][1][0].ordinal - windows[0].ordinal + settings.window_size
+        merged = [
+            _make_window(
+                sources[first.file_index],
+                first.file_index,
+                first.ordinal,
+                span,
+                _token_lines(sources[first.file_index], settings),
             )
+            for first in windows
+        ]
+        merged_texts = {merged_text for merged_text, _ in merged}
+        if len(merged_texts) == 1:
+            regions.append((merged[0][0], [window for _, window in merged], len(chain)))
+        else:
+            regions.extend((link_text, list(link), 1) for link_text, link in chain)
+    return regions
+
+
+def _select_files(
+    corpus: SourceCorpus, settings: DuplicateAnalyzerConfig
+) -> list[SourceFile]:
+    return corpus.files(settings.ignore_dirs)
+
+
+def _file_tasks(settings: DuplicateAnalyzerConfig) -> tuple[FileTask, ...]:
+    # Spilling keeps window hashes out of memory, so they are not precomputed.
+    if settings.max_memory_mb:
+        return ()
+    return (_window_task(settings),)
+
+
+def _window_task(settings: DuplicateAnalyzerConfig) -> FileTask:
+    return FileTask(
+        key=("duplicate.window_hashes", settings.window_size, settings.mode),
+        collect=_collect_window_hashes,
+        args=(settings.window_size, settings.mode),
+    )
+
+
+def _collect_window_hashes(
+    source: SourceFile, window_size: int, mode: str = "lines"
+) -> tuple[list[int], list[int]]:
+    if mode == "tokens":
+        keys = [key for _, key in source.run(_TOKEN_LINES_TASK)]
+        return _hash_windows(keys, [True] * len(keys), window_size)
+    keys = [line.strip() for line in source.lines]
+    code = [bool(key) and not key.startswith("#") for key in keys]
+    return _hash_windows(keys, code, window_size)
+
+
+def _hash_windows(
+    keys: Sequence[str], code: Sequence[bool], window_size: int
+) -> tuple[list[int], list[int]]:
+    """Return rolling hashes and 0-based ordinals of candidate windows.
+
+    ``keys`` holds one comparison key per unit (a stripped line, or a line of
+    abstracted tokens). Equal normalized windows always have equal keys, so
+    they always share a hash; the converse is checked against real text by the
+    caller. Windows without any ``code`` unit (blank or comment-only) are
+    skipped.
+    """
+
+    if window_size <= 0 or len(keys) < window_size:
+        return [], []
+
+    line_hashes = [_line_hash(key) for key in keys]
+    code_prefix = [0]
+    for is_code in code:
+        code_prefix.append(code_prefix[-1] + is_code)
+
+    leading_power = pow(_HASH_BASE, window_size - 1, _HASH_MODULUS)
+    rolling = 0
+    for value in line_hashes[:window_size]:
+        rolling = (rolling * _HASH_BASE + value) % _HASH_MODULUS
+
+    hashes: list[int] = []
+    ordinals: list[int] = []
+    last_start = len(keys) - window_size
+    for start_index in range(last_start + 1):
+        if code_prefix[start_index + window_size] > code_prefix[start_index]:
+            hashes.append(rolling)
+            ordinals.append(start_index)
+        if start_index < last_start:
+            rolling = (
+                (rolling - line_hashes[start_index] * leading_power) * _HASH_BASE
+                + line_hashes[start_index + window_size]
+            ) % _HASH_MODULUS
+    return hashes, ordinals
+
+
+def _token_lines(
+    source: SourceFile, settings: DuplicateAnalyzerConfig
+) -> list[tuple[int, str]] | None:
+    """Return ``source``'s token lines in ``tokens`` mode, else ``None``.
+
+    When spilling they are computed without being memoized on the file.
+    """
+
+    if settings.mode != "tokens":
+        return None
+    if settings.max_memory_mb:
+        return source.run_transient(_TOKEN_LINES_TASK)
+    return source.run(_TOKEN_LINES_TASK)
+
+
+def _make_window(
+    source: SourceFile,
+    file_index: int,
+    ordinal: int,
+    length: int,
+    token_lines: Sequence[tuple[int, str]] | None = None,
+) -> tuple[str, _Window]:
+    """Return the normalized text and window of ``length`` units at ``ordinal``.
+
+    The text is the window's grouping key: dedented source in ``lines`` mode
+    and the abstracted ``token_lines`` (see :func:`_token_lines`) in
+    ``tokens`` mode.
+    """
+
+    if token_lines is not None:
+        units = token_lines[ordinal : ordinal + length]
+        return "\n".join(key for _, key in units), _Window(
+            file_index, units[0][0], units[-1][0], ordinal
         )
-    return windows
+    return _normalize_block(source.line_slice(ordinal, ordinal + length)), _Window(
+        file_index, ordinal + 1, ordinal + length, ordinal
+    )
 
 
-def _is_comment_only(lines: Sequence[str]) -> bool:
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if not stripped.startswith("#"):
-            return False
-    return True
+def _collect_token_lines(source: SourceFile) -> list[tuple[int, str]]:
+    """Return ``(line number, abstracted tokens)`` for every code line.
+
+    Identifiers become ``_``, numbers ``0`` and strings ``""``; keywords and
+    operators are kept. Comments, blank lines and indentation are dropped, and
+    multi-line tokens count toward the line they start on. Files that do not
+    tokenize fall back to their stripped non-comment lines.
+    """
+
+    per_line: dict[int, list[str]] = defaultdict(list)
+    fstring_depth = 0
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(source.text).readline):
+            kind = token.type
+            if fstring_depth:
+                if kind == _FSTRING_START:
+                    fstring_depth += 1
+                elif kind == _FSTRING_END:
+                    fstring_depth -= 1
+                continue
+            if kind in _SKIPPED_TOKENS:
+                continue
+            if kind == _FSTRING_START:
+                fstring_depth = 1
+                per_line[token.start[0]].append('""')
+            elif kind == tokenize.NAME:
+                text = token.string
+                per_line[token.start[0]].append(
+                    text if keyword.iskeyword(text) else "_"
+                )
+            elif kind == tokenize.NUMBER:
+                per_line[token.start[0]].append("0")
+            elif kind == tokenize.STRING:
+                per_line[token.start[0]].append('""')
+            else:
+                per_line[token.start[0]].append(token.string)
+    except (tokenize.TokenError, SyntaxError):
+        return [
+            (number, stripped)
+            for number, line in enumerate(source.lines, start=1)
+            if (stripped := line.strip()) and not stripped.startswith("#")
+        ]
+    return [(number, " ".join(parts)) for number, parts in sorted(per_line.items())]
+
+
+_TOKEN_LINES_TASK = FileTask(
+    key=("duplicate.token_lines",), collect=_collect_token_lines
+)
+_SKIPPED_TOKENS = frozenset(
+    {
+        tokenize.COMMENT,
+        tokenize.NL,
+        tokenize.NEWLINE,
+        tokenize.INDENT,
+        tokenize.DEDENT,
+        tokenize.ENCODING,
+        tokenize.ENDMARKER,
+    }
+)
+# Python 3.12+ splits f-strings into several tokens; treat each as one literal.
+_FSTRING_START = getattr(tokenize, "FSTRING_START", -1)
+_FSTRING_END = getattr(tokenize, "FSTRING_END", -1)
+
+
+def _line_hash(stripped: str) -> int:
+    digest = blake2b(stripped.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % _HASH_MODULUS
+
+
+def _normalize_block(block: Sequence[str]) -> str:
+    return textwrap.dedent("\n".join(block)).rstrip()
 
 
 def _preview_line(normalized_text: str) -> str:
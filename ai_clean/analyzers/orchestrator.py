@@ -4,23 +4,155 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any, Callable, Sequence
+from typing import Any, Callable, Collection, Iterator, Sequence
 
+from ai_clean.analyzers import docstrings, duplicate, organize, structure
+from ai_clean.analyzers.cache import AnalysisCache, default_cache_path
+from ai_clean.analyzers.corpus import FileTask, SourceCorpus, SourceFile
 from ai_clean.analyzers.docstrings import find_docstring_gaps
 from ai_clean.analyzers.duplicate import find_duplicate_blocks
 from ai_clean.analyzers.organize import propose_organize_groups
+from ai_clean.analyzers.parallel import run_file_tasks
+from ai_clean.analyzers.stats import AnalyzerStats, StatsMeter
 from ai_clean.analyzers.structure import find_structure_issues
-from ai_clean.config import load_config
+from ai_clean.config import AiCleanConfig, load_config
+from ai_clean.metadata import resolve_metadata_paths
 from ai_clean.models import Finding, FindingLocation
 
 LOGGER = logging.getLogger(__name__)
 
 
-AnalyzerFn = Callable[[Path, object], Sequence[Finding]]
+AnalyzerFn = Callable[..., Sequence[Finding]]
+FileSelector = Callable[[SourceCorpus, Any], Sequence[SourceFile]]
+TaskFactory = Callable[[Any], Sequence[FileTask]]
 
+_FILE_WORK: dict[str, tuple[FileSelector, TaskFactory]] = {
+    "duplicate": (duplicate._select_files, duplicate._file_tasks),
+    "structure": (structure._select_files, structure._file_tasks),
+    "docstrings": (docstrings._select_files, docstrings._file_tasks),
+    "organize": (organize._select_files, organize._file_tasks),
+}
+# Analyzers whose findings relate several files; they always see the whole
+# tree so changed files are still compared against unchanged ones.
+_CROSS_FILE_ANALYZERS = frozenset({"duplicate", "organize"})
 
-def analyze_repo(root: Path, config_path: Path | None = None) -> list[Finding]:
-    """Run all analyzers for ``root`` and return a deduplicated finding list."""
+
+def prepare_corpus(
+    root: Path,
+    analyzers: Sequence[tuple[str, object]],
+    jobs: int = 1,
+    cache: AnalysisCache | None = None,
+    scope: Collection[str] | None = None,
+    corpus: SourceCorpus | None = None,
+) -> SourceCorpus:
+    """Return a corpus for ``root`` with per-file work for ``analyzers`` done.
+
+    ``analyzers`` pairs analyzer names (``duplicate``, ``structure``,
+    ``docstrings``, ``organize``) with their settings. Results for unchanged
+    files come from ``cache`` when given. With ``jobs > 1`` the remaining
+    per-file tasks run in a process pool; otherwise they run lazily when the
+    analyzers ask for them. Call ``cache.save(corpus)`` once the analyzers have
+    run to persist fresh results. With ``scope``, per-file analyzers only do
+    work for those relative paths (see :func:`scope_corpus`). Passing an
+    existing ``corpus`` reuses its reads, ASTs, and task results; a fresh one
+    prunes the directories every analyzer ignores (see
+    :func:`shared_ignore_dirs`).
+    """
+
+    if corpus is None:
+        corpus = SourceCorpus(root, shared_ignore_dirs(analyzers))
+    if jobs <= 1 and cache is None:
+        return corpus
+
+    assignments = []
+    for name, settings in analyzers:
+        select_files, file_tasks = _FILE_WORK[name]
+        view = scope_corpus(corpus, name, scope)
+        try:
+            assignments.append((select_files(view, settings), file_tasks(settings)))
+        except Exception:  # the analyzer reports this when it runs
+            continue
+    if cache is not None:
+        cache.prime(corpus, assignments)
+    run_file_tasks(corpus, assignments, jobs)
+    return corpus
+
+
+def shared_ignore_dirs(analyzers: Sequence[tuple[str, object]]) -> frozenset[str]:
+    """Return the ``ignore_dirs`` names common to every analyzer's settings.
+
+    Only these can be pruned from the shared walk; a directory ignored by
+    some analyzers is still walked and filtered per analyzer.
+    """
+
+    shared: frozenset[str] | None = None
+    for _, settings in analyzers:
+        names = frozenset(getattr(settings, "ignore_dirs", ()))
+        shared = names if shared is None else shared & names
+    return shared or frozenset()
+
+
+def scope_corpus(
+    corpus: SourceCorpus, name: str, scope: Collection[str] | None
+) -> SourceCorpus:
+    """Return the corpus analyzer ``name`` should see for ``scope``.
+
+    Per-file analyzers only see the scoped files. Cross-file analyzers keep
+    the whole corpus; unchanged files are then served from the analysis cache
+    when it is enabled.
+    """
+
+    if scope is None or name in _CROSS_FILE_ANALYZERS:
+        return corpus
+    return corpus.subset(scope)
+
+
+def _count_selected(name: str, corpus: SourceCorpus, settings: object) -> int:
+    select_files, _ = _FILE_WORK[name]
+    try:
+        return len(select_files(corpus, settings))
+    except Exception:  # already reported by the analyzer itself
+        return 0
+
+
+def open_analysis_cache(root: Path, config: AiCleanConfig) -> AnalysisCache:
+    """Return the analysis cache stored under the metadata root for ``root``."""
+
+    metadata_root, _, _, _ = resolve_metadata_paths(root, config)
+    return AnalysisCache(default_cache_path(metadata_root))
+
+
+def iter_findings(
+    root: Path,
+    config_path: Path | None = None,
+    *,
+    jobs: int | None = None,
+    use_cache: bool = True,
+    errors: list[dict[str, str]] | None = None,
+    changed_files: Collection[str] | None = None,
+    stats: list[AnalyzerStats] | None = None,
+    trace_memory: bool = False,
+    corpus: SourceCorpus | None = None,
+) -> Iterator[Finding]:
+    """Yield findings analyzer by analyzer, as soon as each analyzer finishes.
+
+    Findings from one analyzer are merged by ID and sorted by
+    ``(category, id)`` before they are yielded; nothing is held across
+    analyzers. Failed analyzers are logged and appended to ``errors`` as
+    ``{"analyzer": ..., "error": ...}`` instead of stopping the run. The
+    analysis cache is saved once the last analyzer has run.
+
+    ``changed_files`` (POSIX paths relative to ``root``) limits the run to
+    findings that touch those files: per-file analyzers only scan them, and
+    cross-file analyzers compare them against the rest of the tree.
+
+    When ``stats`` is given, an :class:`AnalyzerStats` record is appended for
+    the ``prepare`` stage (walk, cache lookup, process pool) and for each
+    analyzer that succeeds; ``trace_memory`` adds ``tracemalloc`` peaks.
+
+    ``corpus`` lets a long-lived caller (see :mod:`ai_clean.daemon`) keep file
+    contents, ASTs, and per-file results warm between runs.
+    """
 
     root = root.resolve()
     config = load_config(config_path)
@@ -30,20 +162,103 @@ def analyze_repo(root: Path, config_path: Path | None = None) -> list[Finding]:
         ("docstrings", find_docstring_gaps, config.analyzers.docstring),
         ("organize", propose_organize_groups, config.analyzers.organize),
     ]
+    scope = frozenset(changed_files) if changed_files is not None else None
+    cache = open_analysis_cache(root, config) if use_cache else None
+    meter = StatsMeter(trace_memory) if stats is not None else None
+    try:
+        if meter is not None:
+            meter.start()
+        corpus = prepare_corpus(
+            root,
+            [(name, settings) for name, _, settings in analyzers],
+            jobs=config.analyzers.jobs if jobs is None else jobs,
+            cache=cache,
+            scope=scope,
+            corpus=corpus,
+        )
+        if meter is not None and stats is not None:
+            stats.append(
+                meter.stop(corpus, "prepare", files_scanned=len(corpus.files()))
+            )
+
+        for name, func, settings in analyzers:
+            view = scope_corpus(corpus, name, scope)
+            if meter is not None:
+                meter.start(corpus)
+            try:
+                new_findings = func(root, settings, corpus=view)
+            except (
+                Exception
+            ) as exc:  # pragma: no cover - exercised via CLI/orchestrator tests
+                message = f"{name} analyzer failed: {exc}"
+                LOGGER.warning(message)
+                if errors is not None:
+                    errors.append({"analyzer": name, "error": str(exc)})
+                continue
+            if scope is not None and name in _CROSS_FILE_ANALYZERS:
+                new_findings = [
+                    finding
+                    for finding in new_findings
+                    if any(loc.path.as_posix() in scope for loc in finding.locations)
+                ]
+            batch: dict[str, Finding] = {}
+            _merge_findings(batch, new_findings)
+            if meter is not None and stats is not None:
+                stats.append(
+                    meter.stop(
+                        corpus,
+                        name,
+                        files_scanned=_count_selected(name, view, settings),
+                        findings=len(batch),
+                    )
+                )
+            yield from sorted(batch.values(), key=lambda item: (item.category, item.id))
+    finally:
+        if meter is not None:
+            meter.close()
+
+    if cache is not None:
+        cache.save(corpus)
+    corpus.release()
+
+
+def analyze_repo(
+    root: Path,
+    config_path: Path | None = None,
+    *,
+    jobs: int | None = None,
+    use_cache: bool = True,
+    changed_files: Collection[str] | None = None,
+    stats: list[AnalyzerStats] | None = None,
+    trace_memory: bool = False,
+    corpus: SourceCorpus | None = None,
+) -> list[Finding]:
+    """Run all analyzers for ``root`` and return a deduplicated finding list.
+
+    Every analyzer shares one :class:`SourceCorpus`, so the tree is walked once
+    and each file is read and parsed at most once per run. ``jobs`` overrides
+    ``[analyzers] jobs``; values above 1 spread per-file work across processes
+    without changing the findings. With ``use_cache`` per-file results are
+    reused from, and written back to, the analysis cache under the metadata
+    root, so only changed files are re-analyzed. ``changed_files`` scopes the
+    run, ``stats``/``trace_memory`` collect per-analyzer costs, and ``corpus``
+    reuses a warm corpus, as described in :func:`iter_findings`.
+    """
 
     findings_by_id: dict[str, Finding] = {}
     errors: list[dict[str, str]] = []
-    for name, func, settings in analyzers:
-        try:
-            new_findings = func(root, settings)
-        except (
-            Exception
-        ) as exc:  # pragma: no cover - exercised via CLI/orchestrator tests
-            message = f"{name} analyzer failed: {exc}"
-            LOGGER.warning(message)
-            errors.append({"analyzer": name, "error": str(exc)})
-            continue
-        _merge_findings(findings_by_id, new_findings)
+    for finding in iter_findings(
+        root,
+        config_path,
+        jobs=jobs,
+        use_cache=use_cache,
+        errors=errors,
+        changed_files=changed_files,
+        stats=stats,
+        trace_memory=trace_memory,
+        corpus=corpus,
+    ):
+        _merge_findings(findings_by_id, [finding])
 
     findings = sorted(
         findings_by_id.values(), key=lambda item: (item.category, item.id)
@@ -124,4 +339,11 @@ def _annotate_errors(
     ]
 
 
-__all__ = ["analyze_repo", "_merge_findings"]
+__all__ = [
+    "analyze_repo",
+    "iter_findings",
+    "open_analysis_cache",
+    "prepare_corpus",
+    "scope_corpus",
+    "_merge_findings",
+]
@@ -11,10 +11,14 @@ from __future__ import annotations
 import ast
 import re
 from collections import Counter, defaultdict
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
 
+from ai_clean.analyzers.corpus import (
+    FileTask,
+    SourceCorpus,
+    SourceFile,
+    resolve_corpus,
+)
 from ai_clean.config import OrganizeAnalyzerConfig
 from ai_clean.models import Finding, FindingLocation
 
@@ -38,21 +42,20 @@ _STABLE_DIRECTORIES = {"tests", "migrations"}
 _TOKEN_PATTERN = re.compile(r"[^a-zA-Z0-9]+")
 
 
-@dataclass(frozen=True)
-class _FileEntry:
-    absolute_path: Path
-    relative_path: Path
-
-
 def propose_organize_groups(
-    root: Path, settings: OrganizeAnalyzerConfig
+    root: Path,
+    settings: OrganizeAnalyzerConfig,
+    *,
+    corpus: SourceCorpus | None = None,
 ) -> list[Finding]:
     """Emit organize candidates based on shared topics."""
 
-    entries = _iter_python_files(root, settings.ignore_dirs)
+    entries = _select_files(
+        resolve_corpus(root, corpus, settings.ignore_dirs), settings
+    )
     topic_members: dict[str, list[Path]] = defaultdict(list)
     for entry in entries:
-        topic = _infer_topic(entry.absolute_path, entry.relative_path)
+        topic = entry.run(_TOPIC_TASK)
         if topic is None:
             continue
         topic_members[topic].append(entry.relative_path)
@@ -80,7 +83,7 @@ def propose_organize_groups(
         finding_id = f"organize-{topic}-{index:02d}"
         description = f'Consider regrouping {len(available)} files under "{topic}/"'
         locations = [
-            FindingLocation(path=member, start_line=1, end_line=1)
+            FindingLocation.trusted(path=member, start_line=1, end_line=1)
             for member in available
         ]
         metadata = {
@@ -89,7 +92,7 @@ def propose_organize_groups(
             "files": [member.as_posix() for member in available],
         }
         findings.append(
-            Finding(
+            Finding.trusted(
                 id=finding_id,
                 category="organize_candidate",
                 description=description,
@@ -103,39 +106,32 @@ def propose_organize_groups(
     return findings
 
 
-def _iter_python_files(root: Path, ignore_dirs: Iterable[str]) -> list[_FileEntry]:
-    if not root.exists():
-        return []
+def _select_files(
+    corpus: SourceCorpus, settings: OrganizeAnalyzerConfig
+) -> list[SourceFile]:
+    return [
+        entry
+        for entry in corpus.files(settings.ignore_dirs)
+        if not (
+            entry.relative_path.parts
+            and entry.relative_path.parts[0] in _STABLE_DIRECTORIES
+        )
+    ]
 
-    ignored = set(ignore_dirs)
-    entries: list[_FileEntry] = []
-    for candidate in root.rglob("*.py"):
-        try:
-            relative = candidate.relative_to(root)
-        except ValueError:  # pragma: no cover - defensive
-            continue
-        if any(part in ignored for part in relative.parts[:-1]):
-            continue
-        if relative.parts and relative.parts[0] in _STABLE_DIRECTORIES:
-            continue
-        entries.append(_FileEntry(absolute_path=candidate, relative_path=relative))
 
-    entries.sort(key=lambda entry: entry.relative_path.as_posix())
-    return entries
+def _file_tasks(settings: OrganizeAnalyzerConfig) -> tuple[FileTask, ...]:
+    return (_TOPIC_TASK,)
 
 
-def _infer_topic(absolute_path: Path, relative_path: Path) -> str | None:
+def _infer_topic(entry: SourceFile) -> str | None:
     try:
-        source = absolute_path.read_text(encoding="utf-8", errors="ignore")
+        tree = entry.tree
     except OSError:  # pragma: no cover - filesystem issues
         return None
-
-    try:
-        tree = ast.parse(source, filename=str(relative_path), type_comments=True)
-    except SyntaxError:
+    if tree is None:
         return None
 
-    filename_tokens = _tokenize(relative_path.stem)
+    filename_tokens = _tokenize(entry.relative_path.stem)
     import_tokens = _collect_import_tokens(tree)
     doc_tokens = _tokenize(ast.get_docstring(tree, clean=True) or "")
 
@@ -159,6 +155,9 @@ def _infer_topic(absolute_path: Path, relative_path: Path) -> str | None:
     return best_tokens[0]
 
 
+_TOPIC_TASK = FileTask(key=("organize.topic",), collect=_infer_topic)
+
+
 def _collect_import_tokens(tree: ast.AST) -> set[str]:
     if not isinstance(tree, ast.Module):
         return set()
@@ -0,0 +1,227 @@
+"""Per-statement outlines that let symbol collectors reuse unchanged work.
+
+A collector such as the structure analyzer's function spans or the docstring
+analyzer's symbol records produces rows per top-level statement. Storing those
+rows per statement, together with a fingerprint of the statement's source
+(its qualified name plus the text of its line span), turns a full re-walk of
+an edited module into a local one: statements at the start of the file whose
+text is unchanged are reused in place, statements at the end are reused with
+their line numbers shifted, and only the changed region in between is parsed
+and collected again.
+
+An outline is plain data so the analysis cache can persist it and worker
+processes can return it: ``(line_count, segments)`` with each segment being
+``(start_line, end_line, fingerprint, leading_docstring, rows)``;
+``leading_docstring`` is ``None`` for the lines after the last statement.
+Collectors pass in the previous outline of a changed file, which reaches them
+as a stale task result (see :meth:`SourceFile.take_stale`). Whenever the
+changed region does not parse on its own, the whole file is parsed as before,
+so results always match a full analysis.
+"""
+
+from __future__ import annotations
+
+import ast
+from hashlib import sha1
+from typing import Any, Callable, Sequence
+
+from ai_clean.analyzers.corpus import SourceFile
+
+Row = Any
+Segment = tuple[int, int, str, bool | None, list[Row]]
+Outline = tuple[int, list[Segment]]
+RowCollector = Callable[[ast.stmt], list[Row]]
+RowShifter = Callable[[Row, int], Row]
+
+
+def collect_outline(
+    source: SourceFile,
+    previous: Outline | None,
+    collect_rows: RowCollector,
+    shift_row: RowShifter,
+) -> Outline | None:
+    """Return ``source``'s outline, updating ``previous`` when given.
+
+    ``previous`` is the outline of an earlier version of the file.
+    ``collect_rows`` returns the rows for one top-level statement, and
+    ``shift_row`` moves one row by a number of lines. Returns ``None`` when
+    the file has a syntax error.
+    """
+
+    # Split like the tokenizer, so AST line numbers index this list.
+    lines = source.text.split("\n")
+    if previous is not None:
+        updated = _update(lines, previous, collect_rows, shift_row)
+        if updated is not None:
+            return updated
+    tree = source.tree
+    if tree is None:
+        return None
+    return len(lines), _segments(lines, tree.body, collect_rows, 1, len(lines))
+
+
+def outline_rows(outline: Outline) -> list[Row]:
+    """Return every row of ``outline`` in source order."""
+
+    return [row for segment in outline[1] for row in segment[4]]
+
+
+def has_module_docstring(outline: Outline) -> bool:
+    """Return whether the module starts with a non-blank docstring."""
+
+    for segment in outline[1]:
+        if segment[3] is not None:
+            return segment[3]
+    return False
+
+
+def _segments(
+    lines: Sequence[str],
+    body: Sequence[ast.stmt],
+    collect_rows: RowCollector,
+    first: int,
+    last: int,
+) -> list[Segment]:
+    """Cover lines ``first`` to ``last`` with segments for ``body``.
+
+    Each segment spans the blank and comment lines before its statement, and
+    a final statement-less segment covers what follows the last one, so the
+    fingerprints together cover every line. Statements that share a line
+    share a segment.
+    """
+
+    segments: list[Segment] = []
+    spans: list[tuple[int, int, str, bool | None, list[Row]]] = []
+    previous_end = first - 1
+    for node in body:
+        end = node.end_lineno or node.lineno
+        if spans and node.lineno <= spans[-1][1]:
+            start, _, name, docstring, rows = spans[-1]
+            spans[-1] = (start, max(end, spans[-1][1]), name, docstring, rows)
+            rows.extend(collect_rows(node))
+        else:
+            spans.append(
+                (
+                    previous_end + 1,
+                    end,
+                    getattr(node, "name", ""),
+                    _is_docstring(node),
+                    collect_rows(node),
+                )
+            )
+        previous_end = spans[-1][1]
+    spans.append((previous_end + 1, last, "", None, []))
+    for start, end, name, docstring, rows in spans:
+        segments.append(
+            (start, end, _fingerprint(lines, start, end, name), docstring, rows)
+        )
+    return segments
+
+
+def _update(
+    lines: Sequence[str],
+    previous: Outline,
+    collect_rows: RowCollector,
+    shift_row: RowShifter,
+) -> Outline | None:
+    old_count, old_segments = previous
+    delta = len(lines) - old_count
+    count = len(old_segments)
+
+    head = 0
+    while head < count and _unchanged(lines, old_segments[head], 0):
+        head += 1
+    if head == count and delta == 0:
+        return previous
+    region_start = old_segments[head - 1][1] + 1 if head else 1
+
+    tail = count
+    while tail > head:
+        segment = old_segments[tail - 1]
+        if segment[0] + delta < region_start or not _unchanged(lines, segment, delta):
+            break
+        tail -= 1
+    region_end = old_segments[tail][0] + delta - 1 if tail < count else len(lines)
+
+    try:
+        module = ast.parse(
+            "\n".join(lines[region_start - 1 : region_end]), type_comments=True
+        )
+    except (SyntaxError, ValueError):
+        return None
+    ast.increment_lineno(module, region_start - 1)
+
+    segments = list(old_segments[:head])
+    segments.extend(
+        _segments(lines, module.body, collect_rows, region_start, region_end)
+    )
+    segments.extend(
+        (
+            start + delta,
+            end + delta,
+            fingerprint,
+            docstring,
+            [shift_row(row, delta) for row in rows] if delta else rows,
+        )
+        for start, end, fingerprint, docstring, rows in old_segments[tail:]
+    )
+    return len(lines), _fold_gaps(lines, segments)
+
+
+def _fold_gaps(lines: Sequence[str], segments: list[Segment]) -> list[Segment]:
+    """Fold inner statement-less segments into the segment after them.
+
+    A full parse only ends with such a segment; the lines between two
+    statements belong to the second one. Folding the region's trailing lines
+    the same way keeps an updated outline identical to a fresh one.
+    """
+
+    folded: list[Segment] = []
+    gap_start: int | None = None
+    for index, segment in enumerate(segments):
+        last = index == len(segments) - 1
+        if segment[3] is None and not last:
+            if gap_start is None:
+                gap_start = segment[0]
+            continue
+        if gap_start is not None and gap_start < segment[0]:
+            _, end, fingerprint, docstring, rows = segment
+            name = fingerprint.partition(":")[0]
+            segment = (
+                gap_start,
+                end,
+                _fingerprint(lines, gap_start, end, name),
+                docstring,
+                rows,
+            )
+        gap_start = None
+        folded.append(segment)
+    return folded
+
+
+def _unchanged(lines: Sequence[str], segment: Segment, delta: int) -> bool:
+    start, end, fingerprint = segment[0] + delta, segment[1] + delta, segment[2]
+    if start < 1 or end > len(lines) or start > end + 1:
+        return False
+    name = fingerprint.partition(":")[0]
+    return _fingerprint(lines, start, end, name) == fingerprint
+
+
+def _fingerprint(lines: Sequence[str], start: int, end: int, name: str) -> str:
+    digest = sha1(name.encode("utf-8"))
+    for line in lines[start - 1 : end]:
+        digest.update(b"\n")
+        digest.update(line.encode("utf-8"))
+    return f"{name}:{digest.hexdigest()[:16]}"
+
+
+def _is_docstring(node: ast.stmt) -> bool:
+    return (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, str)
+        and bool(node.value.value.strip())
+    )
+
+
+__all__ = ["Outline", "collect_outline", "has_module_docstring", "outline_rows"]
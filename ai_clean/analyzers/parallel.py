@@ -0,0 +1,128 @@
+"""Process-pool execution of per-file analyzer tasks.
+
+Workers compute :class:`~ai_clean.analyzers.corpus.FileTask` results for
+chunks of files and send them back as plain data. The parent primes each
+:class:`~ai_clean.analyzers.corpus.SourceFile` memo with those results, so the
+analyzers aggregate findings exactly as they would in a serial run.
+"""
+
+from __future__ import annotations
+
+import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Hashable, Iterable, Sequence
+
+from ai_clean.analyzers.corpus import FileTask, SourceCorpus, SourceFile
+
+LOGGER = logging.getLogger(__name__)
+
+_CHUNKS_PER_WORKER = 4
+
+# (relative posix path, tasks to run, stale results by key) for one file.
+_WorkItem = tuple[str, tuple[FileTask, ...], dict[Hashable, Any]]
+# (task key, succeeded, result or error message) for one task.
+_TaskOutcome = tuple[Hashable, bool, Any]
+
+
+def run_file_tasks(
+    corpus: SourceCorpus,
+    assignments: Iterable[tuple[Sequence[SourceFile], Sequence[FileTask]]],
+    jobs: int,
+) -> None:
+    """Compute ``assignments`` across ``jobs`` processes and prime ``corpus``.
+
+    Each assignment pairs the files an analyzer will visit with the tasks it
+    runs on them. Tasks shared by several analyzers are computed once. When
+    ``jobs`` is 1 or the pool cannot be used, nothing is primed and the
+    analyzers compute their results in-process as usual.
+    """
+
+    if jobs <= 1:
+        return
+    plan = _plan_work(assignments)
+    if len(plan) < 2:
+        return
+
+    by_path = {source.relative_path.as_posix(): source for source in corpus.files()}
+    items: list[_WorkItem] = [
+        (path, tuple(tasks.values()), _stale_for(by_path[path], tasks))
+        for path, tasks in plan.items()
+    ]
+    chunks = _chunk(items, jobs * _CHUNKS_PER_WORKER)
+    root = str(corpus.root)
+    try:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+            futures = [pool.submit(_run_chunk, root, chunk) for chunk in chunks]
+            outcomes = [future.result() for future in futures]
+    except (BrokenProcessPool, OSError, pickle.PicklingError) as exc:
+        LOGGER.warning("Parallel analysis unavailable, running serially: %s", exc)
+        return
+
+    for chunk_outcomes in outcomes:
+        for path, digest, results in chunk_outcomes:
+            source = by_path[path]
+            if digest is not None:
+                source.prime_content_hash(digest)
+            for key, succeeded, value in results:
+                source.take_stale(key)
+                if succeeded:
+                    source.prime(key, value)
+                else:
+                    source.prime_failure(key, value)
+
+
+def _plan_work(
+    assignments: Iterable[tuple[Sequence[SourceFile], Sequence[FileTask]]],
+) -> dict[str, dict[Hashable, FileTask]]:
+    plan: dict[str, dict[Hashable, FileTask]] = {}
+    for files, tasks in assignments:
+        for source in files:
+            pending = plan.setdefault(source.relative_path.as_posix(), {})
+            for task in tasks:
+                if not source.has_result(task.key):
+                    pending.setdefault(task.key, task)
+            if not pending:
+                del plan[source.relative_path.as_posix()]
+    return dict(sorted(plan.items()))
+
+
+def _stale_for(
+    source: SourceFile, tasks: dict[Hashable, FileTask]
+) -> dict[Hashable, Any]:
+    stale = source.stale_results()
+    return {key: stale[key] for key in tasks if key in stale}
+
+
+def _chunk(items: list[_WorkItem], count: int) -> list[list[_WorkItem]]:
+    size = max(1, -(-len(items) // count))
+    return [items[index : index + size] for index in range(0, len(items), size)]
+
+
+def _run_chunk(
+    root: str, chunk: list[_WorkItem]
+) -> list[tuple[str, str | None, list[_TaskOutcome]]]:
+    base = Path(root)
+    output: list[tuple[str, str | None, list[_TaskOutcome]]] = []
+    for path, tasks, stale in chunk:
+        source = SourceFile(base / path, Path(path))
+        for key, result in stale.items():
+            source.prime_stale(key, result)
+        results: list[_TaskOutcome] = []
+        for task in tasks:
+            try:
+                results.append((task.key, True, source.run(task)))
+            except Exception as exc:  # reported by the analyzer that runs it
+                results.append((task.key, False, str(exc)))
+        try:
+            digest: str | None = source.content_hash
+        except OSError:
+            digest = None
+        source.release()
+        output.append((path, digest, results))
+    return output
+
+
+__all__ = ["run_file_tasks"]
@@ -0,0 +1,193 @@
+"""Hash-partitioned spill files for counting more records than fit in memory.
+
+The duplicate analyzer produces one ``(hash, payload)`` record per candidate
+window. Under a memory budget, :class:`HashSpill` buffers records per
+hash-prefix partition and appends them to temporary files whenever the buffers
+fill. :meth:`HashSpill.recurring` then counts each partition on its own, in
+worker processes when there is enough data to share. A partition too large for
+its share of the budget is split again on the next hash bits, so peak memory
+follows the budget rather than the size of the tree.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import BinaryIO, Sequence
+
+LOGGER = logging.getLogger(__name__)
+
+_HASH_BITS = 61
+_FANOUT_BITS = 6
+_FANOUT = 1 << _FANOUT_BITS
+_MAX_LEVEL = _HASH_BITS // _FANOUT_BITS
+_RECORD_BYTES = 16
+# Counting holds a Counter entry and int objects per record: roughly this many
+# times the record's 16 bytes on disk.
+_COUNT_OVERHEAD = 8
+# Spilled data below this per worker is counted faster in-process.
+_PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+_SPLIT_CHUNK_RECORDS = 1 << 16
+
+
+class HashSpill:
+    """Collect ``(hash, payload)`` records on disk, partitioned by hash prefix.
+
+    ``hash`` values must fit in 61 bits and payloads in 64. Use as a context
+    manager; the temporary files are removed on exit.
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self.budget_bytes = max(budget_bytes, 1024 * 1024)
+        self.records = 0
+        self.spilled_bytes = 0
+        self._directory = TemporaryDirectory(prefix="ai-clean-spill-")
+        self._buffers = [array("Q") for _ in range(_FANOUT)]
+        self._buffered = 0
+        self._buffer_limit = self.budget_bytes // 4 // 8
+
+    def __enter__(self) -> HashSpill:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove the temporary files."""
+
+        self._buffers = [array("Q") for _ in range(_FANOUT)]
+        self._directory.cleanup()
+
+    def add(self, hashes: Sequence[int], payloads: Sequence[int]) -> None:
+        """Record ``payloads[i]`` under ``hashes[i]`` for every ``i``."""
+
+        buffers = self._buffers
+        shift = _HASH_BITS - _FANOUT_BITS
+        for value, payload in zip(hashes, payloads):
+            buffer = buffers[value >> shift]
+            buffer.append(value)
+            buffer.append(payload)
+        self.records += len(hashes)
+        self._buffered += 2 * len(hashes)
+        if self._buffered >= self._buffer_limit:
+            self._flush()
+
+    def recurring(self, min_occurrences: int, jobs: int | None = None) -> array:
+        """Return the payloads whose hash occurs at least ``min_occurrences`` times.
+
+        ``jobs`` caps the worker processes (default: one per CPU); small spills
+        are counted in-process.
+        """
+
+        self._flush()
+        paths = sorted(str(path) for path in Path(self._directory.name).glob("part-*"))
+        workers = min(
+            jobs or os.cpu_count() or 1,
+            len(paths),
+            max(1, self.spilled_bytes // _PARALLEL_MIN_BYTES),
+        )
+        limit = self.budget_bytes // (_COUNT_OVERHEAD * workers)
+        results = array("Q")
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    for chunk in pool.map(
+                        _count_partition,
+                        paths,
+                        [0] * len(paths),
+                        [limit] * len(paths),
+                        [min_occurrences] * len(paths),
+                    ):
+                        results.extend(chunk)
+                return results
+            except (BrokenProcessPool, OSError) as exc:
+                LOGGER.warning(
+                    "Parallel grouping unavailable, running serially: %s", exc
+                )
+                results = array("Q")
+                limit = self.budget_bytes // _COUNT_OVERHEAD
+        for path in paths:
+            results.extend(_count_partition(path, 0, limit, min_occurrences))
+        return results
+
+    def _flush(self) -> None:
+        directory = Path(self._directory.name)
+        for index, buffer in enumerate(self._buffers):
+            if not buffer:
+                continue
+            with (directory / f"part-{index:02x}").open("ab") as handle:
+                buffer.tofile(handle)
+            self.spilled_bytes += len(buffer) * 8
+            self._buffers[index] = array("Q")
+        self._buffered = 0
+
+
+def _count_partition(
+    path: str, level: int, limit_bytes: int, min_occurrences: int
+) -> array:
+    """Return the recurring payloads of one partition file, splitting if needed."""
+
+    size = os.path.getsize(path)
+    if size > limit_bytes and level + 1 < _MAX_LEVEL:
+        results = array("Q")
+        for part in _split(path, level + 1):
+            if os.path.getsize(part) == size:
+                # Every record shares the next prefix too; splitting cannot help.
+                results.extend(_count_partition(part, _MAX_LEVEL, 0, min_occurrences))
+            else:
+                results.extend(
+                    _count_partition(part, level + 1, limit_bytes, min_occurrences)
+                )
+            os.remove(part)
+        return results
+
+    records = array("Q")
+    with open(path, "rb") as handle:
+        records.fromfile(handle, size // 8)
+    hashes = records[0::2]
+    counts = Counter(hashes)
+    recurring = array("Q")
+    for position, value in enumerate(hashes):
+        if counts[value] >= min_occurrences:
+            recurring.append(records[2 * position + 1])
+    return recurring
+
+
+def _split(path: str, level: int) -> list[str]:
+    shift = _HASH_BITS - _FANOUT_BITS * (level + 1)
+    mask = _FANOUT - 1
+    handles: dict[int, BinaryIO] = {}
+    try:
+        with open(path, "rb") as source:
+            remaining = os.path.getsize(path) // _RECORD_BYTES
+            while remaining:
+                count = min(remaining, _SPLIT_CHUNK_RECORDS)
+                chunk = array("Q")
+                chunk.fromfile(source, count * 2)
+                remaining -= count
+                buckets: dict[int, array] = {}
+                for position in range(0, len(chunk), 2):
+                    index = (chunk[position] >> shift) & mask
+                    bucket = buckets.get(index)
+                    if bucket is None:
+                        bucket = buckets[index] = array("Q")
+                    bucket.append(chunk[position])
+                    bucket.append(chunk[position + 1])
+                for index, bucket in buckets.items():
+                    handle = handles.get(index)
+                    if handle is None:
+                        handle = handles[index] = open(f"{path}.{index:02x}", "wb")
+                    bucket.tofile(handle)
+    finally:
+        for handle in handles.values():
+            handle.close()
+    return [f"{path}.{index:02x}" for index in sorted(handles)]
+
+
+__all__ = ["HashSpill"]
@@ -0,0 +1,100 @@
+"""Per-analyzer cost accounting for an analysis run.
+
+:class:`StatsMeter` snapshots the shared corpus counters, wall clock, and CPU
+clock around one stage of :func:`~ai_clean.analyzers.orchestrator.iter_findings`
+and turns the difference into an :class:`AnalyzerStats` record. Peak memory is
+only measured when ``trace_memory`` is set, because ``tracemalloc`` slows
+allocation-heavy analyzers noticeably.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from ai_clean.analyzers.corpus import SourceCorpus
+
+
+@dataclass(frozen=True)
+class AnalyzerStats:
+    """Cost of one analyzer (or the ``prepare`` stage) in a single run.
+
+    ``bytes_read`` and ``asts_parsed`` only count work done in this process;
+    per-file work done by ``--jobs`` workers shows up in the ``prepare``
+    stage's wall time instead. The corpus reads and parses each file once, so
+    both are charged to the first analyzer that touches the file (usually
+    ``duplicate`` and ``structure``); later analyzers reuse them and report 0.
+    """
+
+    analyzer: str
+    wall_seconds: float
+    cpu_seconds: float
+    files_scanned: int
+    bytes_read: int
+    asts_parsed: int
+    findings: int
+    peak_memory_bytes: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly mapping of the stats."""
+
+        return asdict(self)
+
+
+class StatsMeter:
+    """Measure consecutive stages of one run."""
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self._started_tracing = False
+        self._start: tuple[float, float, int, int] = (0.0, 0.0, 0, 0)
+
+    def start(self, corpus: SourceCorpus | None = None) -> None:
+        """Begin measuring a stage; ``corpus`` is ``None`` before it exists."""
+
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+        self._start = (
+            time.perf_counter(),
+            time.process_time(),
+            corpus.bytes_read if corpus is not None else 0,
+            corpus.parses if corpus is not None else 0,
+        )
+
+    def stop(
+        self,
+        corpus: SourceCorpus,
+        analyzer: str,
+        *,
+        files_scanned: int,
+        findings: int = 0,
+    ) -> AnalyzerStats:
+        """Finish the current stage and return its stats."""
+
+        wall, cpu, bytes_read, parses = self._start
+        peak = tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+        return AnalyzerStats(
+            analyzer=analyzer,
+            wall_seconds=time.perf_counter() - wall,
+            cpu_seconds=time.process_time() - cpu,
+            files_scanned=files_scanned,
+            bytes_read=corpus.bytes_read - bytes_read,
+            asts_parsed=corpus.parses - parses,
+            findings=findings,
+            peak_memory_bytes=peak,
+        )
+
+    def close(self) -> None:
+        """Stop ``tracemalloc`` if this meter started it."""
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+__all__ = ["AnalyzerStats", "StatsMeter"]
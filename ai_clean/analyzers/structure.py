@@ -8,23 +8,24 @@ from hashlib import sha1
 from pathlib import Path
 from typing import Iterable
 
+from ai_clean.analyzers.corpus import (
+    FileTask,
+    SourceCorpus,
+    SourceFile,
+    resolve_corpus,
+)
+from ai_clean.analyzers.outline import Outline, collect_outline, outline_rows
 from ai_clean.config import StructureAnalyzerConfig
 from ai_clean.models import Finding, FindingLocation
 
 
-@dataclass(frozen=True)
-class _FileEntry:
-    absolute_path: Path
-    relative_path: Path
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _LargeFileRecord:
     relative_path: Path
     line_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _LongFunctionRecord:
     relative_path: Path
     qualified_name: str
@@ -34,11 +35,16 @@ class _LongFunctionRecord:
 
 
 def find_structure_issues(
-    root: Path, settings: StructureAnalyzerConfig
+    root: Path,
+    settings: StructureAnalyzerConfig,
+    *,
+    corpus: SourceCorpus | None = None,
 ) -> list[Finding]:
     """Return structure findings for the provided ``root`` path."""
 
-    file_entries = _iter_python_files(root, settings.ignore_dirs)
+    file_entries = _select_files(
+        resolve_corpus(root, corpus, settings.ignore_dirs), settings
+    )
     if not file_entries:
         return []
 
@@ -56,12 +62,12 @@ def find_structure_issues(
             f"File {record.relative_path.as_posix()} has {record.line_count} lines (> "
             f"{settings.max_file_lines})"
         )
-        finding = Finding(
+        finding = Finding.trusted(
             id=identifier,
             category="large_file",
             description=description,
             locations=[
-                FindingLocation(
+                FindingLocation.trusted(
                     path=record.relative_path,
                     start_line=1,
                     end_line=record.line_count,
@@ -81,12 +87,12 @@ def find_structure_issues(
             f"Function {record.qualified_name} has {record.line_count} lines (> "
             f"{settings.max_function_lines})"
         )
-        finding = Finding(
+        finding = Finding.trusted(
             id=identifier,
             category="long_function",
             description=description,
             locations=[
-                FindingLocation(
+                FindingLocation.trusted(
                     path=record.relative_path,
                     start_line=record.start_line,
                     end_line=record.end_line,
@@ -103,32 +109,53 @@ def find_structure_issues(
     return findings
 
 
-def _iter_python_files(root: Path, ignore_dirs: Iterable[str]) -> list[_FileEntry]:
-    if not root.exists():
-        return []
+def _iter_python_files(root: Path, ignore_dirs: Iterable[str]) -> list[SourceFile]:
+    return SourceCorpus(root, ignore_dirs).files(ignore_dirs)
+
+
+def _select_files(
+    corpus: SourceCorpus, settings: StructureAnalyzerConfig
+) -> list[SourceFile]:
+    return corpus.files(settings.ignore_dirs)
+
+
+def _file_tasks(settings: StructureAnalyzerConfig) -> tuple[FileTask, ...]:
+    return (_LINE_COUNT_TASK, _FUNCTION_SPANS_TASK)
+
+
+def _count_lines(source: SourceFile) -> int:
+    return source.line_count
 
-    ignored = set(ignore_dirs)
-    entries: list[_FileEntry] = []
-    for candidate in root.rglob("*.py"):
-        try:
-            relative = candidate.relative_to(root)
-        except ValueError:  # pragma: no cover - defensive
-            continue
-        if any(part in ignored for part in relative.parts[:-1]):
-            continue
-        entries.append(_FileEntry(absolute_path=candidate, relative_path=relative))
 
-    entries.sort(key=lambda entry: entry.relative_path.as_posix())
-    return entries
+def _collect_function_spans(source: SourceFile) -> Outline | None:
+    previous = source.take_stale(_FUNCTION_SPANS_KEY)
+    return collect_outline(source, previous, _function_rows, _shift_span)
+
+
+def _function_rows(node: ast.stmt) -> list[tuple[str, int, int]]:
+    collector = _FunctionCollector()
+    collector.visit(node)
+    return collector.results
+
+
+def _shift_span(row: tuple[str, int, int], delta: int) -> tuple[str, int, int]:
+    qualified_name, start, end = row
+    return qualified_name, start + delta, end + delta
+
+
+_FUNCTION_SPANS_KEY = ("structure.function_spans",)
+_LINE_COUNT_TASK = FileTask(key=("structure.line_count",), collect=_count_lines)
+_FUNCTION_SPANS_TASK = FileTask(
+    key=_FUNCTION_SPANS_KEY, collect=_collect_function_spans
+)
 
 
 def _iter_large_files(
-    file_entries: Iterable[_FileEntry], *, max_file_lines: int
+    file_entries: Iterable[SourceFile], *, max_file_lines: int
 ) -> list[_LargeFileRecord]:
     records: list[_LargeFileRecord] = []
     for entry in file_entries:
-        contents = entry.absolute_path.read_text(encoding="utf-8", errors="ignore")
-        line_count = len(contents.splitlines())
+        line_count = entry.run(_LINE_COUNT_TASK)
         if line_count > max_file_lines:
             records.append(
                 _LargeFileRecord(
@@ -141,20 +168,26 @@ def _iter_large_files(
 
 
 def _iter_long_functions(
-    file_entries: Iterable[_FileEntry], *, max_function_lines: int
+    file_entries: Iterable[SourceFile], *, max_function_lines: int
 ) -> list[_LongFunctionRecord]:
     records: list[_LongFunctionRecord] = []
     for entry in file_entries:
-        source = entry.absolute_path.read_text(encoding="utf-8", errors="ignore")
-        try:
-            tree = ast.parse(
-                source, filename=str(entry.relative_path), type_comments=True
-            )
-        except SyntaxError:
+        outline = entry.run(_FUNCTION_SPANS_TASK)
+        if outline is None:
             continue
-        collector = _FunctionCollector(entry.relative_path, max_function_lines)
-        collector.visit(tree)
-        records.extend(collector.results)
+        for qualified_name, start, end in outline_rows(outline):
+            length = end - start + 1
+            if length <= max_function_lines:
+                continue
+            records.append(
+                _LongFunctionRecord(
+                    relative_path=entry.relative_path,
+                    qualified_name=qualified_name,
+                    start_line=start,
+                    end_line=end,
+                    line_count=length,
+                )
+            )
 
     records.sort(
         key=lambda record: (
@@ -167,20 +200,18 @@ def _iter_long_functions(
 
 
 class _FunctionCollector(ast.NodeVisitor):
-    def __init__(self, relative_path: Path, max_length: int) -> None:
-        self._relative_path = relative_path
-        self._max_length = max_length
+    def __init__(self) -> None:
         self._stack: list[str] = []
-        self.results: list[_LongFunctionRecord] = []
+        self.results: list[tuple[str, int, int]] = []
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        self._maybe_record(node, node.name)
+        self._record(node, node.name)
         self._stack.append(node.name)
         self.generic_visit(node)
         self._stack.pop()
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        self._maybe_record(node, node.name)
+        self._record(node, node.name)
         self._stack.append(node.name)
         self.generic_visit(node)
         self._stack.pop()
@@ -190,24 +221,13 @@ class _FunctionCollector(ast.NodeVisitor):
         self.generic_visit(node)
         self._stack.pop()
 
-    def _maybe_record(self, node: ast.AST, name: str) -> None:
+    def _record(self, node: ast.AST, name: str) -> None:
         start = getattr(node, "lineno", None)
         if start is None:
             return
         end = getattr(node, "end_lineno", None) or start
-        length = end - start + 1
-        if length <= self._max_length:
-            return
         qualified_name = ".".join(self._stack + [name]) if self._stack else name
-        self.results.append(
-            _LongFunctionRecord(
-                relative_path=self._relative_path,
-                qualified_name=qualified_name,
-                start_line=start,
-                end_line=end,
-                line_count=length,
-            )
-        )
+        self.results.append((qualified_name, start, end))
 
 
 def _hash_id(prefix: str, value: str) -> str:
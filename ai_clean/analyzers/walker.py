@@ -0,0 +1,256 @@
+"""Find the Python files under a root without descending into ignored trees.
+
+Inside a git work tree the file list comes from ``git ls-files`` (tracked plus
+untracked, non-ignored files), so ``.gitignore`` and ``.git/info/exclude``
+apply exactly as git applies them. Elsewhere, or when git is unavailable, an
+``os.scandir`` walk prunes ``prune_dirs`` and directories matched by
+``.gitignore`` files before descending, follows directory symlinks at most
+once per real directory, and counts what it skipped.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import stat
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Iterable
+
+from ai_clean.git import list_files
+
+LOGGER = logging.getLogger(__name__)
+
+_PATTERN = "*.py"
+_GITIGNORE = ".gitignore"
+# Never part of the project, and git never lists it either.
+_ALWAYS_PRUNED = frozenset({".git"})
+
+
+@dataclass(frozen=True)
+class WalkResult:
+    """Files found by :func:`walk_python_files` and what the walk skipped.
+
+    ``files`` are relative to the root and sorted by POSIX path. In ``git``
+    mode ignored paths are never enumerated, so only files dropped after
+    listing (deleted, or under ``prune_dirs``) are counted as skipped.
+    """
+
+    files: list[Path] = field(default_factory=list)
+    skipped_dirs: int = 0
+    skipped_files: int = 0
+    mode: str = "scandir"
+
+
+def walk_python_files(
+    root: Path, *, prune_dirs: Iterable[str] = (), gitignore: bool = True
+) -> WalkResult:
+    """Return the ``*.py`` files under ``root``.
+
+    Directories named in ``prune_dirs`` are never entered. With ``gitignore``
+    the listing honors git's ignore rules; without it every file outside the
+    pruned directories is returned.
+    """
+
+    pruned = frozenset(prune_dirs)
+    if not root.is_dir():
+        return WalkResult()
+    if gitignore:
+        listed = _git_listing(root, pruned)
+        if listed is not None:
+            return listed
+    return _scandir_listing(root, pruned | _ALWAYS_PRUNED, gitignore)
+
+
+def _git_listing(root: Path, pruned: frozenset[str]) -> WalkResult | None:
+    pathspecs = [f":(glob)**/{_PATTERN}"]
+    pathspecs.extend(f":(glob,exclude)**/{name}/**" for name in sorted(pruned))
+    try:
+        listed = list_files(root, pathspecs)
+    except (OSError, subprocess.SubprocessError):  # no git, or not a work tree
+        return None
+
+    files: set[str] = set()
+    skipped_files = 0
+    for relative in listed:
+        parts = PurePosixPath(relative).parts
+        # Tracked files deleted from the work tree are still listed.
+        if any(part in pruned for part in parts[:-1]) or not os.path.isfile(
+            root / relative
+        ):
+            skipped_files += 1
+            continue
+        files.add(relative)
+    return WalkResult(
+        files=[Path(relative) for relative in sorted(files)],
+        skipped_files=skipped_files,
+        mode="git",
+    )
+
+
+def _scandir_listing(root: Path, pruned: frozenset[str], gitignore: bool) -> WalkResult:
+    files: list[str] = []
+    skipped_dirs = 0
+    skipped_files = 0
+    visited: set[tuple[int, int]] = set()
+    try:
+        root_stat = root.stat()
+    except OSError:
+        return WalkResult()
+    visited.add((root_stat.st_dev, root_stat.st_ino))
+
+    stack: list[tuple[str, str, _IgnoreRules]] = [(str(root), "", _IgnoreRules())]
+    while stack:
+        directory, prefix, rules = stack.pop()
+        if gitignore:
+            rules = rules.extended(Path(directory) / _GITIGNORE, prefix)
+        try:
+            entries = list(os.scandir(directory))
+        except OSError as exc:
+            LOGGER.debug("Skipping unreadable directory %s: %s", directory, exc)
+            skipped_dirs += 1
+            continue
+        for entry in entries:
+            relative = f"{prefix}{entry.name}"
+            is_dir = _is_dir(entry)
+            if is_dir:
+                if entry.name in pruned or rules.ignored(relative, is_dir=True):
+                    skipped_dirs += 1
+                    continue
+                identity = _identity(entry)
+                if identity is None or identity in visited:  # symlink loop
+                    skipped_dirs += 1
+                    continue
+                visited.add(identity)
+                stack.append((entry.path, f"{relative}/", rules))
+            elif entry.name.endswith(".py"):
+                if rules.ignored(relative, is_dir=False):
+                    skipped_files += 1
+                    continue
+                files.append(relative)
+
+    files.sort()
+    return WalkResult(
+        files=[Path(relative) for relative in files],
+        skipped_dirs=skipped_dirs,
+        skipped_files=skipped_files,
+    )
+
+
+def _is_dir(entry: os.DirEntry[str]) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _identity(entry: os.DirEntry[str]) -> tuple[int, int] | None:
+    try:
+        info = entry.stat() if entry.is_symlink() else entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(info.st_mode):
+        return None
+    # DirEntry.stat() leaves st_dev/st_ino zero on Windows; fall back to os.stat.
+    if not info.st_ino:
+        info = os.stat(entry.path)
+    return (info.st_dev, info.st_ino)
+
+
+@dataclass(frozen=True)
+class _Rule:
+    base: str
+    regex: re.Pattern[str]
+    negated: bool
+    dir_only: bool
+    anchored: bool
+
+
+class _IgnoreRules:
+    """The ``.gitignore`` rules in effect for one directory; last match wins."""
+
+    __slots__ = ("_rules",)
+
+    def __init__(self, rules: tuple[_Rule, ...] = ()) -> None:
+        self._rules = rules
+
+    def extended(self, path: Path, base: str) -> "_IgnoreRules":
+        try:
+            text = path.read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            return self
+        added = tuple(
+            rule
+            for rule in (_parse_rule(line, base) for line in text.splitlines())
+            if rule is not None
+        )
+        return _IgnoreRules(self._rules + added) if added else self
+
+    def ignored(self, relative: str, *, is_dir: bool) -> bool:
+        result = False
+        for rule in self._rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if not relative.startswith(rule.base):
+                continue
+            subject = relative[len(rule.base) :]
+            if not rule.anchored:
+                subject = subject.rsplit("/", 1)[-1]
+            if rule.regex.fullmatch(subject):
+                result = not rule.negated
+        return result
+
+
+def _parse_rule(line: str, base: str) -> _Rule | None:
+    pattern = line.rstrip()
+    if not pattern or pattern.startswith("#"):
+        return None
+    negated = pattern.startswith("!")
+    if negated:
+        pattern = pattern[1:]
+    elif pattern.startswith("\\"):
+        pattern = pattern[1:]
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+    if not pattern:
+        return None
+    return _Rule(base, re.compile(_glob_to_regex(pattern)), negated, dir_only, anchored)
+
+
+def _glob_to_regex(pattern: str) -> str:
+    out: list[str] = []
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith("**/", index):
+            out.append("(?:.*/)?")
+            index += 3
+        elif pattern.startswith("/**", index) and index + 3 == len(pattern):
+            out.append("/.*")
+            index += 3
+        elif pattern.startswith("**", index):
+            out.append(".*")
+            index += 2
+        elif pattern[index] == "*":
+            out.append("[^/]*")
+            index += 1
+        elif pattern[index] == "?":
+            out.append("[^/]")
+            index += 1
+        elif pattern[index] == "[" and "]" in pattern[index + 1 :]:
+            end = pattern.index("]", index + 1)
+            body = pattern[index + 1 : end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            index = end + 1
+        else:
+            out.append(re.escape(pattern[index]))
+            index += 1
+    return "".join(out)
+
+
+__all__ = ["WalkResult", "walk_python_files"]
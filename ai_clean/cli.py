@@ -3,24 +3,99 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import json
 import shlex
+import signal
+import subprocess
 import sys
+import threading
 from pathlib import Path
-from typing import Callable
-
-from ai_clean.analyzers import analyze_repo
-from ai_clean.analyzers.docstrings import find_docstring_gaps
-from ai_clean.analyzers.organize import propose_organize_groups
-from ai_clean.commands.apply import apply_plan
-from ai_clean.commands.ingest import IngestError, ingest_codex_artifact
-from ai_clean.commands.plan import run_plan_for_finding
-from ai_clean.config import load_config
-from ai_clean.factories import get_review_executor
+from typing import TYPE_CHECKING, Any, Callable
+
+from ai_clean.git import changed_files
+from ai_clean.interfaces.store import PLAN_STATUSES
 from ai_clean.metadata import ensure_metadata_dirs, resolve_metadata_paths
-from ai_clean.models import ExecutionResult, Finding
-from ai_clean.planners.orchestrator import plan_from_finding
-from ai_clean.plans import load_plan, save_plan
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only
+    from ai_clean.analyzers import analyze_repo, iter_findings
+    from ai_clean.analyzers.clone_index import open_clone_index
+    from ai_clean.analyzers.docstrings import find_docstring_gaps
+    from ai_clean.analyzers.orchestrator import open_analysis_cache, prepare_corpus
+    from ai_clean.analyzers.organize import propose_organize_groups
+    from ai_clean.analyzers.stats import AnalyzerStats
+    from ai_clean.commands.apply import apply_batch, apply_plan
+    from ai_clean.commands.ingest import ingest_codex_artifact
+    from ai_clean.commands.plan import plan_many, run_plan_for_finding
+    from ai_clean.config import AiCleanConfig, load_config
+    from ai_clean.daemon import default_socket_path, query_daemon, serve
+    from ai_clean.factories import get_review_executor
+    from ai_clean.findings_journal import FindingsJournal
+    from ai_clean.interfaces.store import MetadataStore
+    from ai_clean.metadata_stores import (
+        FileMetadataStore,
+        copy_metadata,
+        open_metadata_store,
+    )
+    from ai_clean.models import CleanupPlan, ExecutionResult, Finding
+    from ai_clean.planners.orchestrator import plan_from_finding
+
+
+class _Deferred:
+    """Module attribute that imports ``module`` when first called.
+
+    Analyzers, planners, and the pydantic models dominate start-up time, and
+    most commands only need a few of them (``--help`` needs none). Keeping the
+    names as attributes of this module means tests can still patch
+    ``ai_clean.cli.<name>``.
+    """
+
+    __slots__ = ("_module", "_name")
+
+    def __init__(self, module: str, name: str) -> None:
+        self._module = module
+        self._name = name
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        target = getattr(importlib.import_module(self._module), self._name)
+        return target(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<deferred {self._module}.{self._name}>"
+
+
+if not TYPE_CHECKING:
+    analyze_repo = _Deferred("ai_clean.analyzers", "analyze_repo")
+    iter_findings = _Deferred("ai_clean.analyzers", "iter_findings")
+    open_clone_index = _Deferred("ai_clean.analyzers.clone_index", "open_clone_index")
+    find_docstring_gaps = _Deferred(
+        "ai_clean.analyzers.docstrings", "find_docstring_gaps"
+    )
+    open_analysis_cache = _Deferred(
+        "ai_clean.analyzers.orchestrator", "open_analysis_cache"
+    )
+    prepare_corpus = _Deferred("ai_clean.analyzers.orchestrator", "prepare_corpus")
+    propose_organize_groups = _Deferred(
+        "ai_clean.analyzers.organize", "propose_organize_groups"
+    )
+    apply_batch = _Deferred("ai_clean.commands.apply", "apply_batch")
+    apply_plan = _Deferred("ai_clean.commands.apply", "apply_plan")
+    ingest_codex_artifact = _Deferred(
+        "ai_clean.commands.ingest", "ingest_codex_artifact"
+    )
+    load_config = _Deferred("ai_clean.config", "load_config")
+    plan_many = _Deferred("ai_clean.commands.plan", "plan_many")
+    run_plan_for_finding = _Deferred("ai_clean.commands.plan", "run_plan_for_finding")
+    default_socket_path = _Deferred("ai_clean.daemon", "default_socket_path")
+    query_daemon = _Deferred("ai_clean.daemon", "query_daemon")
+    serve = _Deferred("ai_clean.daemon", "serve")
+    get_review_executor = _Deferred("ai_clean.factories", "get_review_executor")
+    FindingsJournal = _Deferred("ai_clean.findings_journal", "FindingsJournal")
+    FileMetadataStore = _Deferred("ai_clean.metadata_stores", "FileMetadataStore")
+    copy_metadata = _Deferred("ai_clean.metadata_stores", "copy_metadata")
+    open_metadata_store = _Deferred("ai_clean.metadata_stores", "open_metadata_store")
+    ExecutionResult = _Deferred("ai_clean.models", "ExecutionResult")
+    plan_from_finding = _Deferred("ai_clean.planners.orchestrator", "plan_from_finding")
 
 CommandHandler = Callable[[argparse.Namespace], int]
 
@@ -30,6 +105,7 @@ _COMMAND_SPECS: tuple[tuple[str, str], ...] = (
     ("clean", "Guided basic cleanup for common findings"),
     ("annotate", "Generate docstring improvement plans"),
     ("organize", "Group related files and propose organize moves"),
+    ("duplicates", "Show where else a file's code is duplicated"),
     (
         "cleanup-advanced",
         "Disabled: run Codex /cleanup-advanced slash command manually",
@@ -38,6 +114,9 @@ _COMMAND_SPECS: tuple[tuple[str, str], ...] = (
     ("apply", "Apply a ButlerSpec plan using Codex"),
     ("ingest", "Ingest Codex artifact output into ai-clean results"),
     ("changes-review", "Review executed plans and summarize risks"),
+    ("list", "List stored plans, execution results, or findings"),
+    ("metadata", "Export or import the metadata JSON file layout"),
+    ("serve", "Keep analysis warm in a daemon that other commands query"),
 )
 
 _CLEAN_CATEGORIES: set[str] = {"duplicate_block", "large_file", "long_function"}
@@ -51,6 +130,44 @@ def _make_handler(command_label: str) -> CommandHandler:
     return _handler
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from exc
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def _line_range(value: str) -> tuple[int, int]:
+    start, _, end = value.partition("-")
+    try:
+        bounds = (int(start), int(end or start))
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid line range: {value!r}") from exc
+    if bounds[0] < 1 or bounds[1] < bounds[0]:
+        raise argparse.ArgumentTypeError("expected START-END with 1 <= START <= END")
+    return bounds
+
+
+def _add_analysis_args(subparser: argparse.ArgumentParser) -> None:
+    """Add the ``--jobs`` and ``--no-cache`` options of analyzer commands."""
+
+    subparser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Worker processes for per-file analysis (defaults to [analyzers] jobs)",
+    )
+    subparser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Ignore and do not update the per-file analysis cache",
+    )
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="ai-clean",
@@ -79,6 +196,53 @@ def _build_parser() -> argparse.ArgumentParser:
                 action="store_true",
                 help="Emit findings as JSON instead of a text table",
             )
+            subparser.add_argument(
+                "--format",
+                dest="output_format",
+                choices=["table", "json", "ndjson"],
+                default=None,
+                help=(
+                    "Output format: text table (default), JSON array, or one "
+                    "JSON object per line followed by a summary line"
+                ),
+            )
+            subparser.add_argument(
+                "--stream",
+                action="store_true",
+                help="With --format ndjson, print findings as each analyzer finishes",
+            )
+            _add_analysis_args(subparser)
+            scope = subparser.add_mutually_exclusive_group()
+            scope.add_argument(
+                "--since",
+                metavar="REF",
+                default=None,
+                help=(
+                    "Only report findings touching files changed since REF "
+                    "(committed, staged, unstaged, or untracked)"
+                ),
+            )
+            scope.add_argument(
+                "--changed-only",
+                action="store_true",
+                help="Shorthand for --since HEAD (uncommitted changes only)",
+            )
+            subparser.add_argument(
+                "--profile",
+                action="store_true",
+                help=(
+                    "Report per-analyzer wall/CPU time, files, bytes, ASTs, "
+                    "and findings"
+                ),
+            )
+            subparser.add_argument(
+                "--profile-memory",
+                action="store_true",
+                help=(
+                    "Like --profile, and also trace peak memory per analyzer "
+                    "with tracemalloc (slower)"
+                ),
+            )
             subparser.set_defaults(handler=_run_analyze_command)
             continue
         if command_name == "clean":
@@ -97,6 +261,7 @@ def _build_parser() -> argparse.ArgumentParser:
                 default=None,
                 help="Optional sub-path to limit analyzers (relative to root)",
             )
+            _add_analysis_args(subparser)
             subparser.set_defaults(handler=_run_clean_command)
             continue
         if command_name == "annotate":
@@ -128,6 +293,7 @@ def _build_parser() -> argparse.ArgumentParser:
                 default="missing",
                 help="Select docstring categories: missing only (default) or all",
             )
+            _add_analysis_args(subparser)
             subparser.set_defaults(handler=_run_annotate_command)
             continue
         if command_name == "organize":
@@ -153,6 +319,7 @@ def _build_parser() -> argparse.ArgumentParser:
                 default=None,
                 help="Optional sub-path to limit organize analysis (relative to root)",
             )
+            _add_analysis_args(subparser)
             subparser.set_defaults(handler=_run_organize_command)
             continue
         if command_name == "changes-review":
@@ -170,7 +337,31 @@ def _build_parser() -> argparse.ArgumentParser:
             subparser.set_defaults(handler=_run_changes_review_command)
             continue
         if command_name == "plan":
-            subparser.add_argument("finding_id", help="ID of the finding to plan for")
+            subparser.add_argument(
+                "finding_id",
+                nargs="?",
+                default=None,
+                help="ID of the finding to plan for (omit with --all)",
+            )
+            subparser.add_argument(
+                "--all",
+                dest="plan_all",
+                action="store_true",
+                help="Plan every finding in the findings JSON in one batch",
+            )
+            subparser.add_argument(
+                "--category",
+                dest="categories",
+                action="append",
+                default=None,
+                help="With --all, only plan findings of this category (repeatable)",
+            )
+            subparser.add_argument(
+                "--jobs",
+                type=_positive_int,
+                default=1,
+                help="With --all, worker processes used for planning (default 1)",
+            )
             subparser.add_argument(
                 "--root",
                 default=".",
@@ -215,7 +406,27 @@ def _build_parser() -> argparse.ArgumentParser:
             subparser.set_defaults(handler=_run_cleanup_advanced_command)
             continue
         if command_name == "apply":
-            subparser.add_argument("plan_id", help="ID of the plan to apply")
+            subparser.add_argument(
+                "plan_id",
+                nargs="?",
+                default=None,
+                help="ID of the plan to apply (omit with --batch)",
+            )
+            subparser.add_argument(
+                "--batch",
+                metavar="BATCH_GROUP",
+                default=None,
+                help=(
+                    "Execute every spec in this batch group with the configured "
+                    "executor, each target file in its own git worktree"
+                ),
+            )
+            subparser.add_argument(
+                "--workers",
+                type=_positive_int,
+                default=1,
+                help="With --batch, specs for different files to run at once",
+            )
             subparser.add_argument(
                 "--root",
                 default=".",
@@ -267,6 +478,130 @@ def _build_parser() -> argparse.ArgumentParser:
             )
             subparser.set_defaults(handler=_run_ingest_command)
             continue
+        if command_name == "list":
+            subparser.add_argument(
+                "kind",
+                choices=["plans", "results", "findings"],
+                help="Which metadata objects to list",
+            )
+            subparser.add_argument(
+                "--status",
+                choices=PLAN_STATUSES,
+                default=None,
+                help="Only list plans with this status",
+            )
+            subparser.add_argument(
+                "--category",
+                default=None,
+                help="Only list findings of this category",
+            )
+            subparser.add_argument(
+                "--path",
+                default=None,
+                help="Only list findings located in this repository-relative path",
+            )
+            subparser.add_argument(
+                "--json",
+                action="store_true",
+                help="Emit one JSON document per line instead of a text table",
+            )
+            subparser.add_argument(
+                "--root",
+                default=".",
+                help="Path to the repository root (defaults to current directory)",
+            )
+            subparser.add_argument(
+                "--config",
+                default=None,
+                help="Optional ai-clean configuration file to load",
+            )
+            subparser.set_defaults(handler=_run_list_command)
+            continue
+        if command_name == "metadata":
+            subparser.add_argument(
+                "action",
+                choices=["export", "import"],
+                help=(
+                    "export: write the configured store as JSON files; "
+                    "import: load JSON files into the configured store"
+                ),
+            )
+            subparser.add_argument(
+                "--dir",
+                dest="layout_dir",
+                required=True,
+                help=(
+                    "Directory holding plans/, results/, and findings.json "
+                    "(relative paths resolve against --root)"
+                ),
+            )
+            subparser.add_argument(
+                "--root",
+                default=".",
+                help="Path to the repository root (defaults to current directory)",
+            )
+            subparser.add_argument(
+                "--config",
+                default=None,
+                help="Optional ai-clean configuration file to load",
+            )
+            subparser.set_defaults(handler=_run_metadata_command)
+            continue
+        if command_name == "duplicates":
+            subparser.add_argument(
+                "--root",
+                default=".",
+                help="Path to the repository root (defaults to current directory)",
+            )
+            subparser.add_argument(
+                "--config",
+                default=None,
+                help="Optional ai-clean configuration file to load",
+            )
+            subparser.add_argument(
+                "--file",
+                dest="file_path",
+                required=True,
+                help="File to look up (relative to root)",
+            )
+            subparser.add_argument(
+                "--lines",
+                type=_line_range,
+                default=None,
+                metavar="START-END",
+                help="Only look up this 1-based, inclusive line range",
+            )
+            subparser.add_argument(
+                "--json",
+                action="store_true",
+                help="Emit one JSON object per clone instead of text",
+            )
+            subparser.set_defaults(handler=_run_duplicates_command)
+            continue
+        if command_name == "serve":
+            subparser.add_argument(
+                "--root",
+                default=".",
+                help="Path to the repository root (defaults to current directory)",
+            )
+            subparser.add_argument(
+                "--config",
+                default=None,
+                help="Optional ai-clean configuration file to load",
+            )
+            subparser.add_argument(
+                "--interval",
+                type=float,
+                default=1.0,
+                help="Seconds between checks for changed files (default 1)",
+            )
+            subparser.add_argument(
+                "--socket",
+                default=None,
+                help="Unix socket path (defaults to <root>/.ai-clean/serve.sock)",
+            )
+            subparser.set_defaults(handler=_run_serve_command)
+            continue
         subparser.set_defaults(handler=_make_handler(command_name))
 
     return parser
@@ -293,10 +628,43 @@ def _run_analyze_command(args: argparse.Namespace) -> int:
     This command reports findings but does not create or modify any
     ai-clean metadata (plans, specs, or execution results).
     """
+    output_format = args.output_format or ("json" if args.json else "table")
+    if args.json and output_format != "json":
+        print("--json cannot be combined with --format", file=sys.stderr)
+        return 1
+    if args.stream and output_format != "ndjson":
+        print("--stream requires --format ndjson", file=sys.stderr)
+        return 1
+
     root = Path(args.root).expanduser().resolve()
     config_path = _resolve_config_path(root, args.config)
+    since = "HEAD" if args.changed_only else args.since
+    changed: list[str] | None = None
+    if since is not None:
+        try:
+            changed = changed_files(root, since)
+        except (subprocess.CalledProcessError, FileNotFoundError) as exc:
+            detail = getattr(exc, "stderr", None) or exc
+            print(f"Failed to list changed files: {detail}".rstrip(), file=sys.stderr)
+            return 1
+    profile = args.profile or args.profile_memory
+    stats: list[AnalyzerStats] | None = [] if profile else None
+    if output_format == "ndjson":
+        return _stream_findings(root, config_path, args, changed, stats)
+    if stats is None and args.use_cache:
+        served = query_daemon("analyze", root, config_path, changed_files=changed)
+        if served is not None:
+            return _print_findings(served, output_format == "json")
     try:
-        findings = analyze_repo(root, config_path)
+        findings = analyze_repo(
+            root,
+            config_path,
+            jobs=args.jobs,
+            use_cache=args.use_cache,
+            changed_files=changed,
+            stats=stats,
+            trace_memory=args.profile_memory,
+        )
     except FileNotFoundError as exc:
         print(f"Failed to load configuration: {exc}", file=sys.stderr)
         return 1
@@ -304,7 +672,71 @@ def _run_analyze_command(args: argparse.Namespace) -> int:
         print(f"Unexpected error while running analyzers: {exc}", file=sys.stderr)
         return 1
 
-    return _print_findings(findings, args.json)
+    if stats is None:
+        return _print_findings(findings, output_format == "json")
+    if output_format == "json":
+        payload = {
+            "findings": [finding.model_dump(mode="json") for finding in findings],
+            "analysis_stats": [entry.to_dict() for entry in stats],
+        }
+        print(json.dumps(payload, indent=2, sort_keys=True))
+        return 0
+    _print_findings(findings, False)
+    print()
+    _print_analysis_stats(stats)
+    return 0
+
+
+def _stream_findings(
+    root: Path,
+    config_path: Path | None,
+    args: argparse.Namespace,
+    changed: list[str] | None = None,
+    stats: list[AnalyzerStats] | None = None,
+) -> int:
+    """Print findings as NDJSON lines, then a ``{"summary": ...}`` line.
+
+    With ``--stream`` each line is flushed as soon as its analyzer finishes;
+    otherwise findings are sorted like ``--json`` first. With ``stats`` the
+    summary also carries an ``analysis_stats`` list.
+    """
+    errors: list[dict[str, str]] = []
+    stream = iter_findings(
+        root,
+        config_path,
+        jobs=args.jobs,
+        use_cache=args.use_cache,
+        errors=errors,
+        changed_files=changed,
+        stats=stats,
+        trace_memory=args.profile_memory,
+    )
+    count = 0
+    try:
+        if args.stream:
+            for finding in stream:
+                print(_finding_json_line(finding), flush=True)
+                count += 1
+        else:
+            for finding in sorted(stream, key=lambda item: (item.category, item.id)):
+                print(_finding_json_line(finding))
+                count += 1
+    except FileNotFoundError as exc:
+        print(f"Failed to load configuration: {exc}", file=sys.stderr)
+        return 1
+    except Exception as exc:  # pragma: no cover - defensive
+        print(f"Unexpected error while running analyzers: {exc}", file=sys.stderr)
+        return 1
+
+    summary: dict[str, object] = {"findings": count, "analyzer_errors": errors}
+    if stats is not None:
+        summary["analysis_stats"] = [entry.to_dict() for entry in stats]
+    print(json.dumps({"summary": summary}, sort_keys=True), flush=True)
+    return 0
+
+
+def _finding_json_line(finding: Finding) -> str:
+    return json.dumps(finding.model_dump(mode="json"), sort_keys=True)
 
 
 def _run_clean_command(args: argparse.Namespace) -> int:
@@ -321,7 +753,9 @@ def _run_clean_command(args: argparse.Namespace) -> int:
         path_filter = None
 
     try:
-        findings = analyze_repo(root, config_path)
+        findings = analyze_repo(
+            root, config_path, jobs=args.jobs, use_cache=args.use_cache
+        )
     except FileNotFoundError as exc:
         print(f"Failed to load configuration: {exc}", file=sys.stderr)
         return 1
@@ -359,19 +793,25 @@ def _run_clean_command(args: argparse.Namespace) -> int:
         return 0
 
     overall_failure = False
-    for index in selected_indexes:
-        finding = candidates[index]
-        try:
-            plan_entries = run_plan_for_finding(root, config_path, finding)
-        except NotImplementedError as exc:
+    try:
+        batch = plan_many(
+            root, config, [candidates[index] for index in selected_indexes]
+        )
+    except Exception as exc:  # pragma: no cover - defensive
+        print(f"Unexpected error while creating plans: {exc}", file=sys.stderr)
+        return 1
+    for result in batch:
+        finding = result.finding
+        exc = result.error
+        if isinstance(exc, NotImplementedError):
             print(str(exc), file=sys.stderr)
             overall_failure = True
             continue
-        except FileNotFoundError as exc:
+        if isinstance(exc, FileNotFoundError):
             print(f"Failed to create plan for {finding.id}: {exc}", file=sys.stderr)
             overall_failure = True
             continue
-        except Exception as exc:  # pragma: no cover - defensive
+        if exc is not None:
             print(
                 f"Unexpected error while creating plan for {finding.id}: {exc}",
                 file=sys.stderr,
@@ -379,7 +819,7 @@ def _run_clean_command(args: argparse.Namespace) -> int:
             overall_failure = True
             continue
 
-        for plan, plan_path in sorted(plan_entries, key=lambda entry: entry[0].id):
+        for plan, plan_path in sorted(result.plans, key=lambda entry: entry[0].id):
             target_file = plan.metadata.get("target_file", "unknown-target")
             print(f"Plan created: {plan.id} -> {target_file} ({plan_path})")
             decision = _prompt_plan_action(plan.id)
@@ -438,8 +878,22 @@ def _run_annotate_command(args: argparse.Namespace) -> int:
 
     _, plans_dir, _, _ = resolve_metadata_paths(root, config)
 
+    served = query_daemon("docstrings", root, config_path) if args.use_cache else None
     try:
-        findings = find_docstring_gaps(root, config.analyzers.docstring)
+        if served is not None:
+            findings = served
+        else:
+            settings = config.analyzers.docstring
+            cache = open_analysis_cache(root, config) if args.use_cache else None
+            corpus = prepare_corpus(
+                root,
+                [("docstrings", settings)],
+                jobs=args.jobs or config.analyzers.jobs,
+                cache=cache,
+            )
+            findings = find_docstring_gaps(root, settings, corpus=corpus)
+            if cache is not None:
+                cache.save(corpus)
     except Exception as exc:  # pragma: no cover - defensive
         print(
             f"Unexpected error while running docstring analyzer: {exc}", file=sys.stderr
@@ -471,7 +925,7 @@ def _run_annotate_command(args: argparse.Namespace) -> int:
         return 0
     targets = grouped if selection == "all" else [grouped[index] for index in selection]
 
-    created_plans: list[tuple[object, Path]] = []
+    pending: list[tuple[CleanupPlan, Path]] = []
     overall_failure = False
     for module_path, module_findings in targets:
         for finding in module_findings:
@@ -489,11 +943,16 @@ def _run_annotate_command(args: argparse.Namespace) -> int:
                 overall_failure = True
                 continue
 
-            for plan in sorted(plans, key=lambda plan: plan.id):
-                plan_path = save_plan(plan, root=plans_dir.parent)
-                created_plans.append((plan, plan_path))
-                target_file = plan.metadata.get("target_file", module_path.as_posix())
-                print(f"Plan created: {plan.id} -> {target_file} ({plan_path})")
+            pending.extend(
+                (plan, module_path) for plan in sorted(plans, key=lambda plan: plan.id)
+            )
+
+    # Plans are saved in one batch, through a single store.
+    plan_paths = _save_plans(root, config, [plan for plan, _ in pending])
+    created_plans = [(plan, path) for (plan, _), path in zip(pending, plan_paths)]
+    for (plan, module_path), plan_path in zip(pending, plan_paths):
+        target_file = plan.metadata.get("target_file", module_path.as_posix())
+        print(f"Plan created: {plan.id} -> {target_file} ({plan_path})")
 
     if not created_plans:
         print("No plans created.")
@@ -562,8 +1021,22 @@ def _run_organize_command(args: argparse.Namespace) -> int:
 
     _, plans_dir, _, _ = resolve_metadata_paths(root, config)
 
+    served = query_daemon("organize", root, config_path) if args.use_cache else None
     try:
-        findings = propose_organize_groups(root, config.analyzers.organize)
+        if served is not None:
+            findings = served
+        else:
+            settings = config.analyzers.organize
+            cache = open_analysis_cache(root, config) if args.use_cache else None
+            corpus = prepare_corpus(
+                root,
+                [("organize", settings)],
+                jobs=args.jobs or config.analyzers.jobs,
+                cache=cache,
+            )
+            findings = propose_organize_groups(root, settings, corpus=corpus)
+            if cache is not None:
+                cache.save(corpus)
     except Exception as exc:  # pragma: no cover - defensive
         print(
             f"Unexpected error while running organize analyzer: {exc}", file=sys.stderr
@@ -589,6 +1062,7 @@ def _run_organize_command(args: argparse.Namespace) -> int:
         return 0
 
     overall_failure = False
+    pending: list[tuple[CleanupPlan, str, int]] = []
     created_plans: list[tuple[object, Path]] = []
     applied = 0
 
@@ -611,44 +1085,47 @@ def _run_organize_command(args: argparse.Namespace) -> int:
             )
             overall_failure = True
             continue
+        pending.extend(
+            (plan, topic, member_count)
+            for plan in sorted(plans, key=lambda plan: plan.id)
+        )
 
-        for plan in sorted(plans, key=lambda plan: plan.id):
-            plan_path = save_plan(plan, root=plans_dir.parent)
+    # Plans are saved in one batch before any is offered for apply.
+    plan_paths = _save_plans(root, config, [plan for plan, _, _ in pending])
+    for (plan, topic, member_count), plan_path in zip(pending, plan_paths):
+        print(
+            f"Plan created: {plan.id} | topic={topic or 'unknown'} | "
+            f"files={member_count} | {plan_path}"
+        )
+        decision = _prompt_organize_plan_action(plan.id)
+        if decision == "save":
             print(
-                f"Plan created: {plan.id} | topic={topic or 'unknown'} | "
-                f"files={member_count} | {plan_path}"
+                "Saved plan. Run "
+                f"'ai-clean apply {plan.id} --root {root}' to execute later."
             )
-            decision = _prompt_organize_plan_action(plan.id)
-            if decision == "save":
-                print(
-                    "Saved plan. Run "
-                    f"'ai-clean apply {plan.id} --root {root}' to execute later."
-                )
-                created_plans.append((plan, plan_path))
-                continue
-            try:
-                _, spec_path = apply_plan(plans_dir.parent, config_path, plan.id)
-            except FileNotFoundError as exc:
-                print(f"Failed to apply plan {plan.id}: {exc}", file=sys.stderr)
-                overall_failure = True
-                created_plans.append((plan, plan_path))
-                continue
-            except ValueError as exc:
-                print(f"Failed to apply plan {plan.id}: {exc}", file=sys.stderr)
-                overall_failure = True
-                created_plans.append((plan, plan_path))
-                continue
-            except Exception as exc:  # pragma: no cover - defensive
-                print(
-                    f"Unexpected error while applying {plan.id}: {exc}", file=sys.stderr
-                )
-                overall_failure = True
-                created_plans.append((plan, plan_path))
-                continue
-
-            _print_manual_apply(plan.id, spec_path)
-            applied += 1
             created_plans.append((plan, plan_path))
+            continue
+        try:
+            _, spec_path = apply_plan(plans_dir.parent, config_path, plan.id)
+        except FileNotFoundError as exc:
+            print(f"Failed to apply plan {plan.id}: {exc}", file=sys.stderr)
+            overall_failure = True
+            created_plans.append((plan, plan_path))
+            continue
+        except ValueError as exc:
+            print(f"Failed to apply plan {plan.id}: {exc}", file=sys.stderr)
+            overall_failure = True
+            created_plans.append((plan, plan_path))
+            continue
+        except Exception as exc:  # pragma: no cover - defensive
+            print(f"Unexpected error while applying {plan.id}: {exc}", file=sys.stderr)
+            overall_failure = True
+            created_plans.append((plan, plan_path))
+            continue
+
+        _print_manual_apply(plan.id, spec_path)
+        applied += 1
+        created_plans.append((plan, plan_path))
 
     if created_plans:
         print(
@@ -671,14 +1148,15 @@ def _run_changes_review_command(args: argparse.Namespace) -> int:
         print(f"Unexpected error while loading configuration: {exc}", file=sys.stderr)
         return 1
 
-    _, plans_dir, specs_dir, results_dir = resolve_metadata_paths(root, config)
+    _, _, specs_dir, _ = resolve_metadata_paths(root, config)
 
+    store = open_metadata_store(root, config)
     try:
-        plan = load_plan(plan_id, root=plans_dir.parent)
-    except FileNotFoundError:
-        plan_path = (plans_dir / f"{plan_id}.json").resolve()
+        plan = store.load_plan(plan_id)
+    except FileNotFoundError as exc:
+        store.close()
         print(
-            f"CleanupPlan not found for plan_id {plan_id!r} at {plan_path}",
+            f"CleanupPlan not found for plan_id {plan_id!r}: {exc}",
             file=sys.stderr,
         )
         return 1
@@ -694,7 +1172,10 @@ def _run_changes_review_command(args: argparse.Namespace) -> int:
     else:
         spec_text = None
 
-    exec_result, exec_warning = _load_execution_result(results_dir, plan_id)
+    try:
+        exec_result, exec_warning = _load_execution_result(store, plan_id)
+    finally:
+        store.close()
     diff_text = exec_result.git_diff or "" if exec_result else ""
     warnings: list[str] = []
     if spec_text is None:
@@ -751,8 +1232,13 @@ def _run_cleanup_advanced_command(args: argparse.Namespace) -> int:
 
 
 def _run_apply_command(args: argparse.Namespace) -> int:
+    if (args.batch is None) == (args.plan_id is None):
+        print("Pass either a plan_id or --batch.", file=sys.stderr)
+        return 1
     root = Path(args.root).expanduser().resolve()
     config_path = _resolve_config_path(root, args.config)
+    if args.batch is not None:
+        return _run_apply_batch(root, config_path, args.batch, args.workers)
     plan_id = args.plan_id
 
     try:
@@ -771,7 +1257,44 @@ def _run_apply_command(args: argparse.Namespace) -> int:
     return 0
 
 
+def _run_apply_batch(
+    root: Path, config_path: Path | None, batch_group: str, workers: int
+) -> int:
+    def _report(result: ExecutionResult) -> None:
+        batch = result.metadata.get("batch", {})
+        status = "ok" if result.success and result.tests_passed else "failed"
+        detail = result.metadata.get("error") or batch.get("worktree", "")
+        print(
+            f"{result.plan_id} | {status} | success={result.success} "
+            f"tests_passed={result.tests_passed} | {detail}",
+            flush=True,
+        )
+
+    try:
+        results = apply_batch(
+            root, config_path, batch_group, workers=workers, on_result=_report
+        )
+    except FileNotFoundError as exc:
+        print(f"Failed to load configuration: {exc}", file=sys.stderr)
+        return 1
+    except ValueError as exc:
+        print(f"Batch apply failed: {exc}", file=sys.stderr)
+        return 1
+    except Exception as exc:  # pragma: no cover - defensive
+        print(f"Unexpected error while applying batch: {exc}", file=sys.stderr)
+        return 1
+
+    if not results:
+        print(f"No specs found for batch group {batch_group!r}.")
+        return 0
+    passed = sum(1 for result in results if result.success and result.tests_passed)
+    print(f"Batch {batch_group}: {passed}/{len(results)} spec(s) applied and passed.")
+    return 0 if passed == len(results) else 1
+
+
 def _run_ingest_command(args: argparse.Namespace) -> int:
+    from ai_clean.commands.ingest import IngestError
+
     root = Path(args.root).expanduser().resolve()
     config_path = _resolve_config_path(root, args.config)
     plan_id = args.plan_id
@@ -801,6 +1324,7 @@ def _run_ingest_command(args: argparse.Namespace) -> int:
     else:
         findings_path = None
 
+    store = open_metadata_store(root, config)
     try:
         result, summary = ingest_codex_artifact(
             plan_id=plan_id,
@@ -811,10 +1335,13 @@ def _run_ingest_command(args: argparse.Namespace) -> int:
             findings_path=findings_path,
             max_suggestions=config.analyzers.advanced.max_suggestions,
             max_suggestion_files=config.analyzers.advanced.max_files,
+            store=store,
         )
     except (IngestError, FileNotFoundError) as exc:
         print(f"Ingest failed: {exc}", file=sys.stderr)
         return 1
+    finally:
+        store.close()
 
     _print_ingest_summary(
         plan_id,
@@ -827,26 +1354,226 @@ def _run_ingest_command(args: argparse.Namespace) -> int:
     return 0 if result.success else 1
 
 
+def _run_duplicates_command(args: argparse.Namespace) -> int:
+    import sqlite3
+
+    root = Path(args.root).expanduser().resolve()
+    try:
+        config = load_config(_resolve_config_path(root, args.config))
+    except Exception as exc:
+        print(f"Failed to load configuration: {exc}", file=sys.stderr)
+        return 1
+
+    candidate = Path(args.file_path).expanduser()
+    target = (root / candidate if not candidate.is_absolute() else candidate).resolve()
+    if not target.is_file():
+        print(f"File not found: {args.file_path}", file=sys.stderr)
+        return 1
+    relative = _display_path(target, root)
+    start, end = args.lines or (1, None)
+
+    try:
+        with open_clone_index(root, config) as index:
+            index.refresh()
+            matches = index.lookup_clones(relative, start, end)
+    except (OSError, sqlite3.Error) as exc:
+        print(f"Failed to update the duplicate index: {exc}", file=sys.stderr)
+        return 1
+
+    for match in matches:
+        if args.json:
+            print(
+                json.dumps(
+                    {
+                        "path": relative,
+                        "start_line": match.start_line,
+                        "end_line": match.end_line,
+                        "clone_path": match.path,
+                        "clone_start_line": match.clone_start_line,
+                        "clone_end_line": match.clone_end_line,
+                    }
+                )
+            )
+        else:
+            print(
+                f"{relative}:{match.start_line}-{match.end_line} -> "
+                f"{match.path}:{match.clone_start_line}-{match.clone_end_line}"
+            )
+    if not matches and not args.json:
+        print(f"No duplicates found for {relative}.")
+    return 0
+
+
+def _run_serve_command(args: argparse.Namespace) -> int:
+    root = Path(args.root).expanduser().resolve()
+    config_path = _resolve_config_path(root, args.config)
+    socket_path = (
+        Path(args.socket).expanduser().resolve()
+        if args.socket
+        else default_socket_path(root)
+    )
+    print(f"[ai-clean] warming up analysis for {root}", file=sys.stderr)
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        serve(
+            root,
+            config_path,
+            socket_path=socket_path,
+            interval=args.interval,
+            stop=stop,
+            on_ready=lambda path: print(
+                f"[ai-clean] serving on {path}", file=sys.stderr, flush=True
+            ),
+        )
+    except KeyboardInterrupt:
+        return 0
+    except (RuntimeError, OSError, ValueError) as exc:
+        print(f"Failed to start daemon: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _run_list_command(args: argparse.Namespace) -> int:
+    if args.status and args.kind != "plans":
+        print("--status only applies to plans.", file=sys.stderr)
+        return 1
+    if (args.category or args.path) and args.kind != "findings":
+        print("--category and --path only apply to findings.", file=sys.stderr)
+        return 1
+
+    root = Path(args.root).expanduser().resolve()
+    try:
+        config = load_config(_resolve_config_path(root, args.config))
+    except Exception as exc:
+        print(f"Failed to load configuration: {exc}", file=sys.stderr)
+        return 1
+
+    store = open_metadata_store(root, config)
+    try:
+        if args.kind == "plans":
+            statuses = store.plan_statuses()
+            for plan in store.list_plans(status=args.status):
+                status = statuses.get(plan.id, "planned")
+                if args.json:
+                    print(
+                        json.dumps({"status": status, **plan.model_dump(mode="json")})
+                    )
+                else:
+                    print(f"{plan.id} | {status} | {plan.finding_id} | {plan.title}")
+        elif args.kind == "results":
+            for result in store.list_results():
+                if args.json:
+                    print(result.to_json(indent=None))
+                else:
+                    print(
+                        f"{result.plan_id} | success={result.success} | "
+                        f"tests_passed={result.tests_passed}"
+                    )
+        else:
+            findings = store.list_findings(category=args.category, path=args.path)
+            for finding in findings:
+                if args.json:
+                    print(_finding_json_line(finding))
+                else:
+                    print(_format_finding_summary(finding))
+    except (OSError, ValueError) as exc:
+        print(f"Failed to read metadata: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        store.close()
+    return 0
+
+
+def _run_metadata_command(args: argparse.Namespace) -> int:
+    root = Path(args.root).expanduser().resolve()
+    try:
+        config = load_config(_resolve_config_path(root, args.config))
+    except Exception as exc:
+        print(f"Failed to load configuration: {exc}", file=sys.stderr)
+        return 1
+
+    layout_dir = Path(args.layout_dir).expanduser()
+    if not layout_dir.is_absolute():
+        layout_dir = root / layout_dir
+    layout_dir = layout_dir.resolve()
+    layout = FileMetadataStore(
+        layout_dir / "plans", layout_dir / "results", layout_dir / "findings.json"
+    )
+    store = open_metadata_store(root, config)
+    try:
+        if args.action == "export":
+            counts = copy_metadata(store, layout)
+        else:
+            counts = copy_metadata(layout, store)
+    except (OSError, ValueError) as exc:
+        print(f"Metadata {args.action} failed: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        store.close()
+
+    plans, results, findings = counts
+    verb = "Exported" if args.action == "export" else "Imported"
+    print(
+        f"{verb} {plans} plan(s), {results} result(s), and {findings} finding(s) "
+        f"({_display_path(layout_dir, root)})."
+    )
+    return 0
+
+
 def _load_findings_from_json(path: Path) -> list[Finding]:
-    payload = json.loads(path.read_text())
-    if not isinstance(payload, list):  # pragma: no cover - defensive
-        raise ValueError("Findings JSON must be an array of Finding objects")
-    return [Finding.model_validate(item) for item in payload]
+    if not path.is_file():
+        raise FileNotFoundError(path)
+    return FindingsJournal(path).load()
+
+
+def _load_plan_findings(
+    root: Path,
+    config_path: Path | None,
+    findings_path: Path,
+    args: argparse.Namespace,
+) -> list[Finding]:
+    # Without --findings-json, a SQLite store is the source of findings.
+    if args.findings_json is None:
+        config = load_config(config_path)
+        if config.metadata_store == "sqlite":
+            store = open_metadata_store(root, config)
+            try:
+                return store.list_findings()
+            finally:
+                store.close()
+    return _load_findings_from_json(findings_path)
 
 
-def _resolve_findings_path(root: Path, findings_arg: str | None) -> Path:
+def _resolve_findings_path(
+    root: Path, config_path: Path | None, findings_arg: str | None
+) -> Path:
     if findings_arg:
         return Path(findings_arg).expanduser().resolve()
-    return (root / ".ai-clean" / "findings.json").resolve()
+    # Default to where the file store keeps findings, as ``ingest`` writes them.
+    from ai_clean.metadata_stores import FINDINGS_FILENAME
+
+    try:
+        metadata_root, _, _, _ = resolve_metadata_paths(root, load_config(config_path))
+    except (FileNotFoundError, ValueError):  # reported when findings are loaded
+        return (root / ".ai-clean" / FINDINGS_FILENAME).resolve()
+    return metadata_root / FINDINGS_FILENAME
 
 
 def _run_plan_command(args: argparse.Namespace) -> int:
+    if args.plan_all == (args.finding_id is not None):
+        print("Pass either a finding_id or --all.", file=sys.stderr)
+        return 1
+    if args.categories and not args.plan_all:
+        print("--category requires --all.", file=sys.stderr)
+        return 1
+
     root = Path(args.root).expanduser().resolve()
     config_path = _resolve_config_path(root, args.config)
-    findings_path = _resolve_findings_path(root, args.findings_json)
+    findings_path = _resolve_findings_path(root, config_path, args.findings_json)
 
     try:
-        findings = _load_findings_from_json(findings_path)
+        findings = _load_plan_findings(root, config_path, findings_path, args)
     except FileNotFoundError:
         print(
             f"Failed to load findings JSON: {findings_path}",
@@ -857,6 +1584,9 @@ def _run_plan_command(args: argparse.Namespace) -> int:
         print(f"Unexpected error while loading findings: {exc}", file=sys.stderr)
         return 1
 
+    if args.plan_all:
+        return _plan_all_findings(root, config_path, findings, args)
+
     finding_id = args.finding_id
     target: Finding | None = None
     for item in findings:
@@ -883,21 +1613,71 @@ def _run_plan_command(args: argparse.Namespace) -> int:
         return 0
 
     for plan, path in sorted(plans_with_paths, key=lambda item: item[0].id):
-        steps_preview = ""
-        if plan.steps:
-            steps_preview = (
-                f"{len(plan.steps)} steps (first: {plan.steps[0].description})"
-            )
-        constraints_count = len(plan.constraints) if plan.constraints else 0
-        tests_count = len(plan.tests_to_run) if plan.tests_to_run else 0
-        print(
-            f"{plan.id} | {plan.title} | {plan.intent} | "
-            f"{steps_preview} | constraints={constraints_count}, "
-            f"tests_to_run={tests_count} | {path}"
-        )
+        _print_plan_summary(plan, path)
     return 0
 
 
+def _plan_all_findings(
+    root: Path,
+    config_path: Path | None,
+    findings: list[Finding],
+    args: argparse.Namespace,
+) -> int:
+    try:
+        config = load_config(config_path)
+    except FileNotFoundError as exc:
+        print(f"Failed to load configuration: {exc}", file=sys.stderr)
+        return 1
+
+    categories = set(args.categories or ())
+    selected = [
+        finding
+        for finding in findings
+        if not categories or finding.category in categories
+    ]
+    if not selected:
+        print("No findings matched.")
+        return 0
+
+    try:
+        results = plan_many(root, config, selected, jobs=args.jobs)
+    except Exception as exc:  # pragma: no cover - defensive
+        print(f"Unexpected error while creating plans: {exc}", file=sys.stderr)
+        return 1
+
+    plan_count = 0
+    failures = 0
+    for result in results:
+        if result.error is not None:
+            print(
+                f"Failed to create plan for {result.finding.id}: {result.error}",
+                file=sys.stderr,
+            )
+            failures += 1
+            continue
+        for plan, path in sorted(result.plans, key=lambda item: item[0].id):
+            _print_plan_summary(plan, path)
+            plan_count += 1
+    print(
+        f"Created {plan_count} plan(s) for {len(selected) - failures} of "
+        f"{len(selected)} finding(s)."
+    )
+    return 1 if failures else 0
+
+
+def _print_plan_summary(plan: CleanupPlan, path: Path) -> None:
+    steps_preview = ""
+    if plan.steps:
+        steps_preview = f"{len(plan.steps)} steps (first: {plan.steps[0]})"
+    constraints_count = len(plan.constraints) if plan.constraints else 0
+    tests_count = len(plan.tests_to_run) if plan.tests_to_run else 0
+    print(
+        f"{plan.id} | {plan.title} | {plan.intent} | "
+        f"{steps_preview} | constraints={constraints_count}, "
+        f"tests_to_run={tests_count} | {path}"
+    )
+
+
 def _finding_matches_path(
     root: Path, finding: Finding, path_filter: Path | None
 ) -> bool:
@@ -1195,6 +1975,29 @@ def _print_findings(findings: list[Finding], as_json: bool) -> int:
     return 0
 
 
+def _print_analysis_stats(stats: list[AnalyzerStats]) -> None:
+    print(
+        f"{'analyzer':<12} {'wall s':>8} {'cpu s':>8} {'files':>7} "
+        f"{'bytes':>12} {'asts':>6} {'findings':>8} {'peak MiB':>9}"
+    )
+    for entry in stats:
+        peak = (
+            "-"
+            if entry.peak_memory_bytes is None
+            else f"{entry.peak_memory_bytes / (1024 * 1024):.1f}"
+        )
+        print(
+            f"{entry.analyzer:<12} {entry.wall_seconds:>8.3f} "
+            f"{entry.cpu_seconds:>8.3f} {entry.files_scanned:>7} "
+            f"{entry.bytes_read:>12} {entry.asts_parsed:>6} "
+            f"{entry.findings:>8} {peak:>9}"
+        )
+    print(
+        "bytes and asts count each file once, under the first stage that reads "
+        "or parses it; later analyzers reuse the shared corpus."
+    )
+
+
 def _resolve_config_path(root: Path, config_arg: str | None) -> Path | None:
     if config_arg:
         return Path(config_arg).expanduser().resolve()
@@ -1202,17 +2005,28 @@ def _resolve_config_path(root: Path, config_arg: str | None) -> Path | None:
 
 
 def _load_execution_result(
-    results_dir: Path, plan_id: str
+    store: MetadataStore, plan_id: str
 ) -> tuple[ExecutionResult | None, str | None]:
-    path = (results_dir / f"{plan_id}.json").resolve()
-    if not path.is_file():
-        return None, "ExecutionResult not found; apply/test details unavailable."
     try:
-        return ExecutionResult.from_json(path.read_text()), None
+        return store.load_result(plan_id), None
+    except FileNotFoundError:
+        return None, "ExecutionResult not found; apply/test details unavailable."
     except Exception as exc:
         return None, f"ExecutionResult could not be parsed: {exc}"
 
 
+def _save_plans(
+    root: Path, config: AiCleanConfig, plans: list[CleanupPlan]
+) -> list[Path]:
+    if not plans:
+        return []
+    store = open_metadata_store(root, config)
+    try:
+        return store.save_plans(plans)
+    finally:
+        store.close()
+
+
 def _compose_review_diff(diff_text: str, spec_text: str | None) -> str:
     base = diff_text.strip() if diff_text else "(no diff available)"
     if spec_text:
@@ -1,31 +1,32 @@
-"""Helpers for applying a single CleanupPlan via ButlerSpec."""
+"""Helpers for applying CleanupPlans via ButlerSpec."""
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Tuple
 
 from ai_clean.config import load_config
-from ai_clean.factories import SpecBackendHandle, get_spec_backend
+from ai_clean.factories import SpecBackendHandle, get_batch_runner, get_spec_backend
 from ai_clean.git import ensure_on_refactor_branch
 from ai_clean.metadata import resolve_metadata_paths
-from ai_clean.models import CleanupPlan
+from ai_clean.metadata_stores import open_metadata_store
+from ai_clean.models import ExecutionResult
 from ai_clean.planners.limits import PlanLimitError, validate_plan_limits
-from ai_clean.plans import load_plan
 from ai_clean.spec_backends import ButlerSpecBackend
 
 
-def _load_plan_by_id(plan_id: str, root: Path | None = None) -> CleanupPlan:
-    return load_plan(plan_id, root=root)
-
-
 def apply_plan(root: Path, config_path: Path | None, plan_id: str) -> Tuple[str, str]:
     """Apply a single plan by ID and return the spec id and spec path."""
 
     config = load_config(config_path)
-    _, plans_dir, specs_dir, _ = resolve_metadata_paths(root, config)
+    _, _, specs_dir, _ = resolve_metadata_paths(root, config)
 
-    plan = _load_plan_by_id(plan_id, root=plans_dir.parent)
+    store = open_metadata_store(root, config)
+    try:
+        plan = store.load_plan(plan_id)
+    finally:
+        store.close()
     try:
         validate_plan_limits(plan, config.plan_limits)
     except PlanLimitError as exc:
@@ -46,4 +47,44 @@ def apply_plan(root: Path, config_path: Path | None, plan_id: str) -> Tuple[str,
     return spec.id, str(spec_path.resolve())
 
 
-__all__ = ["apply_plan"]
+def apply_batch(
+    root: Path,
+    config_path: Path | None,
+    batch_group: str,
+    *,
+    workers: int = 1,
+    on_result: Callable[[ExecutionResult], None] | None = None,
+) -> list[ExecutionResult]:
+    """Execute every spec in ``batch_group`` and persist each ExecutionResult.
+
+    Specs run through the configured executor inside per-target git worktrees
+    under ``<metadata root>/worktrees``; specs for different target files run
+    on up to ``workers`` threads. Results are saved and passed to
+    ``on_result`` as they finish.
+    """
+
+    config = load_config(config_path)
+    metadata_root, _, specs_dir, _ = resolve_metadata_paths(root, config)
+    store = open_metadata_store(root, config)
+    store_lock = threading.Lock()
+
+    def _record(result: ExecutionResult) -> None:
+        with store_lock:
+            store.save_results([result])
+        if on_result is not None:
+            on_result(result)
+
+    handle = get_batch_runner(
+        config,
+        root,
+        metadata_root / "worktrees",
+        workers=workers,
+        on_result=_record,
+    )
+    try:
+        return handle.runner.apply_batch(specs_dir, batch_group)
+    finally:
+        store.close()
+
+
+__all__ = ["apply_batch", "apply_plan"]
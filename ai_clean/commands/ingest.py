@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any
 
+from ai_clean.findings_journal import FindingsJournal
+from ai_clean.interfaces.store import MetadataStore
 from ai_clean.models import ExecutionResult, Finding, FindingLocation
 from ai_clean.results import load_execution_result, save_execution_result
 
@@ -216,24 +218,6 @@ def _validate_suggestions(
     return findings
 
 
-def _load_findings(path: Path) -> list[Finding]:
-    if not path.exists():
-        return []
-    try:
-        payload = json.loads(path.read_text())
-    except Exception as exc:  # pragma: no cover - defensive
-        raise IngestError(f"Failed to parse findings JSON: {exc}") from exc
-    if not isinstance(payload, list):
-        raise IngestError("Findings JSON must be an array")
-    return [Finding.model_validate(item) for item in payload]
-
-
-def _save_findings(path: Path, findings: Iterable[Finding]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    payload = [finding.model_dump(mode="json") for finding in findings]
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True))
-
-
 def ingest_codex_artifact(
     *,
     plan_id: str,
@@ -244,8 +228,13 @@ def ingest_codex_artifact(
     findings_path: Path | None = None,
     max_suggestions: int | None = None,
     max_suggestion_files: int | None = None,
+    store: MetadataStore | None = None,
 ) -> tuple[ExecutionResult, IngestSummary]:
-    """Ingest a Codex artifact and update the stored ExecutionResult."""
+    """Ingest a Codex artifact and update the stored ExecutionResult.
+
+    When ``store`` is given, the result is read from and written to it, and
+    suggestions go to its findings unless ``findings_path`` is set.
+    """
 
     artifact = _load_artifact(artifact_path)
     allowed_keys = {
@@ -294,7 +283,10 @@ def ingest_codex_artifact(
     if diff.strip() and not _is_unified_diff(diff):
         raise IngestError("Artifact diff must be a unified diff for a single file")
 
-    existing = load_execution_result(plan_id, results_dir)
+    if store is not None:
+        existing = store.load_result(plan_id)
+    else:
+        existing = load_execution_result(plan_id, results_dir)
 
     diff_present = bool(diff.strip())
     success, tests_passed = _derive_status(tests, diff_present)
@@ -320,7 +312,10 @@ def ingest_codex_artifact(
         }
     )
 
-    save_execution_result(updated, results_dir)
+    if store is not None:
+        store.save_results([updated])
+    else:
+        save_execution_result(updated, results_dir)
 
     suggestions_count = 0
     suggestions = artifact.get("suggestions")
@@ -331,9 +326,17 @@ def ingest_codex_artifact(
             max_files=max_suggestion_files,
             max_suggestions=max_suggestions,
         )
-        target_path = findings_path or (root / ".ai-clean" / "findings.json")
-        existing_findings = _load_findings(target_path)
-        existing_ids = {finding.id for finding in existing_findings}
+        target_path = findings_path
+        if target_path is None and store is None:
+            target_path = root / ".ai-clean" / "findings.json"
+        journal = FindingsJournal(target_path) if target_path is not None else None
+        try:
+            if journal is not None:
+                existing_ids = set(journal.ids())
+            else:
+                existing_ids = store.finding_ids()
+        except ValueError as exc:
+            raise IngestError(f"Failed to parse findings JSON: {exc}") from exc
         normalized: list[Finding] = []
         for finding in findings:
             candidate_id = finding.id
@@ -343,7 +346,10 @@ def ingest_codex_artifact(
                 candidate_id = f"{finding.id}-{counter}"
             normalized.append(finding.model_copy(update={"id": candidate_id}))
             existing_ids.add(candidate_id)
-        _save_findings(target_path, [*existing_findings, *normalized])
+        if journal is not None:
+            journal.append(normalized)
+        else:
+            store.save_findings(normalized)
         suggestions_count = len(normalized)
 
     added, removed = _diff_stats(diff) if diff_present else (0, 0)
@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
+import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Sequence
 
-from ai_clean.config import load_config
-from ai_clean.metadata import resolve_metadata_paths
+from ai_clean.config import AiCleanConfig, load_config
+from ai_clean.metadata_stores import open_metadata_store
 from ai_clean.models import CleanupPlan, Finding
 from ai_clean.planners.orchestrator import plan_from_finding
-from ai_clean.plans import save_plan
+
+LOGGER = logging.getLogger(__name__)
+
+_CHUNKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class PlannedFinding:
+    """Outcome of planning one finding in a batch."""
+
+    finding: Finding
+    plans: list[tuple[CleanupPlan, Path]] = field(default_factory=list)
+    error: Exception | None = None
 
 
 def run_plan_for_finding(
@@ -17,18 +35,85 @@ def run_plan_for_finding(
     """Create and persist cleanup plans for a single finding.
 
     This helper is intentionally simple: it loads configuration, delegates
-    to the planner orchestrator, and writes each resulting plan beneath the
-    `.ai-clean/plans/` directory rooted at ``root``.
+    to the planner orchestrator, and writes each resulting plan to the
+    configured metadata store for ``root``.
     """
 
     config = load_config(config_path)
-    _, plans_dir, _, _ = resolve_metadata_paths(root, config)
     plans = plan_from_finding(finding, config)
-    persisted: list[tuple[CleanupPlan, Path]] = []
-    for plan in plans:
-        plan_path = save_plan(plan, root=plans_dir.parent)
-        persisted.append((plan, plan_path))
-    return persisted
+    store = open_metadata_store(root, config)
+    try:
+        return list(zip(plans, store.save_plans(plans)))
+    finally:
+        store.close()
+
+
+def plan_many(
+    root: Path,
+    config: AiCleanConfig,
+    findings: Sequence[Finding],
+    *,
+    jobs: int = 1,
+) -> list[PlannedFinding]:
+    """Create and persist plans for ``findings`` with one loaded ``config``.
+
+    Results are returned in ``findings`` order. A finding whose planner raises
+    is reported through :attr:`PlannedFinding.error` instead of stopping the
+    batch. With ``jobs > 1`` planning runs in a process pool (falling back to
+    serial planning when the pool is unavailable); all plans are then written
+    to the metadata store in a single batch.
+    """
+
+    outcomes = _plan_parallel(config, findings, jobs) if jobs > 1 else None
+    if outcomes is None:
+        outcomes = [_plan_one(config, finding) for finding in findings]
+
+    planned = [plans for plans in outcomes if not isinstance(plans, Exception)]
+    store = open_metadata_store(root, config)
+    try:
+        paths = iter(store.save_plans([plan for plans in planned for plan in plans]))
+    finally:
+        store.close()
+    results: list[PlannedFinding] = []
+    for finding, outcome in zip(findings, outcomes):
+        if isinstance(outcome, Exception):
+            results.append(PlannedFinding(finding, error=outcome))
+            continue
+        results.append(
+            PlannedFinding(finding, [(plan, next(paths)) for plan in outcome])
+        )
+    return results
+
+
+def _plan_one(config: AiCleanConfig, finding: Finding) -> list[CleanupPlan] | Exception:
+    try:
+        return plan_from_finding(finding, config)
+    except Exception as exc:  # reported per finding by plan_many
+        return exc
+
+
+def _plan_chunk(
+    config: AiCleanConfig, findings: list[Finding]
+) -> list[list[CleanupPlan] | Exception]:
+    return [_plan_one(config, finding) for finding in findings]
+
+
+def _plan_parallel(
+    config: AiCleanConfig, findings: Sequence[Finding], jobs: int
+) -> list[list[CleanupPlan] | Exception] | None:
+    if len(findings) < 2:
+        return None
+    size = max(1, -(-len(findings) // (jobs * _CHUNKS_PER_WORKER)))
+    chunks = [
+        list(findings[index : index + size]) for index in range(0, len(findings), size)
+    ]
+    try:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+            futures = [pool.submit(_plan_chunk, config, chunk) for chunk in chunks]
+            return [outcome for future in futures for outcome in future.result()]
+    except (BrokenProcessPool, OSError, pickle.PicklingError) as exc:
+        LOGGER.warning("Parallel planning unavailable, planning serially: %s", exc)
+        return None
 
 
-__all__ = ["run_plan_for_finding"]
+__all__ = ["PlannedFinding", "plan_many", "run_plan_for_finding"]
@@ -44,6 +44,9 @@ class GitConfig:
 @dataclass(frozen=True)
 class TestsConfig:
     default_command: str
+    impact_selection: bool = False
+    impact_command: str = ""
+    coverage_json: str = ""
 
 
 @dataclass(frozen=True)
@@ -57,6 +60,8 @@ class DuplicateAnalyzerConfig:
     window_size: int
     min_occurrences: int
     ignore_dirs: tuple[str, ...]
+    mode: str = "lines"
+    max_memory_mb: int = 0
 
 
 @dataclass(frozen=True)
@@ -100,6 +105,16 @@ class AnalyzersConfig:
     docstring: DocstringAnalyzerConfig
     organize: OrganizeAnalyzerConfig
     advanced: AdvancedAnalyzerConfig
+    jobs: int = 1
+
+
+@dataclass(frozen=True)
+class PromptsConfig:
+    cache: bool = True
+    cache_ttl_seconds: int = 7 * 24 * 60 * 60
+    cache_max_entries: int = 1000
+    jobs: int = 4
+    retries: int = 2
 
 
 @dataclass(frozen=True)
@@ -115,11 +130,17 @@ class AiCleanConfig:
     plans_dir: Path
     specs_dir: Path
     results_dir: Path
+    metadata_store: str = "files"
+    prompts: PromptsConfig = PromptsConfig()
 
 
+_DEFAULT_METADATA_STORE = "files"
+_METADATA_STORES: tuple[str, ...] = ("files", "sqlite")
 _DEFAULT_DUPLICATE_WINDOW_SIZE = 5
 _DEFAULT_DUPLICATE_MIN_OCCURRENCES = 2
 _DEFAULT_DUPLICATE_IGNORE_DIRS: tuple[str, ...] = (".git", "__pycache__", ".venv")
+_DEFAULT_DUPLICATE_MODE = "lines"
+_DUPLICATE_MODES: tuple[str, ...] = ("lines", "tokens")
 _DEFAULT_STRUCTURE_MAX_FILE_LINES = 400
 _DEFAULT_STRUCTURE_MAX_FUNCTION_LINES = 60
 _DEFAULT_DOC_MIN_LENGTH = 32
@@ -129,6 +150,7 @@ _DEFAULT_DOC_IMPORTANT_ONLY = True
 _DEFAULT_ORGANIZE_MIN_GROUP = 2
 _DEFAULT_ORGANIZE_MAX_GROUP = 5
 _DEFAULT_ORGANIZE_MAX_GROUPS = 5
+_DEFAULT_ANALYZER_JOBS = 1
 _DEFAULT_ADV_MAX_FILES = 3
 _DEFAULT_ADV_MAX_SUGGESTIONS = 5
 _DEFAULT_ADV_PROMPT = (
@@ -236,6 +258,13 @@ def load_config(path: Path | None = None) -> AiCleanConfig:
     plans_dir = _resolve_path(metadata_section.get("plans_dir"), default_plan_dir)
     specs_dir = _resolve_path(metadata_section.get("specs_dir"), default_spec_dir)
     results_dir = _resolve_path(metadata_section.get("results_dir"), default_result_dir)
+    metadata_store = (
+        str(metadata_section.get("store", _DEFAULT_METADATA_STORE)).strip().lower()
+    )
+    if metadata_store not in _METADATA_STORES:
+        raise ValueError(
+            "metadata.store must be one of: " + ", ".join(_METADATA_STORES)
+        )
 
     spec_backend = SpecBackendConfig(
         type=spec_backend_section.get("type", "").strip(),
@@ -265,7 +294,17 @@ def load_config(path: Path | None = None) -> AiCleanConfig:
         base_branch=git_section.get("base_branch", ""),
         refactor_branch=git_section.get("refactor_branch", ""),
     )
-    tests = TestsConfig(default_command=tests_section.get("default_command", ""))
+    tests = TestsConfig(
+        default_command=tests_section.get("default_command", ""),
+        impact_selection=_coerce_bool(
+            tests_section.get("impact_selection"),
+            default=False,
+            field_name="impact_selection",
+            context="Tests",
+        ),
+        impact_command=str(tests_section.get("impact_command", "")),
+        coverage_json=str(tests_section.get("coverage_json", "")),
+    )
 
     max_files_per_plan = _coerce_int(
         plan_limits_section.get("max_files_per_plan"),
@@ -316,6 +355,23 @@ def load_config(path: Path | None = None) -> AiCleanConfig:
     else:
         ignore_dirs = _normalize_ignore_dirs(ignore_dirs_raw)
 
+    duplicate_mode = (
+        str(duplicate_section.get("mode", _DEFAULT_DUPLICATE_MODE)).strip().lower()
+    )
+    if duplicate_mode not in _DUPLICATE_MODES:
+        raise ValueError(
+            "Duplicate analyzer mode must be one of: " + ", ".join(_DUPLICATE_MODES)
+        )
+
+    duplicate_max_memory_mb = _coerce_int(
+        duplicate_section.get("max_memory_mb"),
+        default=0,
+        field_name="max_memory_mb",
+        context="Duplicate analyzer",
+    )
+    if duplicate_max_memory_mb < 0:
+        raise ValueError("Duplicate analyzer max_memory_mb must not be negative")
+
     structure_section = _extract_section(raw, "analyzers", "structure")
 
     max_file_lines = _coerce_int(
@@ -457,11 +513,27 @@ def load_config(path: Path | None = None) -> AiCleanConfig:
 
     advanced_ignore_dirs = _merge_ignore_dirs(advanced_section.get("ignore_dirs"))
 
+    prompts = _load_prompts_config(raw.get("prompts", {}))
+
+    analyzers_section = raw.get("analyzers", {})
+    if not isinstance(analyzers_section, dict):
+        analyzers_section = {}
+    jobs = _coerce_int(
+        analyzers_section.get("jobs"),
+        default=_DEFAULT_ANALYZER_JOBS,
+        field_name="jobs",
+        context="Analyzers",
+    )
+    if jobs < 1:
+        raise ValueError("Analyzers jobs must be at least 1")
+
     analyzers = AnalyzersConfig(
         duplicate=DuplicateAnalyzerConfig(
             window_size=window_size,
             min_occurrences=min_occurrences,
             ignore_dirs=ignore_dirs,
+            mode=duplicate_mode,
+            max_memory_mb=duplicate_max_memory_mb,
         ),
         structure=StructureAnalyzerConfig(
             max_file_lines=max_file_lines,
@@ -489,6 +561,7 @@ def load_config(path: Path | None = None) -> AiCleanConfig:
             temperature=temperature,
             ignore_dirs=advanced_ignore_dirs,
         ),
+        jobs=jobs,
     )
 
     return AiCleanConfig(
@@ -503,7 +576,54 @@ def load_config(path: Path | None = None) -> AiCleanConfig:
         plans_dir=plans_dir,
         specs_dir=specs_dir,
         results_dir=results_dir,
+        metadata_store=metadata_store,
+        prompts=prompts,
+    )
+
+
+def _load_prompts_config(section: Any) -> PromptsConfig:
+    if not isinstance(section, dict):
+        section = {}
+    defaults = PromptsConfig()
+    prompts = PromptsConfig(
+        cache=_coerce_bool(
+            section.get("cache"),
+            default=defaults.cache,
+            field_name="cache",
+            context="Prompts",
+        ),
+        cache_ttl_seconds=_coerce_int(
+            section.get("cache_ttl_seconds"),
+            default=defaults.cache_ttl_seconds,
+            field_name="cache_ttl_seconds",
+            context="Prompts",
+        ),
+        cache_max_entries=_coerce_int(
+            section.get("cache_max_entries"),
+            default=defaults.cache_max_entries,
+            field_name="cache_max_entries",
+            context="Prompts",
+        ),
+        jobs=_coerce_int(
+            section.get("jobs"),
+            default=defaults.jobs,
+            field_name="jobs",
+            context="Prompts",
+        ),
+        retries=_coerce_int(
+            section.get("retries"),
+            default=defaults.retries,
+            field_name="retries",
+            context="Prompts",
+        ),
     )
+    if prompts.cache_ttl_seconds < 0 or prompts.cache_max_entries < 1:
+        raise ValueError(
+            "Prompts cache_ttl_seconds must be >= 0 and cache_max_entries >= 1"
+        )
+    if prompts.jobs < 1 or prompts.retries < 0:
+        raise ValueError("Prompts jobs must be at least 1 and retries at least 0")
+    return prompts
 
 
 def _extract_section(raw: dict[str, Any], *path: str) -> dict[str, Any]:
@@ -643,5 +763,6 @@ __all__ = [
     "SpecBackendConfig",
     "TestsConfig",
     "PlanLimitsConfig",
+    "PromptsConfig",
     "load_config",
 ]
@@ -0,0 +1,365 @@
+"""Long-running analysis daemon for ``ai-clean serve``.
+
+The daemon keeps one :class:`~ai_clean.analyzers.corpus.SourceCorpus` for a
+repository in memory, so file contents, ASTs, and per-file analyzer results
+survive between queries. A background thread polls the tree for ``.py`` files
+whose ``mtime``/size changed (or that appeared or disappeared), drops just
+those files from the corpus, and re-runs the analysis so the next query is
+answered from memory. Every query also polls first, so answers never lag the
+files on disk.
+
+Clients talk to it over a Unix socket, one JSON request line and one JSON
+response line per connection. :func:`query_daemon` returns ``None`` whenever
+no matching daemon answers, and callers then analyze in-process as usual.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from ai_clean.analyzers.cache import AnalysisCache
+from ai_clean.analyzers.corpus import SourceCorpus
+from ai_clean.analyzers.docstrings import find_docstring_gaps
+from ai_clean.analyzers.orchestrator import (
+    analyze_repo,
+    open_analysis_cache,
+    prepare_corpus,
+    shared_ignore_dirs,
+)
+from ai_clean.analyzers.organize import propose_organize_groups
+from ai_clean.analyzers.walker import walk_python_files
+from ai_clean.config import load_config
+from ai_clean.models import Finding
+from ai_clean.paths import default_metadata_root
+
+LOGGER = logging.getLogger(__name__)
+
+SOCKET_NAME = "serve.sock"
+DISABLE_ENV = "AI_CLEAN_NO_DAEMON"
+QUERIES = ("analyze", "docstrings", "organize")
+
+_CLIENT_TIMEOUT_SECONDS = 30.0
+
+
+def default_socket_path(root: Path) -> Path:
+    """Return where the daemon for ``root`` listens.
+
+    The location does not depend on the configuration so clients can find the
+    daemon without loading it.
+    """
+
+    return root.resolve() / default_metadata_root() / SOCKET_NAME
+
+
+class TreeWatcher:
+    """Detect changed ``.py`` paths under ``root`` by polling ``stat``.
+
+    Paths match what :class:`SourceCorpus` discovers for the same
+    ``prune_dirs``: the walk skips those directories and git-ignored files.
+    """
+
+    def __init__(self, root: Path, prune_dirs: Iterable[str] = ()) -> None:
+        self.root = root
+        self.prune_dirs = frozenset(prune_dirs)
+        self._snapshot = self._scan()
+
+    def poll(self) -> set[str]:
+        """Return relative paths added, removed, or modified since last poll."""
+
+        current = self._scan()
+        previous = self._snapshot
+        self._snapshot = current
+        return {
+            path
+            for path in current.keys() | previous.keys()
+            if current.get(path) != previous.get(path)
+        }
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        found: dict[str, tuple[int, int]] = {}
+        walk = walk_python_files(self.root, prune_dirs=self.prune_dirs)
+        for relative in walk.files:
+            try:
+                stat = (self.root / relative).stat()
+            except OSError:
+                continue
+            found[relative.as_posix()] = (stat.st_mtime_ns, stat.st_size)
+        return found
+
+
+class AnalysisService:
+    """Warm analysis state for one repository and configuration."""
+
+    def __init__(self, root: Path, config_path: Path | None) -> None:
+        self.root = root.resolve()
+        self.config_path = config_path
+        self.config = load_config(config_path)
+        self.lock = threading.Lock()
+        self._config_stamp = self._stat_config()
+        self._watcher, self._corpus = self._open_tree()
+        self._results: dict[tuple[Any, ...], list[Finding]] = {}
+        self._warm(use_cache=True)
+
+    def matches(self, root: str, config_path: str | None) -> bool:
+        """Return whether a request for ``root``/``config_path`` belongs here."""
+
+        configured = str(self.config_path) if self.config_path else None
+        return Path(root).resolve() == self.root and config_path == configured
+
+    def refresh(self) -> set[str]:
+        """Apply tree and config changes; return the changed paths."""
+
+        changed = self._watcher.poll()
+        stamp = self._stat_config()
+        if stamp != self._config_stamp:
+            self._config_stamp = stamp
+            self.config = load_config(self.config_path)
+            self._watcher, self._corpus = self._open_tree()
+            self._results.clear()
+            return changed
+        if changed:
+            self._corpus.refresh(changed)
+            self._results.clear()
+        return changed
+
+    def query(
+        self, command: str, changed_files: list[str] | None = None
+    ) -> list[Finding]:
+        """Return findings for ``command`` (one of :data:`QUERIES`)."""
+
+        if command not in QUERIES:
+            raise ValueError(f"Unknown daemon query: {command}")
+        self.refresh()
+        key = (command, tuple(changed_files) if changed_files is not None else None)
+        if key not in self._results:
+            self._results[key] = self._run(command, changed_files)
+        return self._results[key]
+
+    def poll_forever(self, interval: float, stop: threading.Event) -> None:
+        """Refresh every ``interval`` seconds and re-warm after changes."""
+
+        while not stop.wait(interval):
+            try:
+                with self.lock:
+                    if self.refresh():
+                        self._warm(use_cache=False)
+            except Exception as exc:  # keep serving; the next query reports it
+                LOGGER.warning("Background refresh failed: %s", exc)
+
+    def _warm(self, *, use_cache: bool) -> None:
+        cache = open_analysis_cache(self.root, self.config) if use_cache else None
+        self._results[("analyze", None)] = self._run("analyze", None, cache=cache)
+
+    def _run(
+        self,
+        command: str,
+        changed_files: list[str] | None,
+        cache: AnalysisCache | None = None,
+    ) -> list[Finding]:
+        if command == "docstrings":
+            return find_docstring_gaps(
+                self.root, self.config.analyzers.docstring, corpus=self._corpus
+            )
+        if command == "organize":
+            return propose_organize_groups(
+                self.root, self.config.analyzers.organize, corpus=self._corpus
+            )
+        if cache is not None:
+            # Only the first run reads the on-disk cache; afterwards the warm
+            # corpus is the cache and rewriting the JSON file would dominate.
+            prepare_corpus(
+                self.root,
+                self._analyzer_settings(),
+                jobs=self.config.analyzers.jobs,
+                cache=cache,
+                corpus=self._corpus,
+            )
+        findings = analyze_repo(
+            self.root,
+            self.config_path,
+            use_cache=False,
+            changed_files=changed_files,
+            corpus=self._corpus,
+        )
+        if cache is not None:
+            cache.save(self._corpus)
+        return findings
+
+    def _analyzer_settings(self) -> list[tuple[str, object]]:
+        settings = self.config.analyzers
+        return [
+            ("duplicate", settings.duplicate),
+            ("structure", settings.structure),
+            ("docstrings", settings.docstring),
+            ("organize", settings.organize),
+        ]
+
+    def _open_tree(self) -> tuple[TreeWatcher, SourceCorpus]:
+        prune_dirs = shared_ignore_dirs(self._analyzer_settings())
+        return TreeWatcher(self.root, prune_dirs), SourceCorpus(self.root, prune_dirs)
+
+    def _stat_config(self) -> tuple[int, int] | None:
+        if self.config_path is None:
+            return None
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "AnalysisServer"
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            response = self.server.respond(request)
+        except Exception as exc:
+            response = {"ok": False, "error": str(exc)}
+        self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+class AnalysisServer(socketserver.UnixStreamServer):
+    """Unix-socket server answering queries from one :class:`AnalysisService`."""
+
+    def __init__(self, socket_path: Path, service: AnalysisService) -> None:
+        self.socket_path = socket_path
+        self.service = service
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if socket_path.exists():
+            if _ping(socket_path):
+                raise RuntimeError(f"A daemon is already listening on {socket_path}")
+            socket_path.unlink()
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def respond(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Return the JSON response for one decoded request."""
+
+        command = request.get("command")
+        if command == "ping":
+            return {"ok": True}
+        if not self.service.matches(request.get("root", ""), request.get("config")):
+            return {"ok": False, "error": "daemon serves a different root or config"}
+        with self.service.lock:
+            findings = self.service.query(command, request.get("changed_files"))
+        return {
+            "ok": True,
+            "findings": [finding.model_dump(mode="json") for finding in findings],
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def serve(
+    root: Path,
+    config_path: Path | None,
+    *,
+    socket_path: Path | None = None,
+    interval: float = 1.0,
+    on_ready: Callable[[Path], None] | None = None,
+    stop: threading.Event | None = None,
+) -> None:
+    """Warm up, then answer queries until ``stop`` is set or interrupted.
+
+    ``on_ready`` is called with the socket path once queries are accepted.
+    """
+
+    service = AnalysisService(root, config_path)
+    path = socket_path or default_socket_path(service.root)
+    stop = stop or threading.Event()
+    with AnalysisServer(path, service) as server:
+        poller = threading.Thread(
+            target=service.poll_forever, args=(interval, stop), daemon=True
+        )
+        poller.start()
+
+        def _shutdown_on_stop() -> None:
+            stop.wait()
+            server.shutdown()
+
+        threading.Thread(target=_shutdown_on_stop, daemon=True).start()
+        if on_ready is not None:
+            on_ready(path)
+        try:
+            server.serve_forever(poll_interval=0.1)
+        finally:
+            stop.set()
+
+
+def query_daemon(
+    command: str,
+    root: Path,
+    config_path: Path | None,
+    *,
+    changed_files: list[str] | None = None,
+    socket_path: Path | None = None,
+) -> list[Finding] | None:
+    """Ask a running daemon for findings; ``None`` means analyze locally.
+
+    Setting the ``AI_CLEAN_NO_DAEMON`` environment variable always returns
+    ``None``.
+    """
+
+    socket_path = socket_path or default_socket_path(root)
+    if os.environ.get(DISABLE_ENV) or not socket_path.exists():
+        return None
+    request = {
+        "command": command,
+        "root": str(root.resolve()),
+        "config": str(config_path) if config_path else None,
+        "changed_files": changed_files,
+    }
+    response = _exchange(socket_path, request)
+    if response is None or not response.get("ok"):
+        if response is not None:
+            LOGGER.info("Daemon declined query: %s", response.get("error"))
+        return None
+    return [Finding.model_validate(item) for item in response["findings"]]
+
+
+def _ping(socket_path: Path) -> bool:
+    response = _exchange(socket_path, {"command": "ping"}, timeout=1.0)
+    return bool(response and response.get("ok"))
+
+
+def _exchange(
+    socket_path: Path,
+    request: dict[str, Any],
+    timeout: float = _CLIENT_TIMEOUT_SECONDS,
+) -> dict[str, Any] | None:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(socket_path))
+            client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+            with client.makefile("rb") as stream:
+                line = stream.readline()
+    except OSError:
+        return None
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+__all__ = [
+    "AnalysisServer",
+    "AnalysisService",
+    "TreeWatcher",
+    "default_socket_path",
+    "query_daemon",
+    "serve",
+]
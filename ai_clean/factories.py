@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import hashlib
 import json
+import re
 import shlex
 import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Sequence
@@ -16,20 +19,32 @@ import yaml
 from ai_clean.config import (
     AiCleanConfig,
     ExecutorConfig,
+    GitConfig,
+    PromptsConfig,
     ReviewConfig,
     SpecBackendConfig,
     TestsConfig,
 )
+from ai_clean.git import add_worktree, worktree_diff
 from ai_clean.interfaces import (
+    BatchRunner,
     CodeExecutor,
     CodexPromptRunner,
     PromptAttachment,
+    ReviewContext,
     ReviewExecutor,
     SpecBackend,
     StructuredReview,
 )
 from ai_clean.models import CleanupPlan, ExecutionResult
+from ai_clean.prompt_runners import (
+    CachingPromptRunner,
+    PromptRequest,
+    PromptResponseCache,
+    run_prompts,
+)
 from ai_clean.spec_backends import ButlerSpecBackend
+from ai_clean.test_impact import TestImpactIndex
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from ai_clean.models import CleanupPlan
@@ -47,6 +62,12 @@ class ExecutorHandle:
     results_dir: Path
 
 
+@dataclass(frozen=True)
+class BatchRunnerHandle:
+    runner: BatchRunner
+    worktrees_dir: Path
+
+
 @dataclass(frozen=True)
 class ReviewExecutorHandle:
     reviewer: ReviewExecutor
@@ -78,15 +99,30 @@ class _CodexShellExecutor:
     def __init__(self, config: ExecutorConfig, tests_config: TestsConfig) -> None:
         self._config = config
         self._tests_config = tests_config
+        self._impact_indexes: dict[Path, TestImpactIndex] = {}
+        self._impact_lock = threading.Lock()
+
+    def apply_spec(
+        self,
+        spec_path: Path,
+        *,
+        workdir: Path | None = None,
+        impact_root: Path | None = None,
+    ) -> ExecutionResult:
+        """Apply one spec from ``workdir`` (default: the spec's directory).
+
+        ``impact_root`` names the checkout whose import graph selects impacted
+        tests; it defaults to the repository containing ``workdir``.
+        """
 
-    def apply_spec(self, spec_path: Path) -> ExecutionResult:
         resolved_path = self._normalize_spec_path(spec_path)
         initial_checksum = self._checksum(resolved_path)
         spec_id, plan_id = self._extract_spec_ids(resolved_path)
         command = self._build_command(resolved_path)
+        cwd = workdir if workdir is not None else resolved_path.parent
 
         try:
-            completed = self._run_apply(command, resolved_path)
+            completed = self._run_apply(command, cwd)
         except FileNotFoundError as exc:
             self._assert_unchanged(resolved_path, initial_checksum)
             raise FileNotFoundError(
@@ -120,9 +156,11 @@ class _CodexShellExecutor:
                     "reason": "no_test_command",
                 }
             else:
-                tests_passed, tests_metadata = self._run_tests(
-                    test_command, resolved_path
+                test_command, selection, test_cwd = self._select_tests(
+                    test_command, resolved_path, cwd, impact_root
                 )
+                tests_passed, tests_metadata = self._run_tests(test_command, test_cwd)
+                tests_metadata["selection"] = selection
 
         self._assert_unchanged(resolved_path, initial_checksum)
 
@@ -201,26 +239,74 @@ class _CodexShellExecutor:
             raise RuntimeError(f"Spec file was modified during execution: {spec_path}")
 
     def _run_apply(
-        self, command: list[str], spec_path: Path
+        self, command: list[str], cwd: Path
     ) -> subprocess.CompletedProcess[str]:
         return subprocess.run(
             command,
             capture_output=True,
             text=True,
-            cwd=spec_path.parent,
+            cwd=cwd,
             check=False,
             timeout=self._APPLY_TIMEOUT_SECONDS,
         )
 
-    def _run_tests(
-        self, command: str, spec_path: Path
-    ) -> tuple[bool, dict[str, object]]:
+    def _select_tests(
+        self, command: str, spec_path: Path, cwd: Path, impact_root: Path | None
+    ) -> tuple[str, dict[str, object], Path]:
+        """Narrow ``command`` to the tests impacted by the spec's target file.
+
+        Returns the command to run, a description of the selection, and the
+        directory to run it in. Selected test paths are relative to the
+        repository root, so a narrowed command runs there; otherwise
+        ``command`` runs unchanged in ``cwd``, as when the impact is unknown.
+        """
+
+        if not self._tests_config.impact_selection:
+            return command, {"mode": "full", "reason": "disabled"}, cwd
+        target = self._spec_target(spec_path)
+        repo_root = cwd if (cwd / ".git").exists() else _repository_root(cwd)
+        if target is None or repo_root is None:
+            return command, {"mode": "full", "reason": "target_unknown"}, cwd
+        selected = self._impact_index(impact_root or repo_root).select(target)
+        if selected is None:
+            selection = {"mode": "full", "reason": "no_mapping", "target": target}
+            return command, selection, cwd
+        joined = " ".join(shlex.quote(path) for path in selected)
+        template = self._tests_config.impact_command.strip()
+        narrowed = (
+            template.replace("{tests}", joined) if template else f"{command} {joined}"
+        )
+        selection = {"mode": "impact", "target": target, "tests": selected}
+        return narrowed, selection, repo_root
+
+    def _impact_index(self, root: Path) -> TestImpactIndex:
+        # Building the import graph walks and parses the whole tree, so each
+        # root is indexed once per executor rather than once per spec.
+        with self._impact_lock:
+            index = self._impact_indexes.get(root)
+            if index is None:
+                coverage = self._tests_config.coverage_json
+                index = TestImpactIndex(
+                    root, coverage_json=root / coverage if coverage else None
+                )
+                self._impact_indexes[root] = index
+            return index
+
+    def _spec_target(self, spec_path: Path) -> str | None:
+        try:
+            parsed = yaml.safe_load(spec_path.read_text())
+        except yaml.YAMLError:
+            return None
+        target = parsed.get("target_file") if isinstance(parsed, dict) else None
+        return str(target) if target else None
+
+    def _run_tests(self, command: str, cwd: Path) -> tuple[bool, dict[str, object]]:
         try:
             result = subprocess.run(
                 command,
                 capture_output=True,
                 text=True,
-                cwd=spec_path.parent,
+                cwd=cwd,
                 shell=True,
                 check=False,
                 timeout=self._TEST_TIMEOUT_SECONDS,
@@ -247,6 +333,150 @@ class _CodexShellExecutor:
         }
 
 
+def _repository_root(start: Path) -> Path | None:
+    for candidate in (start, *start.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+class _WorktreeBatchRunner:
+    """Apply a batch group's specs in parallel, one git worktree per target file.
+
+    Specs that share a ``target_file`` run one after another in the same
+    worktree; different targets run concurrently on up to ``workers`` threads.
+    Each worktree is checked out from ``base_branch`` on its own branch and
+    left in place so the resulting changes can be reviewed and merged. A
+    worktree or branch left by an earlier run is never replaced; its specs
+    fail with the conflict instead. Impacted tests are selected from one
+    import graph of ``repo_root`` shared by every worktree.
+    """
+
+    def __init__(
+        self,
+        executor: _CodexShellExecutor,
+        git_config: GitConfig,
+        repo_root: Path,
+        worktrees_dir: Path,
+        workers: int,
+        on_result: Callable[[ExecutionResult], None] | None = None,
+    ) -> None:
+        self._executor = executor
+        self._git_config = git_config
+        self._repo_root = repo_root
+        self._worktrees_dir = worktrees_dir
+        self._workers = max(1, workers)
+        self._on_result = on_result
+        self._lock = threading.Lock()
+        self._git_lock = threading.Lock()
+        self._results: list[ExecutionResult] = []
+
+    def apply_batch(self, spec_dir: Path, batch_group: str) -> list[ExecutionResult]:
+        queues = self._queues(spec_dir, batch_group)
+        self._results = []
+        with ThreadPoolExecutor(max_workers=self._workers) as pool:
+            futures = [
+                pool.submit(self._run_queue, target, specs)
+                for target, specs in queues.items()
+            ]
+            for future in futures:
+                future.result()
+        return list(self._results)
+
+    def _queues(
+        self, spec_dir: Path, batch_group: str
+    ) -> dict[str, list[tuple[Path, str, str]]]:
+        queues: dict[str, list[tuple[Path, str, str]]] = {}
+        for spec_path in sorted(spec_dir.glob("*.butler.yaml")):
+            try:
+                parsed = yaml.safe_load(spec_path.read_text())
+            except yaml.YAMLError as exc:
+                raise ValueError(f"Unable to parse spec YAML: {spec_path}") from exc
+            if not isinstance(parsed, dict) or parsed.get("batch_group") != batch_group:
+                continue
+            spec_id = str(parsed.get("id") or spec_path.name[: -len(".butler.yaml")])
+            target = str(parsed.get("target_file") or spec_id)
+            queues.setdefault(target, []).append(
+                (spec_path, spec_id, str(parsed.get("plan_id") or ""))
+            )
+        return queues
+
+    def _run_queue(self, target: str, specs: list[tuple[Path, str, str]]) -> None:
+        # The hash keeps targets that sanitize alike (pkg/a.py, pkg-a.py) apart.
+        readable = re.sub(r"[^A-Za-z0-9._-]+", "-", target).strip("-.") or "target"
+        slug = f"{readable}-{hashlib.sha1(target.encode('utf-8')).hexdigest()[:8]}"
+        worktree = self._worktrees_dir / slug
+        branch = f"{self._git_config.refactor_branch}-{slug}"
+        batch_metadata: dict[str, object] = {
+            "worktree": str(worktree),
+            "branch": branch,
+            "target_file": target,
+        }
+        try:
+            # Worktree creation touches shared repository metadata; serialize it.
+            with self._git_lock:
+                add_worktree(
+                    self._repo_root, worktree, branch, self._git_config.base_branch
+                )
+        except (subprocess.CalledProcessError, OSError) as exc:
+            detail = getattr(exc, "stderr", None) or str(exc)
+            for _, spec_id, plan_id in specs:
+                self._emit(
+                    self._failure(
+                        spec_id, plan_id, f"worktree setup failed: {detail}", {}
+                    )
+                )
+            return
+
+        for spec_path, spec_id, plan_id in specs:
+            try:
+                result = self._executor.apply_spec(
+                    spec_path, workdir=worktree, impact_root=self._repo_root
+                )
+            except Exception as exc:  # one bad spec must not abort the batch
+                result = self._failure(spec_id, plan_id, str(exc), batch_metadata)
+                self._emit(result)
+                continue
+            try:
+                diff = worktree_diff(worktree)
+            except (subprocess.CalledProcessError, OSError):
+                diff = ""
+            self._emit(
+                result.model_copy(
+                    update={
+                        "git_diff": diff or None,
+                        "metadata": {**result.metadata, "batch": batch_metadata},
+                    }
+                )
+            )
+
+    def _failure(
+        self,
+        spec_id: str,
+        plan_id: str,
+        error: str,
+        batch_metadata: dict[str, object],
+    ) -> ExecutionResult:
+        metadata: dict[str, object] = {"error": error}
+        if batch_metadata:
+            metadata["batch"] = batch_metadata
+        return ExecutionResult(
+            spec_id=spec_id,
+            plan_id=plan_id,
+            success=False,
+            tests_passed=None,
+            stdout="",
+            stderr=error,
+            metadata=metadata,
+        )
+
+    def _emit(self, result: ExecutionResult) -> None:
+        with self._lock:
+            self._results.append(result)
+            if self._on_result is not None:
+                self._on_result(result)
+
+
 class _CodexReviewExecutor:
     """Codex-powered review executor that emits advisory-only feedback."""
 
@@ -255,10 +485,12 @@ class _CodexReviewExecutor:
         config: ReviewConfig,
         metadata_root: Path,
         prompt_runner: CodexPromptRunner,
+        prompts: PromptsConfig | None = None,
     ) -> None:
         self._config = config
         self._metadata_root = Path(metadata_root)
         self._prompt_runner = prompt_runner
+        self._prompts = prompts or PromptsConfig()
 
     def review_change(
         self,
@@ -274,10 +506,65 @@ class _CodexReviewExecutor:
         prompt = self._build_prompt(resolved_plan, diff, exec_result)
         try:
             output = self._prompt_runner.run(prompt, [])
-            exit_code = 0
         except Exception as exc:
             raise RuntimeError(f"Codex review invocation failed: {exc}") from exc
+        return self._finish_review(resolved_plan, diff, exec_result, prompt, output)
+
+    def review_changes(
+        self, contexts: Sequence[ReviewContext]
+    ) -> list[StructuredReview | Exception]:
+        """Review many changes concurrently; results follow ``contexts`` order.
+
+        Prompts run through :func:`run_prompts` with the configured ``jobs``
+        and ``retries``. A change whose review fails gets its exception in
+        place of a review.
+        """
+
+        prompts: list[str | Exception] = []
+        for context in contexts:
+            try:
+                self._validate_execution_result(context.exec_result)
+                prompts.append(
+                    self._build_prompt(context.plan, context.diff, context.exec_result)
+                )
+            except Exception as exc:
+                prompts.append(exc)
+        outputs = run_prompts(
+            self._prompt_runner,
+            [PromptRequest(prompt) for prompt in prompts if isinstance(prompt, str)],
+            jobs=self._prompts.jobs,
+            retries=self._prompts.retries,
+        )
+        output_iter = iter(outputs)
+        reviews: list[StructuredReview | Exception] = []
+        for context, prompt in zip(contexts, prompts):
+            if isinstance(prompt, Exception):
+                reviews.append(prompt)
+                continue
+            output = next(output_iter)
+            if isinstance(output, Exception):
+                reviews.append(
+                    RuntimeError(f"Codex review invocation failed: {output}")
+                )
+                continue
+            try:
+                reviews.append(
+                    self._finish_review(
+                        context.plan, context.diff, context.exec_result, prompt, output
+                    )
+                )
+            except Exception as exc:
+                reviews.append(exc)
+        return reviews
 
+    def _finish_review(
+        self,
+        resolved_plan: "CleanupPlan",
+        diff: str,
+        exec_result: ExecutionResult,
+        prompt: str,
+        output: str,
+    ) -> StructuredReview:
         self._assert_advisory_only(output)
         review_payload, review_metadata = self._normalize_review_output(output)
 
@@ -288,7 +575,7 @@ class _CodexReviewExecutor:
                 "diff_provided": bool(diff.strip()),
                 "spec_id": exec_result.spec_id,
             },
-            "exit_code": exit_code,
+            "exit_code": 0,
         }
         metadata.update(review_metadata)
 
@@ -414,6 +701,8 @@ class _CodexReviewExecutor:
         return text[: limit - 3] + "..."
 
 
+PROMPT_CACHE_DIRNAME = "prompt-cache"
+
 BACKEND_BUILDERS: dict[str, Callable[[SpecBackendConfig], SpecBackend]] = {
     "butler": ButlerSpecBackend,
 }
@@ -444,6 +733,35 @@ def get_executor(config: AiCleanConfig) -> ExecutorHandle:
     return ExecutorHandle(executor=executor, results_dir=config.executor.results_dir)
 
 
+def get_batch_runner(
+    config: AiCleanConfig,
+    repo_root: Path,
+    worktrees_dir: Path,
+    *,
+    workers: int = 1,
+    on_result: Callable[[ExecutionResult], None] | None = None,
+) -> BatchRunnerHandle:
+    """Return a worktree-isolated batch runner around the configured executor.
+
+    Worktrees are created under ``worktrees_dir``. ``on_result`` is called
+    (serialized across workers) as each spec finishes.
+    """
+
+    executor_handle = get_executor(config)
+    executor = executor_handle.executor
+    if not isinstance(executor, _CodexShellExecutor):  # pragma: no cover - defensive
+        raise ValueError("Batch apply requires the codex_shell executor.")
+    runner = _WorktreeBatchRunner(
+        executor,
+        config.git,
+        repo_root,
+        worktrees_dir,
+        workers,
+        on_result=on_result,
+    )
+    return BatchRunnerHandle(runner=runner, worktrees_dir=worktrees_dir)
+
+
 def get_review_executor(config: AiCleanConfig) -> ReviewExecutorHandle:
     review_type = (config.review.type or "").strip().lower()
     if review_type != "codex_review":
@@ -452,20 +770,37 @@ def get_review_executor(config: AiCleanConfig) -> ReviewExecutorHandle:
             "Supported review executors: codex_review"
         )
     reviewer = _CodexReviewExecutor(
-        config.review, config.metadata_root, get_codex_prompt_runner(config)
+        config.review,
+        config.metadata_root,
+        get_codex_prompt_runner(config),
+        config.prompts,
     )
     return ReviewExecutorHandle(reviewer=reviewer, metadata_root=config.metadata_root)
 
 
 def get_codex_prompt_runner(config: AiCleanConfig) -> CodexPromptRunner:
-    _ = config  # placeholder until advanced analyzer wiring uses model settings
-    return _CodexPromptRunner()
+    """Return the Codex prompt runner, behind the response cache when enabled."""
+
+    runner = _CodexPromptRunner()
+    if not config.prompts.cache:
+        return runner
+    cache = PromptResponseCache(
+        config.metadata_root / PROMPT_CACHE_DIRNAME,
+        ttl_seconds=config.prompts.cache_ttl_seconds,
+        max_entries=config.prompts.cache_max_entries,
+    )
+    # Advanced-analyzer answers depend on the model, so it scopes the cache.
+    return CachingPromptRunner(
+        runner, cache, namespace=config.analyzers.advanced.codex_model
+    )
 
 
 __all__ = [
+    "BatchRunnerHandle",
     "ExecutorHandle",
     "ReviewExecutorHandle",
     "SpecBackendHandle",
+    "get_batch_runner",
     "get_executor",
     "get_review_executor",
     "get_spec_backend",
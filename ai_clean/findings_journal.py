@@ -0,0 +1,145 @@
+"""Append-only storage for Finding objects next to ``findings.json``.
+
+``findings.json`` stays the snapshot (and the format other tools read). New or
+updated findings are appended to ``findings.journal.ndjson``, one JSON object
+per line, and their IDs to ``findings.ids`` so collision checks never parse
+findings. Reading replays the journal over the snapshot, later entries winning.
+Once the journal is as large as the snapshot it is folded back in, so the cost
+of rewriting the snapshot is amortized over the appends that grew it. A
+journal or ID index older than the snapshot is ignored: the snapshot was
+rewritten by something else (for example ``analyze --json > findings.json``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from ai_clean.models import Finding
+
+JOURNAL_SUFFIX = ".journal.ndjson"
+IDS_SUFFIX = ".ids"
+
+
+class FindingsJournal:
+    """Findings stored as ``path`` plus an append-only journal beside it."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.journal_path = path.with_suffix(JOURNAL_SUFFIX)
+        self.ids_path = path.with_suffix(IDS_SUFFIX)
+        self._ids: set[str] | None = None
+
+    def load(self) -> list[Finding]:
+        """Return all findings: snapshot order first, then new journal IDs."""
+
+        merged = {finding.id: finding for finding in self._read_snapshot()}
+        merged.update((finding.id, finding) for finding in self._read_journal())
+        return list(merged.values())
+
+    def ids(self) -> set[str]:
+        """Return every stored finding ID without parsing the findings."""
+
+        if self._ids is None:
+            if self._fresh(self.ids_path):
+                self._ids = set(self.ids_path.read_text(encoding="utf-8").split())
+            else:
+                self._ids = {finding.id for finding in self.load()}
+                self._write_ids(self._ids)
+        return self._ids
+
+    def append(self, findings: Sequence[Finding]) -> None:
+        """Add or update ``findings``; cost grows with ``findings`` only."""
+
+        if not findings:
+            return
+        ids = self.ids()
+        if not self.path.exists():
+            # Nothing to replay against: the new findings are the snapshot.
+            self._write_snapshot(findings)
+        else:
+            mode = "a" if self._fresh(self.journal_path) else "w"
+            with self.journal_path.open(mode, encoding="utf-8") as handle:
+                handle.writelines(
+                    json.dumps(finding.model_dump(mode="json"), sort_keys=True) + "\n"
+                    for finding in findings
+                )
+        new_ids = [finding.id for finding in findings if finding.id not in ids]
+        if new_ids:
+            with self.ids_path.open("a", encoding="utf-8") as handle:
+                handle.writelines(f"{finding_id}\n" for finding_id in new_ids)
+            ids.update(new_ids)
+        if self._journal_size() >= _size(self.path):
+            self.compact()
+
+    def replace(self, findings: Iterable[Finding]) -> None:
+        """Overwrite every stored finding with ``findings``."""
+
+        findings = list(findings)
+        self._write_snapshot(findings)
+        self.journal_path.unlink(missing_ok=True)
+        self._ids = {finding.id for finding in findings}
+        self._write_ids(self._ids)
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot and drop the journal."""
+
+        self.replace(self.load())
+
+    def _read_snapshot(self) -> list[Finding]:
+        if not self.path.is_file():
+            return []
+        payload = json.loads(self.path.read_text(encoding="utf-8"))
+        if not isinstance(payload, list):
+            raise ValueError(f"Findings JSON must be an array: {self.path}")
+        return [Finding.model_validate(item) for item in payload]
+
+    def _read_journal(self) -> list[Finding]:
+        if not self._fresh(self.journal_path):
+            return []
+        with self.journal_path.open(encoding="utf-8") as handle:
+            # A torn final line from an interrupted append is skipped.
+            return [
+                Finding.model_validate_json(line)
+                for line in handle
+                if line.endswith("\n") and line.strip()
+            ]
+
+    def _journal_size(self) -> int:
+        return _size(self.journal_path) if self._fresh(self.journal_path) else 0
+
+    def _fresh(self, path: Path) -> bool:
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        try:
+            return mtime >= self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return True
+
+    def _write_snapshot(self, findings: Iterable[Finding]) -> None:
+        payload = [finding.model_dump(mode="json") for finding in findings]
+        _atomic_write(self.path, json.dumps(payload, indent=2, sort_keys=True))
+
+    def _write_ids(self, ids: Iterable[str]) -> None:
+        _atomic_write(self.ids_path, "".join(f"{item}\n" for item in sorted(ids)))
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+__all__ = ["FindingsJournal"]
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import subprocess
+from pathlib import Path
 from typing import List
 
 
 def _run_git(
-    args: List[str], *, check: bool = True
+    args: List[str], *, check: bool = True, cwd: Path | None = None
 ) -> subprocess.CompletedProcess[str]:
     """Run a git command with text output and optional checking."""
 
@@ -16,6 +17,7 @@ def _run_git(
         check=check,
         capture_output=True,
         text=True,
+        cwd=cwd,
     )
 
 
@@ -64,4 +66,82 @@ def get_diff_stat() -> str:
     return result.stdout.strip()
 
 
-__all__ = ["current_branch", "ensure_on_refactor_branch", "get_diff_stat"]
+def changed_files(root: Path, since: str = "HEAD") -> list[str]:
+    """Return files under ``root`` that differ from ``since`` or are untracked.
+
+    Paths are POSIX strings relative to ``root``. The comparison covers
+    committed, staged, and unstaged changes since ``since``; deleted files are
+    included and simply will not exist on disk.
+    """
+
+    # -z keeps unusual names verbatim instead of C-quoting them.
+    diff = _run_git(["diff", "--name-only", "-z", "--relative", since, "--"], cwd=root)
+    untracked = _run_git(["ls-files", "-z", "--others", "--exclude-standard"], cwd=root)
+    names = {
+        name
+        for output in (diff.stdout, untracked.stdout)
+        for name in output.split("\0")
+        if name
+    }
+    return sorted(names)
+
+
+def list_files(root: Path, pathspecs: List[str]) -> list[str]:
+    """Return tracked and untracked, non-ignored files under ``root``.
+
+    Paths are POSIX strings relative to ``root``, limited to ``pathspecs``.
+    Raises ``CalledProcessError`` when ``root`` is not inside a work tree.
+    """
+
+    result = _run_git(
+        [
+            "ls-files",
+            "-z",
+            "--cached",
+            "--others",
+            "--exclude-standard",
+            "--",
+            *pathspecs,
+        ],
+        cwd=root,
+    )
+    return [name for name in result.stdout.split("\0") if name]
+
+
+def add_worktree(repo_root: Path, path: Path, branch: str, base: str) -> None:
+    """Create a worktree at ``path`` on a new ``branch`` started from ``base``.
+
+    Raises ``FileExistsError`` when ``path`` or ``branch`` already exists, so
+    uncommitted work or commits left by an earlier run are never discarded.
+    """
+
+    if path.exists():
+        raise FileExistsError(f"worktree path already exists: {path}")
+    existing = _run_git(
+        ["rev-parse", "--verify", "--quiet", f"refs/heads/{branch}"],
+        check=False,
+        cwd=repo_root,
+    )
+    if existing.returncode == 0:
+        raise FileExistsError(f"branch already exists: {branch}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _run_git(["worktree", "add", "-b", branch, str(path), base], cwd=repo_root)
+
+
+def worktree_diff(path: Path) -> str:
+    """Return the uncommitted diff of the worktree at ``path``, new files included."""
+
+    _run_git(["add", "--all", "--intent-to-add"], cwd=path)
+    result = _run_git(["diff"], cwd=path)
+    return result.stdout
+
+
+__all__ = [
+    "add_worktree",
+    "changed_files",
+    "current_branch",
+    "ensure_on_refactor_branch",
+    "get_diff_stat",
+    "list_files",
+    "worktree_diff",
+]
@@ -4,19 +4,52 @@ These contracts describe how planners, spec backends, and executors communicate
 without importing Codex or other heavy dependencies.
 """
 
-from .codex import CodexPromptRunner, PromptAttachment
-from .executor import BatchRunner, CodeExecutor, ReviewContext, ReviewExecutor
-from .spec_backend import BaseSpecBackend, SpecBackend
-from .types import StructuredReview
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only
+    from .codex import CodexPromptRunner, PromptAttachment
+    from .executor import BatchRunner, CodeExecutor, ReviewContext, ReviewExecutor
+    from .spec_backend import BaseSpecBackend, SpecBackend
+    from .store import MetadataStore
+    from .types import StructuredReview
 
 __all__ = [
     "BaseSpecBackend",
     "BatchRunner",
     "CodeExecutor",
     "CodexPromptRunner",
+    "MetadataStore",
     "ReviewContext",
     "ReviewExecutor",
     "SpecBackend",
     "StructuredReview",
     "PromptAttachment",
 ]
+
+# Resolved on first access so importing one submodule (the CLI only needs
+# ``interfaces.store``) does not define every dataclass contract up front.
+_LAZY_EXPORTS = {
+    "BaseSpecBackend": "spec_backend",
+    "BatchRunner": "executor",
+    "CodeExecutor": "executor",
+    "CodexPromptRunner": "codex",
+    "MetadataStore": "store",
+    "ReviewContext": "executor",
+    "ReviewExecutor": "executor",
+    "SpecBackend": "spec_backend",
+    "StructuredReview": "types",
+    "PromptAttachment": "codex",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,73 @@
+"""Contract for persisting plans, execution results, and findings.
+
+Implementations live in :mod:`ai_clean.metadata_stores`. Lookups of missing
+objects raise :class:`FileNotFoundError` so callers handle every backend the
+same way they already handle missing JSON files.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol, Sequence, runtime_checkable
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only
+    from ai_clean.models import CleanupPlan, ExecutionResult, Finding
+
+
+@runtime_checkable
+class MetadataStore(Protocol):
+    """Storage for ai-clean metadata objects."""
+
+    def save_plans(self, plans: Sequence["CleanupPlan"]) -> list[Path]:
+        """Persist ``plans`` in one batch and return where each one lives."""
+
+    def load_plan(self, plan_id: str) -> "CleanupPlan":
+        """Return the plan with ``plan_id``."""
+
+    def list_plans(self, *, status: str | None = None) -> list["CleanupPlan"]:
+        """Return plans sorted by ID, optionally filtered by :func:`plan_status`."""
+
+    def plan_statuses(self) -> dict[str, str]:
+        """Return ``{plan_id: status}`` for every stored plan."""
+
+    def save_results(self, results: Sequence["ExecutionResult"]) -> list[Path]:
+        """Persist execution results in one batch, replacing older ones."""
+
+    def load_result(self, plan_id: str) -> "ExecutionResult":
+        """Return the execution result recorded for ``plan_id``."""
+
+    def list_results(self) -> list["ExecutionResult"]:
+        """Return every execution result sorted by plan ID."""
+
+    def save_findings(
+        self, findings: Sequence["Finding"], *, replace: bool = False
+    ) -> None:
+        """Insert or update findings by ID; ``replace`` drops all others first."""
+
+    def list_findings(
+        self, *, category: str | None = None, path: str | None = None
+    ) -> list["Finding"]:
+        """Return findings sorted by ID, optionally filtered."""
+
+    def finding_ids(self) -> set[str]:
+        """Return the IDs of every stored finding."""
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+
+
+def plan_status(result: "ExecutionResult | None") -> str:
+    """Return ``planned``, ``manual``, ``applied``, or ``failed`` for a plan."""
+
+    if result is None:
+        return "planned"
+    if result.metadata.get("manual_execution_required"):
+        return "manual"
+    if result.success and result.tests_passed:
+        return "applied"
+    return "failed"
+
+
+PLAN_STATUSES = ("planned", "manual", "applied", "failed")
+
+__all__ = ["MetadataStore", "PLAN_STATUSES", "plan_status"]
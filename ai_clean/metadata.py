@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from ai_clean.config import AiCleanConfig
 from ai_clean.paths import (
     default_metadata_root,
     default_plan_path,
@@ -13,6 +13,9 @@ from ai_clean.paths import (
     default_spec_path,
 )
 
+if TYPE_CHECKING:  # pragma: no cover - type checking only
+    from ai_clean.config import AiCleanConfig
+
 
 def ensure_metadata_dirs(root: Path | None = None) -> Path:
     """Create metadata directories and return the resolved root path."""
@@ -0,0 +1,54 @@
+"""Metadata store implementations for ai-clean.
+
+``[metadata] store`` selects the backend: ``files`` (the default) keeps the
+JSON layout under the metadata root, ``sqlite`` keeps everything in
+``<metadata root>/metadata.db``. The JSON layout doubles as the export format
+for the SQLite store (see :func:`copy_metadata`).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from ai_clean.config import AiCleanConfig
+from ai_clean.interfaces.store import MetadataStore
+from ai_clean.metadata import resolve_metadata_paths
+
+from .files import FileMetadataStore
+from .sqlite import SqliteMetadataStore
+
+SQLITE_FILENAME = "metadata.db"
+FINDINGS_FILENAME = "findings.json"
+
+
+def open_metadata_store(root: Path, config: AiCleanConfig) -> MetadataStore:
+    """Open the store configured for the repository at ``root``."""
+
+    metadata_root, plans_dir, _, results_dir = resolve_metadata_paths(root, config)
+    if config.metadata_store == "sqlite":
+        return SqliteMetadataStore(metadata_root / SQLITE_FILENAME)
+    return FileMetadataStore(plans_dir, results_dir, metadata_root / FINDINGS_FILENAME)
+
+
+def copy_metadata(source: MetadataStore, target: MetadataStore) -> tuple[int, int, int]:
+    """Copy every plan, result, and finding; return the three counts.
+
+    Results are written after plans so stores that track plan status derive
+    it from the copied results.
+    """
+
+    plans = source.list_plans()
+    results = source.list_results()
+    findings = source.list_findings()
+    target.save_plans(plans)
+    target.save_results(results)
+    target.save_findings(findings)
+    return len(plans), len(results), len(findings)
+
+
+__all__ = [
+    "FileMetadataStore",
+    "SqliteMetadataStore",
+    "copy_metadata",
+    "open_metadata_store",
+]
@@ -0,0 +1,107 @@
+"""Metadata store backed by the JSON file layout under ``.ai-clean/``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Sequence
+
+from ai_clean.findings_journal import FindingsJournal
+from ai_clean.interfaces.store import plan_status
+from ai_clean.models import CleanupPlan, ExecutionResult, Finding
+from ai_clean.plans import load_plan, save_plans
+from ai_clean.results import load_execution_result, save_execution_result
+
+
+class FileMetadataStore:
+    """Store plans, results, and findings as one JSON document per object.
+
+    This is the historical layout: ``plans/<id>.json``, ``results/<plan_id>.json``
+    and a ``findings.json`` array with its append-only journal (see
+    :class:`~ai_clean.findings_journal.FindingsJournal`). Listing reads every
+    file, so it is the slow path on large metadata roots; see
+    ``SqliteMetadataStore``.
+    """
+
+    def __init__(self, plans_dir: Path, results_dir: Path, findings_path: Path):
+        self.plans_dir = plans_dir
+        self.results_dir = results_dir
+        self.findings_path = findings_path
+        self._findings = FindingsJournal(findings_path)
+
+    def save_plans(self, plans: Sequence[CleanupPlan]) -> list[Path]:
+        return save_plans(plans, root=self.plans_dir.parent)
+
+    def load_plan(self, plan_id: str) -> CleanupPlan:
+        return load_plan(plan_id, root=self.plans_dir.parent)
+
+    def list_plans(self, *, status: str | None = None) -> list[CleanupPlan]:
+        plans = [
+            CleanupPlan.from_json(path.read_text())
+            for path in _json_files(self.plans_dir)
+        ]
+        if status is not None:
+            statuses = self.plan_statuses()
+            plans = [plan for plan in plans if statuses.get(plan.id) == status]
+        return plans
+
+    def plan_statuses(self) -> dict[str, str]:
+        results = {result.plan_id: result for result in self.list_results()}
+        return {
+            path.stem: plan_status(results.get(path.stem))
+            for path in _json_files(self.plans_dir)
+        }
+
+    def save_results(self, results: Sequence[ExecutionResult]) -> list[Path]:
+        return [save_execution_result(result, self.results_dir) for result in results]
+
+    def load_result(self, plan_id: str) -> ExecutionResult:
+        return load_execution_result(plan_id, self.results_dir)
+
+    def list_results(self) -> list[ExecutionResult]:
+        return [
+            ExecutionResult.from_json(path.read_text())
+            for path in _json_files(self.results_dir)
+        ]
+
+    def save_findings(
+        self, findings: Sequence[Finding], *, replace: bool = False
+    ) -> None:
+        if replace:
+            self._findings.replace(findings)
+        else:
+            self._findings.append(findings)
+
+    def list_findings(
+        self, *, category: str | None = None, path: str | None = None
+    ) -> list[Finding]:
+        return sorted(
+            (
+                finding
+                for finding in self._findings.load()
+                if _matches(finding, category, path)
+            ),
+            key=lambda finding: finding.id,
+        )
+
+    def finding_ids(self) -> set[str]:
+        return set(self._findings.ids())
+
+    def close(self) -> None:
+        return None
+
+
+def _json_files(directory: Path) -> list[Path]:
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob("*.json"))
+
+
+def _matches(finding: Finding, category: str | None, path: str | None) -> bool:
+    if category is not None and finding.category != category:
+        return False
+    if path is not None:
+        return any(location.path.as_posix() == path for location in finding.locations)
+    return True
+
+
+__all__ = ["FileMetadataStore"]
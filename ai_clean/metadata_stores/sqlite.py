@@ -0,0 +1,182 @@
+"""Metadata store backed by a single SQLite database.
+
+Each object is stored as its JSON document next to the columns used for
+filtering (finding category and paths, plan status), all of which are
+indexed. The database runs in WAL mode so ``ai-clean list`` can read while a
+batch apply is writing results, and every ``save_*`` call is one transaction.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Sequence
+
+from ai_clean.interfaces.store import plan_status
+from ai_clean.models import CleanupPlan, ExecutionResult, Finding
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    id TEXT PRIMARY KEY,
+    finding_id TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'planned',
+    document TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS plans_status ON plans (status);
+CREATE INDEX IF NOT EXISTS plans_finding ON plans (finding_id);
+CREATE TABLE IF NOT EXISTS results (
+    plan_id TEXT PRIMARY KEY,
+    spec_id TEXT NOT NULL,
+    document TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    id TEXT PRIMARY KEY,
+    category TEXT NOT NULL,
+    document TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS findings_category ON findings (category);
+CREATE TABLE IF NOT EXISTS finding_paths (
+    finding_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (finding_id, path)
+);
+CREATE INDEX IF NOT EXISTS finding_paths_path ON finding_paths (path);
+"""
+
+
+class SqliteMetadataStore:
+    """Store plans, results, and findings in ``db_path``."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def save_plans(self, plans: Sequence[CleanupPlan]) -> list[Path]:
+        # Re-planning keeps the status recorded by an existing result.
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO plans (id, finding_id, status, document) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT (id) DO UPDATE SET "
+                "finding_id = excluded.finding_id, document = excluded.document",
+                [
+                    (plan.id, plan.finding_id, "planned", plan.to_json(indent=None))
+                    for plan in plans
+                ],
+            )
+        return [self._location("plans", plan.id) for plan in plans]
+
+    def load_plan(self, plan_id: str) -> CleanupPlan:
+        row = self._conn.execute(
+            "SELECT document FROM plans WHERE id = ?", (plan_id,)
+        ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"Plan not found in {self.db_path}: {plan_id}")
+        return CleanupPlan.from_json(row[0])
+
+    def list_plans(self, *, status: str | None = None) -> list[CleanupPlan]:
+        if status is None:
+            rows = self._conn.execute("SELECT document FROM plans ORDER BY id")
+        else:
+            rows = self._conn.execute(
+                "SELECT document FROM plans WHERE status = ? ORDER BY id", (status,)
+            )
+        return [CleanupPlan.from_json(document) for (document,) in rows]
+
+    def plan_statuses(self) -> dict[str, str]:
+        return dict(self._conn.execute("SELECT id, status FROM plans ORDER BY id"))
+
+    def save_results(self, results: Sequence[ExecutionResult]) -> list[Path]:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results (plan_id, spec_id, document) "
+                "VALUES (?, ?, ?)",
+                [
+                    (result.plan_id, result.spec_id, result.to_json(indent=None))
+                    for result in results
+                ],
+            )
+            self._conn.executemany(
+                "UPDATE plans SET status = ? WHERE id = ?",
+                [(plan_status(result), result.plan_id) for result in results],
+            )
+        return [self._location("results", result.plan_id) for result in results]
+
+    def load_result(self, plan_id: str) -> ExecutionResult:
+        row = self._conn.execute(
+            "SELECT document FROM results WHERE plan_id = ?", (plan_id,)
+        ).fetchone()
+        if row is None:
+            raise FileNotFoundError(
+                f"ExecutionResult not found in {self.db_path}: {plan_id}"
+            )
+        return ExecutionResult.from_json(row[0])
+
+    def list_results(self) -> list[ExecutionResult]:
+        rows = self._conn.execute("SELECT document FROM results ORDER BY plan_id")
+        return [ExecutionResult.from_json(document) for (document,) in rows]
+
+    def save_findings(
+        self, findings: Sequence[Finding], *, replace: bool = False
+    ) -> None:
+        with self._conn:
+            if replace:
+                self._conn.execute("DELETE FROM finding_paths")
+                self._conn.execute("DELETE FROM findings")
+            else:
+                self._conn.executemany(
+                    "DELETE FROM finding_paths WHERE finding_id = ?",
+                    [(finding.id,) for finding in findings],
+                )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO findings (id, category, document) "
+                "VALUES (?, ?, ?)",
+                [
+                    (finding.id, finding.category, finding.to_json(indent=None))
+                    for finding in findings
+                ],
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO finding_paths (finding_id, path) VALUES (?, ?)",
+                [
+                    (finding.id, location.path.as_posix())
+                    for finding in findings
+                    for location in finding.locations
+                ],
+            )
+
+    def list_findings(
+        self, *, category: str | None = None, path: str | None = None
+    ) -> list[Finding]:
+        query = "SELECT document FROM findings"
+        clauses: list[str] = []
+        params: list[str] = []
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(category)
+        if path is not None:
+            clauses.append(
+                "id IN (SELECT finding_id FROM finding_paths WHERE path = ?)"
+            )
+            params.append(path)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        rows = self._conn.execute(query + " ORDER BY id", params)
+        return [Finding.model_validate_json(document) for (document,) in rows]
+
+    def finding_ids(self) -> set[str]:
+        return {row[0] for row in self._conn.execute("SELECT id FROM findings")}
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _location(self, table: str, key: str) -> Path:
+        # Not a real file; identifies the row for messages such as "Plan saved".
+        return Path(f"{self.db_path}#{table}/{key}")
+
+
+__all__ = ["SqliteMetadataStore"]
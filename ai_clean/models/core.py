@@ -54,6 +54,28 @@ class SerializableModel(BaseModel):
 
         return json.dumps(self.model_dump(mode="json"), indent=indent)
 
+    @classmethod
+    def trusted(cls: type[ModelT], **values: Any) -> ModelT:
+        """Build an instance from values that already have the field types.
+
+        Validation is skipped entirely. ``benchmarks/bench_findings.py`` puts
+        this about 1.4x ahead of ``model_construct`` and about 10% ahead of
+        validating. It is meant for built-in analyzers that create many
+        findings from known-good data; anything read from JSON, YAML, or Codex
+        output must be validated. Unless the keywords are exactly the model's
+        fields, the values go through ``model_validate`` instead, so defaults
+        still apply and misspelled or unknown fields are rejected.
+        """
+
+        if values.keys() != cls.__pydantic_fields__.keys():
+            return cls.model_validate(values)
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
     @classmethod
     def from_json(cls, data: str) -> ModelT:
         """Deserialize an instance from a JSON string."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterable
 
 from ai_clean.models import CleanupPlan
 from ai_clean.paths import default_metadata_root
@@ -23,6 +24,19 @@ def save_plan(plan: CleanupPlan, root: Path | None = None) -> Path:
     return plan_path
 
 
+def save_plans(plans: Iterable[CleanupPlan], root: Path | None = None) -> list[Path]:
+    """Serialize several CleanupPlans, creating the plans directory once."""
+
+    plans_dir = _plans_root(root)
+    plans_dir.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    for plan in plans:
+        plan_path = plans_dir / f"{plan.id}.json"
+        plan_path.write_text(plan.to_json())
+        paths.append(plan_path)
+    return paths
+
+
 def load_plan(plan_id: str, root: Path | None = None) -> CleanupPlan:
     """Load a CleanupPlan from the metadata plans directory."""
 
@@ -32,4 +46,4 @@ def load_plan(plan_id: str, root: Path | None = None) -> CleanupPlan:
     return CleanupPlan.from_json(plan_path.read_text())
 
 
-__all__ = ["save_plan", "load_plan"]
+__all__ = ["save_plan", "save_plans", "load_plan"]
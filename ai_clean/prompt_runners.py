@@ -0,0 +1,232 @@
+"""Caching and concurrency around :class:`CodexPromptRunner` implementations.
+
+:class:`PromptResponseCache` stores responses on disk, content-addressed by
+:func:`prompt_cache_key` (the prompt plus every attachment's path and content
+hash). Entries expire after a TTL and the least recently used ones are evicted
+beyond ``max_entries``. :class:`CachingPromptRunner` puts that cache in front
+of any runner and collapses identical prompts that are in flight at the same
+time into one call, so re-reviewing an unchanged plan never reaches Codex.
+:func:`run_prompts` fans a batch of prompts out over a bounded thread pool
+with retries, running each distinct prompt once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+from ai_clean.interfaces.codex import CodexPromptRunner, PromptAttachment
+
+LOGGER = logging.getLogger(__name__)
+
+_ENTRY_SUFFIX = ".json"
+
+
+@dataclass(frozen=True)
+class PromptRequest:
+    """One prompt and its attachments, as passed to ``CodexPromptRunner.run``."""
+
+    prompt: str
+    attachments: tuple[PromptAttachment, ...] = ()
+
+
+def prompt_cache_key(
+    prompt: str, attachments: Sequence[PromptAttachment], namespace: str = ""
+) -> str:
+    """Return the SHA-256 hex key identifying a prompt and its attachments."""
+
+    digest = hashlib.sha256()
+    for part in (namespace, prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    for attachment in attachments:
+        content_hash = hashlib.sha256(attachment.content.encode("utf-8")).hexdigest()
+        digest.update(f"{Path(attachment.path).as_posix()}\0{content_hash}\0".encode())
+    return digest.hexdigest()
+
+
+class PromptResponseCache:
+    """Prompt responses stored as one JSON file per key under ``directory``.
+
+    An entry's ``mtime`` records its last use; reading an entry refreshes it,
+    and writing one evicts the least recently used entries past
+    ``max_entries``. Entries older than ``ttl_seconds`` (by creation time)
+    are treated as missing; ``ttl_seconds=0`` never expires them.
+    """
+
+    def __init__(
+        self, directory: Path, *, ttl_seconds: int = 0, max_entries: int = 1000
+    ) -> None:
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key``, or ``None``."""
+
+        path = self._path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            created = float(payload["created"])
+            response = payload["response"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not isinstance(response, str):
+            return None
+        if self.ttl_seconds and time.time() - created > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return response
+
+    def put(self, key: str, response: str) -> None:
+        """Store ``response`` under ``key`` and evict beyond ``max_entries``."""
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        payload = {"created": time.time(), "response": response}
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._evict()
+
+    def _evict(self) -> None:
+        entries: list[tuple[int, Path]] = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_ENTRY_SUFFIX) and not entry.name.startswith("."):
+                try:
+                    entries.append((entry.stat().st_mtime_ns, Path(entry.path)))
+                except OSError:
+                    continue
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        entries.sort()
+        for _, path in entries[:excess]:
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+
+class CachingPromptRunner:
+    """Answer prompts from a :class:`PromptResponseCache` before ``runner``.
+
+    ``namespace`` separates runners whose answers differ for the same prompt
+    (for example different models). Failures are never cached.
+    """
+
+    def __init__(
+        self,
+        runner: CodexPromptRunner,
+        cache: PromptResponseCache,
+        *,
+        namespace: str = "",
+    ) -> None:
+        self.runner = runner
+        self.cache = cache
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future[str]] = {}
+
+    def run(self, prompt: str, attachments: Sequence[PromptAttachment]) -> str:
+        key = prompt_cache_key(prompt, attachments, self.namespace)
+        cached = self.cache.get(key)
+        with self._lock:
+            if cached is not None:
+                self.hits += 1
+                return cached
+            pending = self._inflight.get(key)
+            if pending is None:
+                self.misses += 1
+                future: Future[str] = Future()
+                self._inflight[key] = future
+        if pending is not None:
+            return pending.result()
+
+        try:
+            response = self.runner.run(prompt, attachments)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(response)
+            try:
+                self.cache.put(key, response)
+            except OSError as exc:
+                LOGGER.warning("Could not cache prompt response %s: %s", key, exc)
+            return response
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+
+def run_prompts(
+    runner: CodexPromptRunner,
+    requests: Sequence[PromptRequest],
+    *,
+    jobs: int = 4,
+    retries: int = 2,
+    backoff_seconds: float = 1.0,
+) -> list[str | Exception]:
+    """Run ``requests`` with at most ``jobs`` in flight; results keep order.
+
+    Identical requests run once and share the response. A failing request is
+    retried ``retries`` times with exponential backoff; if it still fails its
+    slot holds the last exception instead of a response, so one bad prompt
+    does not sink the batch.
+    """
+
+    keys = [
+        prompt_cache_key(request.prompt, request.attachments) for request in requests
+    ]
+    unique = dict(zip(keys, requests))
+    if not unique:
+        return []
+
+    def _attempt(request: PromptRequest) -> str | Exception:
+        for attempt in range(retries + 1):
+            try:
+                return runner.run(request.prompt, request.attachments)
+            except Exception as exc:
+                if attempt == retries:
+                    return exc
+                LOGGER.warning(
+                    "Prompt failed (attempt %s of %s): %s",
+                    attempt + 1,
+                    retries + 1,
+                    exc,
+                )
+                time.sleep(backoff_seconds * 2**attempt)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(unique)))) as pool:
+        futures = {
+            key: pool.submit(_attempt, request) for key, request in unique.items()
+        }
+        outcomes = {key: future.result() for key, future in futures.items()}
+    return [outcomes[key] for key in keys]
+
+
+__all__ = [
+    "CachingPromptRunner",
+    "PromptRequest",
+    "PromptResponseCache",
+    "prompt_cache_key",
+    "run_prompts",
+]
@@ -0,0 +1,183 @@
+"""Select the tests affected by a change to one source file.
+
+The index maps every Python module under a repository root to the modules it
+imports (parsed with :mod:`ast` through the shared analyzer corpus) and walks
+that graph backwards from the changed file. Any test module that transitively
+imports it is selected. When a coverage.py JSON report with test contexts is
+available (``coverage json --show-contexts``), tests recorded as executing the
+changed file are added as well.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import logging
+import threading
+from collections import deque
+from pathlib import Path, PurePosixPath
+
+from ai_clean.analyzers.corpus import SourceCorpus, SourceFile
+
+LOGGER = logging.getLogger(__name__)
+
+_IGNORED_DIRS = frozenset({".git", ".ai-clean", ".venv", "venv", "__pycache__"})
+_SOURCE_PREFIXES = ("src/",)
+
+
+class TestImpactIndex:
+    """Reverse import graph of the Python modules under ``root``.
+
+    The graph is built on the first :meth:`select` and reused afterwards, also
+    across threads.
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, root: Path, coverage_json: Path | None = None) -> None:
+        self.root = root
+        self._coverage_json = coverage_json
+        self._modules: dict[str, str] = {}
+        self._importers: dict[str, set[str]] = {}
+        self._built = False
+        self._build_lock = threading.Lock()
+
+    def select(self, changed_file: str) -> list[str] | None:
+        """Return test files (POSIX, relative to ``root``) affected by the change.
+
+        Returns ``None`` when the impact is unknown: the file is not a module
+        in the index or no test could be linked to it. Callers should then run
+        the full test command.
+        """
+
+        self._build()
+        path = PurePosixPath(changed_file).as_posix()
+        selected: set[str] = set()
+        if _is_test_path(path) and path in self._modules.values():
+            selected.add(path)
+
+        module = _module_name(path)
+        if module is not None and module in self._modules:
+            seen = {module}
+            queue = deque([module])
+            while queue:
+                current = queue.popleft()
+                for importer in self._importers.get(current, ()):
+                    if importer not in seen:
+                        seen.add(importer)
+                        queue.append(importer)
+            selected.update(
+                self._modules[name]
+                for name in seen
+                if _is_test_path(self._modules[name])
+            )
+
+        selected.update(self._covering_tests(path))
+        return sorted(selected) or None
+
+    def _build(self) -> None:
+        with self._build_lock:
+            if not self._built:
+                self._build_graph()
+                self._built = True
+
+    def _build_graph(self) -> None:
+        # pytest collects git-ignored test files too, so the graph keeps them.
+        corpus = SourceCorpus(self.root, prune_dirs=_IGNORED_DIRS, gitignore=False)
+        sources = corpus.files()
+        for source in sources:
+            name = _module_name(source.relative_path.as_posix())
+            if name is not None:
+                self._modules[name] = source.relative_path.as_posix()
+        for source in sources:
+            importer = _module_name(source.relative_path.as_posix())
+            if importer is None:
+                continue
+            for imported in self._imports(source, importer):
+                self._importers.setdefault(imported, set()).add(importer)
+
+    def _imports(self, source: SourceFile, module: str) -> set[str]:
+        try:
+            tree = source.tree
+        except OSError:
+            return set()
+        if tree is None:
+            return set()
+        package = module.split(".")
+        if not source.relative_path.name == "__init__.py":
+            package = package[:-1]
+
+        found: set[str] = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    found.update(self._known_prefixes(alias.name))
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    anchor = package[: len(package) - (node.level - 1)]
+                    base = ".".join([*anchor, node.module] if node.module else anchor)
+                else:
+                    base = node.module or ""
+                if not base:
+                    continue
+                found.update(self._known_prefixes(base))
+                for alias in node.names:
+                    candidate = f"{base}.{alias.name}"
+                    if candidate in self._modules:
+                        found.add(candidate)
+        found.discard(module)
+        return found
+
+    def _known_prefixes(self, dotted: str) -> set[str]:
+        # Importing ``a.b.c`` executes ``a`` and ``a.b`` as well.
+        parts = dotted.split(".")
+        return {
+            name
+            for name in (".".join(parts[:index]) for index in range(1, len(parts) + 1))
+            if name in self._modules
+        }
+
+    def _covering_tests(self, path: str) -> set[str]:
+        if self._coverage_json is None or not self._coverage_json.is_file():
+            return set()
+        try:
+            payload = json.loads(self._coverage_json.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable coverage data: %s", exc)
+            return set()
+        files = payload.get("files", {}) if isinstance(payload, dict) else {}
+        entry = files.get(path) or files.get(str(self.root / path))
+        if not isinstance(entry, dict):
+            return set()
+        tests: set[str] = set()
+        for contexts in (entry.get("contexts") or {}).values():
+            for context in contexts:
+                test_file = context.split("::", 1)[0].split("|", 1)[0]
+                if test_file and _is_test_path(test_file):
+                    tests.add(PurePosixPath(test_file).as_posix())
+        return tests
+
+
+def _module_name(path: str) -> str | None:
+    if not path.endswith(".py"):
+        return None
+    for prefix in _SOURCE_PREFIXES:
+        if path.startswith(prefix):
+            path = path[len(prefix) :]
+            break
+    parts = path[: -len(".py")].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    if not parts or not all(part.isidentifier() for part in parts):
+        return None
+    return ".".join(parts)
+
+
+def _is_test_path(path: str) -> bool:
+    name = PurePosixPath(path).name
+    return name.endswith(".py") and (
+        name.startswith("test_") or name.endswith("_test.py")
+    )
+
+
+__all__ = ["TestImpactIndex"]
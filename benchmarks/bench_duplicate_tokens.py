@@ -0,0 +1,112 @@
+"""Benchmark the duplicate analyzer's ``tokens`` mode on a synthetic tree.
+
+Usage::
+
+    python benchmarks/bench_duplicate_tokens.py --lines 1000000 --jobs 8
+
+Generates ``--lines`` lines of Python spread across files of ``--file-lines``
+lines each, runs ``find_duplicate_blocks`` with ``mode = "tokens"``, and
+prints wall time and throughput. Exits with status 1 when the run exceeds
+``--budget`` seconds so the script can gate CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ai_clean.analyzers.duplicate import find_duplicate_blocks
+from ai_clean.analyzers.orchestrator import prepare_corpus
+from ai_clean.config import DuplicateAnalyzerConfig
+
+_TEMPLATES = (
+    "def {name}(items, limit={number}):\n"
+    '    """Process {name}."""\n'
+    "    total = 0\n"
+    "    for item in items:\n"
+    "        if item > limit:\n"
+    "            total += item * {number}\n"
+    "        else:\n"
+    '            total -= len(str(item)) + len("{word}")\n'
+    "    return total\n",
+    "class {title}:\n"
+    "    def __init__(self, value):\n"
+    "        self.value = value  # {word}\n"
+    "\n"
+    "    def scaled(self, factor={number}):\n"
+    "        return [self.value * factor for _ in range({number})]\n",
+    "{name} = {{\n"
+    '    "{word}": {number},\n'
+    '    "other": [{number}, {number}, {number}],\n'
+    "}}\n",
+)
+_WORDS = ("alpha", "beta", "gamma", "delta", "omega", "sigma", "kappa")
+
+
+def generate_tree(root: Path, total_lines: int, file_lines: int, seed: int) -> int:
+    """Write synthetic modules under ``root`` and return the line count."""
+
+    rng = random.Random(seed)
+    written = 0
+    index = 0
+    while written < total_lines:
+        chunks: list[str] = []
+        count = 0
+        while count < file_lines:
+            word = rng.choice(_WORDS)
+            chunk = rng.choice(_TEMPLATES).format(
+                name=f"{word}_{rng.randrange(10_000)}",
+                title=f"{word.title()}{rng.randrange(10_000)}",
+                word=word,
+                number=rng.randrange(1_000),
+            )
+            chunks.append(chunk + "\n")
+            count += chunk.count("\n") + 1
+        package = root / f"pkg_{index // 100}"
+        package.mkdir(exist_ok=True)
+        (package / f"module_{index}.py").write_text("".join(chunks))
+        written += count
+        index += 1
+    return written
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--file-lines", type=int, default=400)
+    parser.add_argument("--window-size", type=int, default=10)
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--budget", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    settings = DuplicateAnalyzerConfig(
+        window_size=args.window_size,
+        min_occurrences=2,
+        ignore_dirs=(),
+        mode="tokens",
+    )
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        total = generate_tree(root, args.lines, args.file_lines, args.seed)
+        started = time.perf_counter()
+        corpus = prepare_corpus(root, [("duplicate", settings)], jobs=args.jobs)
+        findings = find_duplicate_blocks(root, settings, corpus=corpus)
+        elapsed = time.perf_counter() - started
+
+    print(
+        f"lines={total} jobs={args.jobs} findings={len(findings)} "
+        f"seconds={elapsed:.2f} lines_per_second={total / elapsed:,.0f}"
+    )
+    if elapsed > args.budget:
+        print(f"over budget ({args.budget:.0f}s)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""Time each analyzer and ``analyze_repo`` on a synthetic repository.
+
+Usage::
+
+    python benchmarks/run_analyzers.py --files 500 --clone-density 0.2
+    python benchmarks/run_analyzers.py --output bench.json
+    python benchmarks/run_analyzers.py --baseline bench.json --tolerance 0.25
+
+The tree comes from :func:`synthetic.generate_repo`, and analyzer settings come
+from the repository's ``ai-clean.toml`` unless ``--config`` is given. Each
+benchmark runs ``--repeat`` times, each time in a fresh process with a cold
+corpus and no analysis cache, so the reported peak RSS belongs to that
+benchmark alone. With ``--baseline``, the script exits with status 1 when any
+benchmark's best time regresses by more than ``--tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import statistics
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic import RepoShape, generate_repo  # noqa: E402
+
+_DEFAULT_CONFIG = Path(__file__).resolve().parents[1] / "ai-clean.toml"
+BENCHMARKS = (
+    "find_duplicate_blocks",
+    "find_structure_issues",
+    "find_docstring_gaps",
+    "propose_organize_groups",
+    "analyze_repo",
+)
+
+
+def _run_once(name: str, root: str, config_path: str) -> dict[str, Any]:
+    """Run one benchmark in the current (fresh) process."""
+
+    from ai_clean.analyzers import (
+        analyze_repo,
+        find_docstring_gaps,
+        find_duplicate_blocks,
+        find_structure_issues,
+        propose_organize_groups,
+    )
+    from ai_clean.config import load_config
+
+    repo = Path(root)
+    analyzers = load_config(Path(config_path)).analyzers
+    calls = {
+        "find_duplicate_blocks": lambda: find_duplicate_blocks(
+            repo, analyzers.duplicate
+        ),
+        "find_structure_issues": lambda: find_structure_issues(
+            repo, analyzers.structure
+        ),
+        "find_docstring_gaps": lambda: find_docstring_gaps(repo, analyzers.docstring),
+        "propose_organize_groups": lambda: propose_organize_groups(
+            repo, analyzers.organize
+        ),
+        "analyze_repo": lambda: analyze_repo(
+            repo, Path(config_path), jobs=1, use_cache=False
+        ),
+    }
+    started = time.perf_counter()
+    findings = calls[name]()
+    elapsed = time.perf_counter() - started
+    return {"seconds": elapsed, "findings": len(findings), "peak_rss_kb": _peak_rss()}
+
+
+def _peak_rss() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_benchmark(
+    name: str, root: Path, config_path: Path, repeat: int
+) -> dict[str, Any]:
+    """Run ``name`` ``repeat`` times in fresh processes and summarize."""
+
+    context = multiprocessing.get_context("spawn")
+    runs = []
+    for _ in range(repeat):
+        with context.Pool(1) as pool:
+            runs.append(pool.apply(_run_once, (name, str(root), str(config_path))))
+    seconds = [run["seconds"] for run in runs]
+    peaks = [run["peak_rss_kb"] for run in runs if run["peak_rss_kb"] is not None]
+    return {
+        "best_seconds": min(seconds),
+        "median_seconds": statistics.median(seconds),
+        "findings": runs[-1]["findings"],
+        "peak_rss_kb": max(peaks) if peaks else None,
+    }
+
+
+def _regressions(
+    results: dict[str, dict[str, Any]], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    messages = []
+    for name, result in results.items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if previous is None:
+            continue
+        limit = previous["best_seconds"] * (1 + tolerance)
+        if result["best_seconds"] > limit:
+            messages.append(
+                f"{name}: {result['best_seconds']:.3f}s > "
+                f"{previous['best_seconds']:.3f}s + {tolerance:.0%}"
+            )
+    return messages
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=RepoShape.files)
+    parser.add_argument("--file-lines", type=int, default=RepoShape.file_lines)
+    parser.add_argument("--clone-density", type=float, default=RepoShape.clone_density)
+    parser.add_argument(
+        "--docstring-coverage", type=float, default=RepoShape.docstring_coverage
+    )
+    parser.add_argument("--nesting-depth", type=int, default=RepoShape.nesting_depth)
+    parser.add_argument("--seed", type=int, default=RepoShape.seed)
+    parser.add_argument("--config", type=Path, default=_DEFAULT_CONFIG)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--only", choices=BENCHMARKS, action="append", help="Run only these"
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare to")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    shape = RepoShape(
+        files=args.files,
+        file_lines=args.file_lines,
+        clone_density=args.clone_density,
+        docstring_coverage=args.docstring_coverage,
+        nesting_depth=args.nesting_depth,
+        seed=args.seed,
+    )
+    results: dict[str, dict[str, Any]] = {}
+    with TemporaryDirectory() as tmp:
+        repo = generate_repo(Path(tmp), shape)
+        print(
+            f"repo: files={repo.files} lines={repo.lines} "
+            f"functions={repo.functions} cloned={repo.cloned_functions}"
+        )
+        for name in args.only or BENCHMARKS:
+            result = run_benchmark(name, repo.root, args.config.resolve(), args.repeat)
+            results[name] = result
+            rss = result["peak_rss_kb"]
+            print(
+                f"{name:<24} best={result['best_seconds']:.3f}s "
+                f"median={result['median_seconds']:.3f}s "
+                f"findings={result['findings']} "
+                f"peak_rss={'n/a' if rss is None else f'{rss / 1024:.1f}MiB'}"
+            )
+
+    payload = {
+        "shape": {key: getattr(shape, key) for key in shape.__dataclass_fields__},
+        "lines": repo.lines,
+        "benchmarks": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = _regressions(results, baseline, args.tolerance)
+        for message in regressions:
+            print(f"regression: {message}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""Deterministic synthetic Python repositories for analyzer benchmarks.
+
+:func:`generate_repo` writes a package tree whose shape is controlled by a
+:class:`RepoShape`: file count and size, the share of functions copied from a
+shared pool of clones, the share of symbols with docstrings, and how deeply
+function bodies nest. The same shape and seed always produce byte-identical
+trees, so timings from different runs are comparable.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+_TOPICS = ("api", "auth", "billing", "cache", "events", "reports", "storage")
+_MODULES = ("json", "logging", "os", "re", "time", "typing", "collections")
+_WORDS = ("alpha", "beta", "gamma", "delta", "omega", "sigma", "kappa")
+_CLONE_POOL_SIZE = 8
+
+
+@dataclass(frozen=True)
+class RepoShape:
+    """Knobs for :func:`generate_repo`."""
+
+    files: int = 200
+    file_lines: int = 300
+    clone_density: float = 0.1
+    docstring_coverage: float = 0.5
+    nesting_depth: int = 3
+    files_per_package: int = 25
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class GeneratedRepo:
+    """Summary of a generated tree."""
+
+    root: Path
+    files: int
+    lines: int
+    functions: int
+    cloned_functions: int
+
+
+def generate_repo(root: Path, shape: RepoShape) -> GeneratedRepo:
+    """Write a synthetic package tree under ``root`` and describe it."""
+
+    rng = random.Random(shape.seed)
+    clone_rng = random.Random(shape.seed + 1)
+    clones = [
+        _function(clone_rng, f"shared_{index}", shape, with_docstring=False)
+        for index in range(_CLONE_POOL_SIZE)
+    ]
+
+    lines = functions = cloned = 0
+    for index in range(shape.files):
+        package = root / f"pkg_{index // shape.files_per_package}"
+        if not package.exists():
+            package.mkdir(parents=True)
+            (package / "__init__.py").write_text("")
+        topic = _TOPICS[index % len(_TOPICS)]
+        chunks = [_module_header(rng, topic, shape)]
+        count = chunks[0].count("\n")
+        while count < shape.file_lines:
+            if rng.random() < shape.clone_density:
+                chunk = rng.choice(clones)
+                cloned += 1
+            elif rng.random() < 0.2:
+                chunk = _class(rng, topic, shape)
+            else:
+                name = f"{topic}_{rng.choice(_WORDS)}_{rng.randrange(10_000)}"
+                chunk = _function(
+                    rng,
+                    name,
+                    shape,
+                    with_docstring=rng.random() < shape.docstring_coverage,
+                )
+            chunks.append("\n\n" + chunk)
+            count += chunk.count("\n") + 2
+            functions += 1
+        text = "".join(chunks)
+        (package / f"{topic}_{index}.py").write_text(text)
+        lines += text.count("\n")
+
+    return GeneratedRepo(
+        root=root,
+        files=shape.files,
+        lines=lines,
+        functions=functions,
+        cloned_functions=cloned,
+    )
+
+
+def _module_header(rng: random.Random, topic: str, shape: RepoShape) -> str:
+    header = ""
+    if rng.random() < shape.docstring_coverage:
+        header = f'"""Helpers for {topic} {rng.choice(_WORDS)} processing."""\n\n'
+    imports = sorted(rng.sample(_MODULES, 3))
+    return header + "".join(f"import {name}\n" for name in imports)
+
+
+def _function(
+    rng: random.Random, name: str, shape: RepoShape, *, with_docstring: bool
+) -> str:
+    lines = [f"def {name}(items, limit={rng.randrange(100)}):"]
+    if with_docstring:
+        lines.append(f'    """Return the {rng.choice(_WORDS)} total of ``items``."""')
+    lines.append("    total = 0")
+    lines.extend(_body(rng, depth=1, max_depth=shape.nesting_depth))
+    lines.append("    return total")
+    return "\n".join(lines) + "\n"
+
+
+def _body(rng: random.Random, depth: int, max_depth: int) -> list[str]:
+    indent = "    " * depth
+    lines: list[str] = []
+    for _ in range(rng.randint(2, 4)):
+        value = rng.randrange(1_000)
+        if depth < max_depth and rng.random() < 0.6:
+            header = rng.choice(
+                (
+                    "for item in items:",
+                    f"if total > {value}:",
+                    f"while total < {value}:",
+                )
+            )
+            lines.append(indent + header)
+            lines.extend(_body(rng, depth + 1, max_depth))
+            if header.startswith("while"):
+                lines.append(f"{indent}    break")
+        else:
+            lines.append(
+                indent
+                + rng.choice(
+                    (
+                        f"total += {value}",
+                        f"total -= len(str({value}))",
+                        f"total = max(total, limit * {value})",
+                        f'total += len("{rng.choice(_WORDS)}")',
+                    )
+                )
+            )
+    return lines
+
+
+def _class(rng: random.Random, topic: str, shape: RepoShape) -> str:
+    name = f"{topic.title()}{rng.choice(_WORDS).title()}{rng.randrange(10_000)}"
+    lines = [f"class {name}:"]
+    if rng.random() < shape.docstring_coverage:
+        lines.append(f'    """Track {topic} state for {rng.choice(_WORDS)}."""')
+        lines.append("")
+    lines.append("    def __init__(self, value):")
+    lines.append("        self.value = value")
+    for index in range(rng.randint(1, 3)):
+        method = _function(
+            rng,
+            f"method_{index}",
+            shape,
+            with_docstring=rng.random() < shape.docstring_coverage,
+        )
+        lines.append("")
+        lines.extend("    " + line if line else line for line in method.splitlines())
+    return "\n".join(lines) + "\n"
+
+
+__all__ = ["GeneratedRepo", "RepoShape", "generate_repo"]
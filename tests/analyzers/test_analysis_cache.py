@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ai_clean.analyzers import (
+    find_docstring_gaps,
+    find_duplicate_blocks,
+    find_structure_issues,
+    propose_organize_groups,
+)
+from ai_clean.analyzers.cache import AnalysisCache
+from ai_clean.analyzers.orchestrator import prepare_corpus
+from ai_clean.config import (
+    DocstringAnalyzerConfig,
+    DuplicateAnalyzerConfig,
+    OrganizeAnalyzerConfig,
+    StructureAnalyzerConfig,
+)
+
+_IGNORE = (".git", "__pycache__", ".venv")
+_FINDERS = {
+    "duplicate": find_duplicate_blocks,
+    "structure": find_structure_issues,
+    "docstrings": find_docstring_gaps,
+    "organize": propose_organize_groups,
+}
+
+
+def _analyzers(window_size: int = 2) -> list[tuple[str, object]]:
+    return [
+        (
+            "duplicate",
+            DuplicateAnalyzerConfig(
+                window_size=window_size, min_occurrences=2, ignore_dirs=_IGNORE
+            ),
+        ),
+        (
+            "structure",
+            StructureAnalyzerConfig(
+                max_file_lines=3, max_function_lines=1, ignore_dirs=_IGNORE
+            ),
+        ),
+        (
+            "docstrings",
+            DocstringAnalyzerConfig(
+                min_docstring_length=10,
+                min_symbol_lines=1,
+                weak_markers=("todo",),
+                important_symbols_only=False,
+                ignore_dirs=_IGNORE,
+            ),
+        ),
+        (
+            "organize",
+            OrganizeAnalyzerConfig(
+                min_group_size=2, max_group_size=3, max_groups=2, ignore_dirs=_IGNORE
+            ),
+        ),
+    ]
+
+
+def _run(root: Path, cache_path: Path, window_size: int = 2):
+    cache = AnalysisCache(cache_path)
+    analyzers = _analyzers(window_size)
+    corpus = prepare_corpus(root, analyzers, cache=cache)
+    for name, settings in analyzers:
+        _FINDERS[name](root, settings, corpus=corpus)
+    results = {
+        source.relative_path.as_posix(): {
+            repr(key): value for key, value in source.completed().items()
+        }
+        for source in corpus.files()
+    }
+    cache.save(corpus)
+    return cache, corpus, results
+
+
+class AnalysisCacheTests(unittest.TestCase):
+    def test_second_run_reuses_results_for_unchanged_files(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            root.mkdir()
+            cache_path = Path(tmp) / "cache" / "analysis.json"
+            for name in ("api_alpha.py", "api_beta.py"):
+                stem = name[:-3]
+                (root / name).write_text(f'"""{stem}"""\nimport {stem}\n\n\n# {stem}\n')
+
+            first, _, _ = _run(root, cache_path)
+            self.assertEqual(first.hits, 0)
+            self.assertTrue(cache_path.exists())
+
+            second, corpus, _ = _run(root, cache_path)
+            self.assertEqual(second.misses, 0)
+            self.assertEqual(second.hits, 10)
+            self.assertEqual(corpus.reads, 0)
+            self.assertEqual(corpus.parses, 0)
+
+    def test_changed_files_are_reanalyzed(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            root.mkdir()
+            cache_path = Path(tmp) / "analysis.json"
+            (root / "a.py").write_text("a = 1\nb = 2\n")
+            (root / "b.py").write_text("c = 3\nd = 4\n")
+            _run(root, cache_path)
+
+            (root / "b.py").write_text("c = 3\nd = 4\ne = 5\n")
+            _, corpus, cached = _run(root, cache_path)
+            _, _, fresh = _run(root, Path(tmp) / "fresh.json")
+
+            self.assertEqual(corpus.reads, 1)
+            self.assertEqual(
+                json.loads(json.dumps(cached)), json.loads(json.dumps(fresh))
+            )
+
+    def test_touched_but_identical_files_hit_the_cache(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            root.mkdir()
+            cache_path = Path(tmp) / "analysis.json"
+            target = root / "a.py"
+            target.write_text("a = 1\n")
+            _run(root, cache_path)
+
+            stat = target.stat()
+            os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            cache, corpus, _ = _run(root, cache_path)
+
+            self.assertEqual(cache.misses, 0)
+            self.assertEqual(corpus.parses, 0)
+
+    def test_config_changes_only_recompute_dependent_tasks(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            root.mkdir()
+            cache_path = Path(tmp) / "analysis.json"
+            (root / "a.py").write_text("a = 1\nb = 2\nc = 3\n")
+            _run(root, cache_path, window_size=2)
+
+            cache, _, _ = _run(root, cache_path, window_size=3)
+
+            self.assertEqual(cache.misses, 1)
+            self.assertEqual(cache.hits, 4)
+
+    def test_removed_files_are_evicted(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            root.mkdir()
+            cache_path = Path(tmp) / "analysis.json"
+            (root / "keep.py").write_text("a = 1\n")
+            (root / "gone.py").write_text("b = 1\n")
+            _run(root, cache_path)
+
+            (root / "gone.py").unlink()
+            _run(root, cache_path)
+
+            payload = json.loads(cache_path.read_text())
+            self.assertEqual(sorted(payload["files"]), ["keep.py"])
+
+    def test_corrupt_cache_is_ignored(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            root.mkdir()
+            cache_path = Path(tmp) / "analysis.json"
+            cache_path.write_text("{not json")
+            (root / "a.py").write_text("a = 1\n")
+
+            with self.assertLogs("ai_clean.analyzers.cache", level="WARNING"):
+                cache, _, _ = _run(root, cache_path)
+
+            self.assertEqual(cache.hits, 0)
+            self.assertIn("a.py", json.loads(cache_path.read_text())["files"])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
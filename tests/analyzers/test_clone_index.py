@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from ai_clean.analyzers.clone_index import CloneIndex, CloneMatch, IndexUpdate
+from ai_clean.config import DuplicateAnalyzerConfig
+
+_SETTINGS = DuplicateAnalyzerConfig(
+    window_size=3, min_occurrences=2, ignore_dirs=(".git", ".ai-clean")
+)
+_BLOCK = "def shared(value):\n    total = value + 1\n    total *= 2\n    return total\n"
+
+
+def _index(root: Path, settings: DuplicateAnalyzerConfig = _SETTINGS) -> CloneIndex:
+    return CloneIndex(root / ".ai-clean" / "duplicates.db", root, settings)
+
+
+class CloneIndexTests(unittest.TestCase):
+    def test_lookup_reports_each_clone_as_one_region(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "alpha.py").write_text("import os\n\n" + _BLOCK)
+            (root / "pkg").mkdir()
+            (root / "pkg" / "beta.py").write_text(_BLOCK + "\nother = 1\n")
+            (root / "gamma.py").write_text("x = 1\ny = 2\nz = 3\n")
+
+            with _index(root) as index:
+                self.assertEqual(index.refresh(), IndexUpdate(3, 0, 0, 0))
+                whole = index.lookup_clones("alpha.py")
+                inner = index.lookup_clones("pkg/beta.py", 2, 4)
+                short = index.lookup_clones("pkg/beta.py", 2, 2)
+
+        self.assertEqual(whole, [CloneMatch(3, 6, "pkg/beta.py", 1, 4)])
+        self.assertEqual(inner, [CloneMatch(2, 4, "alpha.py", 4, 6)])
+        self.assertEqual(short, [CloneMatch(1, 4, "alpha.py", 3, 6)])
+
+    def test_refresh_only_rehashes_changed_files_and_drops_removed_ones(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for name in ("a.py", "b.py", "c.py", "d.py"):
+                (root / name).write_text(_BLOCK)
+            with _index(root) as index:
+                index.refresh()
+
+            (root / "b.py").write_text("\n\n" + _BLOCK)
+            (root / "c.py").unlink()
+            (root / "e.py").write_text("solo = 1\n")
+            stat = (root / "d.py").stat()
+            os.utime(root / "d.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            with _index(root) as index:
+                update = index.refresh()
+                matches = index.lookup_clones("a.py")
+
+        self.assertEqual(update, IndexUpdate(1, 1, 1, 2))
+        self.assertEqual(
+            matches,
+            [CloneMatch(1, 4, "b.py", 3, 6), CloneMatch(1, 4, "d.py", 1, 4)],
+        )
+
+    def test_hash_collisions_are_not_reported(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a.py").write_text(_BLOCK)
+            (root / "b.py").write_text("one = 1\ntwo = 2\nthree = 3\n")
+
+            with patch("ai_clean.analyzers.duplicate._line_hash", return_value=7):
+                with _index(root) as index:
+                    index.refresh()
+                    self.assertEqual(index.lookup_clones("a.py"), [])
+
+    def test_changed_settings_rebuild_the_index(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a.py").write_text("first = 1\n" + _BLOCK)
+            (root / "b.py").write_text(
+                "second = [\n    1]\n" + _BLOCK.replace("value", "v")
+            )
+            with _index(root) as index:
+                index.refresh()
+                self.assertEqual(index.lookup_clones("a.py"), [])
+
+            tokens = dataclasses.replace(_SETTINGS, mode="tokens")
+            with _index(root, tokens) as index:
+                self.assertEqual(index.refresh(), IndexUpdate(2, 0, 0, 0))
+                matches = index.lookup_clones("a.py")
+
+        self.assertEqual(matches, [CloneMatch(2, 5, "b.py", 3, 6)])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
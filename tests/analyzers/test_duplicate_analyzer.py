@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import dataclasses
 import textwrap
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from ai_clean.analyzers import find_duplicate_blocks
+from ai_clean.analyzers.corpus import SourceCorpus
+from ai_clean.analyzers.duplicate import _TOKEN_LINES_TASK
 from ai_clean.config import DuplicateAnalyzerConfig
 
 
@@ -87,6 +91,236 @@ class DuplicateAnalyzerTests(unittest.TestCase):
             filtered = find_duplicate_blocks(root, filtered_settings)
             self.assertEqual(filtered, [])
 
+    def test_hash_collisions_do_not_merge_different_windows(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write_file(root, "alpha.py", "first = 1\nsecond = 2\n")
+            _write_file(root, "beta.py", "first = 1\nsecond = 2\n")
+            _write_file(root, "gamma.py", "other = 3\nthing = 4\n")
+            settings = DuplicateAnalyzerConfig(
+                window_size=2,
+                min_occurrences=2,
+                ignore_dirs=(".git",),
+            )
+            expected = find_duplicate_blocks(root, settings)
+
+            with patch("ai_clean.analyzers.duplicate._line_hash", return_value=7):
+                colliding = find_duplicate_blocks(root, settings)
+
+            self.assertEqual(len(expected), 1)
+            self.assertEqual(colliding, expected)
+
+    def test_indentation_and_comment_only_windows(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "alpha.py").write_text("# note\n# more\nx = 1\ny = x\n")
+            (root / "beta.py").write_text(
+                "# note\n# more\nif True:\n    x = 1\n    y = x\n"
+            )
+            settings = DuplicateAnalyzerConfig(
+                window_size=2,
+                min_occurrences=2,
+                ignore_dirs=(".git",),
+            )
+
+            findings = find_duplicate_blocks(root, settings)
+
+            self.assertEqual(
+                [finding.metadata["normalized_preview"] for finding in findings],
+                ["x = 1\ny = x"],
+            )
+            self.assertEqual(
+                [
+                    (loc.path.as_posix(), loc.start_line)
+                    for loc in findings[0].locations
+                ],
+                [("alpha.py", 3), ("beta.py", 4)],
+            )
+
+    def test_overlapping_windows_merge_into_maximal_regions(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            block = "\n".join(f"value_{index} = {index}" for index in range(40))
+            (root / "alpha.py").write_text(f"alpha = 0\n{block}\n")
+            (root / "beta.py").write_text(f"{block}\nbeta = 1\n")
+            settings = DuplicateAnalyzerConfig(
+                window_size=10,
+                min_occurrences=2,
+                ignore_dirs=(".git",),
+            )
+
+            findings = find_duplicate_blocks(root, settings)
+
+            self.assertEqual(len(findings), 1)
+            finding = findings[0]
+            self.assertEqual(
+                [
+                    (loc.path.as_posix(), loc.start_line, loc.end_line)
+                    for loc in finding.locations
+                ],
+                [("alpha.py", 2, 41), ("beta.py", 1, 40)],
+            )
+            self.assertEqual(finding.metadata["normalized_preview"], block)
+            self.assertEqual(finding.metadata["merged_windows"], 31)
+            self.assertEqual(
+                finding.description,
+                "Found 2 duplicate 40-line regions starting with 'value_0 = 0'",
+            )
+
+    def test_regions_stop_where_occurrence_sets_diverge(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            shared = "a = 1\nb = 2\nc = 3\n"
+            (root / "alpha.py").write_text(shared + "d = 4\n")
+            (root / "beta.py").write_text(shared + "d = 4\n")
+            (root / "gamma.py").write_text(shared + "z = 9\n")
+            settings = DuplicateAnalyzerConfig(
+                window_size=2,
+                min_occurrences=2,
+                ignore_dirs=(".git",),
+            )
+
+            findings = find_duplicate_blocks(root, settings)
+
+            spans = sorted(
+                (
+                    finding.metadata["normalized_preview"],
+                    [
+                        (loc.path.as_posix(), loc.start_line, loc.end_line)
+                        for loc in finding.locations
+                    ],
+                )
+                for finding in findings
+            )
+            self.assertEqual(
+                spans,
+                [
+                    (
+                        "a = 1\nb = 2\nc = 3",
+                        [
+                            ("alpha.py", 1, 3),
+                            ("beta.py", 1, 3),
+                            ("gamma.py", 1, 3),
+                        ],
+                    ),
+                    ("c = 3\nd = 4", [("alpha.py", 3, 4), ("beta.py", 3, 4)]),
+                ],
+            )
+
+    def test_tokens_mode_matches_renamed_and_reformatted_clones(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write_file(
+                root,
+                "alpha.py",
+                """
+                def total(items):
+                    result = 0
+                    for item in items:
+                        result += item * 2
+                    return result
+                """,
+            )
+            _write_file(
+                root,
+                "beta.py",
+                """
+                def summed(values):
+                    acc = 10
+
+                    # accumulate doubled values
+                    for value in values:
+                        acc += value * 3
+                    return acc
+                """,
+            )
+            lines_settings = DuplicateAnalyzerConfig(
+                window_size=5,
+                min_occurrences=2,
+                ignore_dirs=(".git",),
+            )
+            tokens_settings = DuplicateAnalyzerConfig(
+                window_size=5,
+                min_occurrences=2,
+                ignore_dirs=(".git",),
+                mode="tokens",
+            )
+
+            self.assertEqual(find_duplicate_blocks(root, lines_settings), [])
+            findings = find_duplicate_blocks(root, tokens_settings)
+
+            self.assertEqual(len(findings), 1)
+            finding = findings[0]
+            self.assertEqual(
+                [
+                    (loc.path.as_posix(), loc.start_line, loc.end_line)
+                    for loc in finding.locations
+                ],
+                [("alpha.py", 1, 5), ("beta.py", 1, 7)],
+            )
+            self.assertEqual(finding.metadata["mode"], "tokens")
+            self.assertTrue(
+                finding.metadata["normalized_preview"].startswith("def total(items):")
+            )
+
+    def test_spilled_scan_matches_in_memory_scan(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            blocks = [
+                f"def block_{index}(value):\n"
+                f"    total = value + {index}\n"
+                f"    total *= 2\n"
+                f"    return total\n"
+                for index in range(6)
+            ]
+            for number in range(12):
+                chosen = blocks[number % 4 :: 2]
+                _write_file(root, f"pkg/mod_{number}.py", "\n".join(chosen))
+
+            for mode in ("lines", "tokens"):
+                settings = DuplicateAnalyzerConfig(
+                    window_size=3,
+                    min_occurrences=2,
+                    ignore_dirs=(".git",),
+                    mode=mode,
+                )
+                spilling = dataclasses.replace(settings, max_memory_mb=1)
+                with self.subTest(mode=mode):
+                    expected = find_duplicate_blocks(root, settings)
+                    # A huge overhead estimate forces every partition to split.
+                    with patch("ai_clean.analyzers.spill._COUNT_OVERHEAD", 1 << 40):
+                        spilled = find_duplicate_blocks(root, spilling)
+
+                    self.assertTrue(expected)
+                    self.assertEqual(spilled, expected)
+
+    def test_spilled_token_scan_keeps_no_per_file_data(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            snippet = """
+            def shared_block(value):
+                total = value + 1
+                total *= 2
+                return total
+            """
+            for name in ("alpha.py", "beta.py", "gamma.py"):
+                _write_file(root, name, snippet)
+            settings = DuplicateAnalyzerConfig(
+                window_size=3,
+                min_occurrences=2,
+                ignore_dirs=(".git",),
+                mode="tokens",
+                max_memory_mb=1,
+            )
+            corpus = SourceCorpus(root, settings.ignore_dirs)
+
+            findings = find_duplicate_blocks(root, settings, corpus=corpus)
+
+            self.assertEqual(len(findings), 1)
+            for source in corpus.files():
+                self.assertNotIn(_TOKEN_LINES_TASK.key, source._results)
+                self.assertIsNone(source._text)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -6,6 +6,8 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
+from pydantic import ValidationError
+
 from ai_clean.analyzers.orchestrator import _merge_findings, analyze_repo
 from ai_clean.models import Finding, FindingLocation
 
@@ -100,6 +102,137 @@ class OrchestratorTests(unittest.TestCase):
         self.assertGreaterEqual(len(findings), 1)
         self.assertIn("analyzer_errors", findings[0].metadata)
 
+    def test_parallel_run_matches_serial_run(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            (root / "pkg").mkdir(parents=True)
+            config_path = Path(tmp) / "ai-clean.toml"
+            config_path.write_text(_minimal_config(), encoding="utf-8")
+            for index in range(6):
+                (root / "pkg" / f"api_{index}.py").write_text(
+                    '"""API handler"""\nimport httpx\n\n\n'
+                    f"def handler_{index}():\n    value = 1\n    return value\n",
+                    encoding="utf-8",
+                )
+            (root / "broken.py").write_text("def broken(:\n", encoding="utf-8")
+
+            serial = analyze_repo(root, config_path, jobs=1, use_cache=False)
+            parallel = analyze_repo(root, config_path, jobs=3, use_cache=False)
+
+        self.assertTrue(serial)
+        self.assertEqual(
+            [finding.model_dump() for finding in parallel],
+            [finding.model_dump() for finding in serial],
+        )
+
+    def test_trusted_findings_match_validated_findings(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            (root / "pkg").mkdir(parents=True)
+            config_path = Path(tmp) / "ai-clean.toml"
+            config_path.write_text(_minimal_config(), encoding="utf-8")
+            for index in range(4):
+                (root / "pkg" / f"api_{index}.py").write_text(
+                    "import httpx\n\n\n"
+                    f"def handler_{index}():\n    value = 1\n    return value\n",
+                    encoding="utf-8",
+                )
+
+            findings = analyze_repo(root, config_path, use_cache=False)
+
+        self.assertTrue(findings)
+        for finding in findings:
+            validated = Finding.model_validate(finding.model_dump())
+            self.assertEqual(validated, finding)
+            self.assertEqual(validated.model_dump_json(), finding.model_dump_json())
+
+    def test_trusted_validates_unless_given_exactly_the_fields(self) -> None:
+        location = FindingLocation.trusted(path=Path("a.py"), start_line=1, end_line=2)
+        self.assertEqual(
+            location, FindingLocation(path=Path("a.py"), start_line=1, end_line=2)
+        )
+
+        with self.assertRaises(ValidationError):
+            FindingLocation.trusted(path=Path("a.py"), start_line=1, end_lnie=2)
+        with self.assertRaises(ValidationError):
+            FindingLocation.trusted(path=Path("a.py"), start_line=1)
+
+    def test_parallel_run_reports_collector_failures_like_serial(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            config_path = Path(tmp) / "ai-clean.toml"
+            config_path.write_text(_minimal_config(), encoding="utf-8")
+            for name in ("a.py", "b.py", "c.py"):
+                (root / name).write_text("def func():\n    return 1\n")
+            # Dangling symlink: discovered as *.py but cannot be read.
+            (root / "bad.py").symlink_to(root / "missing.py")
+
+            serial = analyze_repo(root, config_path, jobs=1, use_cache=False)
+            parallel = analyze_repo(root, config_path, jobs=2, use_cache=False)
+
+        errors = serial[0].metadata["analyzer_errors"]
+        self.assertTrue(errors)
+        self.assertEqual(parallel[0].metadata["analyzer_errors"], errors)
+        self.assertEqual(
+            [finding.model_dump() for finding in parallel],
+            [finding.model_dump() for finding in serial],
+        )
+
+    def test_cached_run_matches_uncached_run(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            root.mkdir()
+            config_path = Path(tmp) / "ai-clean.toml"
+            config_path.write_text(_minimal_config(), encoding="utf-8")
+            for name in ("api_alpha.py", "api_beta.py", "worker.py"):
+                (root / name).write_text(
+                    '"""API handler"""\nimport httpx\n\n\ndef run():\n    return 1\n',
+                    encoding="utf-8",
+                )
+            cache_file = root / ".ai-clean" / "cache" / "analysis.json"
+
+            uncached = analyze_repo(root, config_path, use_cache=False)
+            self.assertFalse(cache_file.exists())
+            first = analyze_repo(root, config_path)
+            self.assertTrue(cache_file.exists())
+            second = analyze_repo(root, config_path)
+
+        expected = [finding.model_dump() for finding in uncached]
+        self.assertEqual([finding.model_dump() for finding in first], expected)
+        self.assertEqual([finding.model_dump() for finding in second], expected)
+
+    def test_changed_files_scope_findings(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            root.mkdir()
+            config_path = Path(tmp) / "ai-clean.toml"
+            config_path.write_text(_minimal_config(), encoding="utf-8")
+            shared = "def run():\n    total = 1\n    total += 2\n    return total\n"
+            (root / "changed.py").write_text(shared, encoding="utf-8")
+            (root / "stable.py").write_text(shared, encoding="utf-8")
+            (root / "other.py").write_text(
+                "def other():\n    a = 1\n    b = 2\n    return a + b\n",
+                encoding="utf-8",
+            )
+
+            full = analyze_repo(root, config_path)
+            scoped = analyze_repo(root, config_path, changed_files=["changed.py"])
+
+        def touches_changed(finding: Finding) -> bool:
+            return any(loc.path.as_posix() == "changed.py" for loc in finding.locations)
+
+        self.assertTrue(scoped)
+        self.assertTrue(all(touches_changed(finding) for finding in scoped))
+        self.assertEqual(
+            [finding.model_dump() for finding in scoped],
+            [finding.model_dump() for finding in full if touches_changed(finding)],
+        )
+        duplicates = [f for f in scoped if f.category == "duplicate_block"]
+        self.assertEqual(
+            {loc.path.as_posix() for loc in duplicates[0].locations},
+            {"changed.py", "stable.py"},
+        )
+
 
 def _minimal_config() -> str:
     return (
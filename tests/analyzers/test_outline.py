@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ai_clean.analyzers import find_docstring_gaps, find_structure_issues
+from ai_clean.analyzers.corpus import SourceCorpus, SourceFile
+from ai_clean.analyzers.docstrings import _SYMBOLS_TASK
+from ai_clean.analyzers.structure import _FUNCTION_SPANS_TASK
+from ai_clean.config import DocstringAnalyzerConfig, StructureAnalyzerConfig
+
+_IGNORE = (".git", "__pycache__", ".venv")
+
+_MODULE = '''"""Module docstring."""
+
+import os
+
+
+def alpha(value):
+    """Return the value."""
+    return value
+
+
+# A comment between functions.
+class Beta:
+    def method(self):
+        total = 0
+        for item in range(3):
+            total += item
+        return total
+
+
+def gamma():
+    return os.sep
+'''
+
+_EDITS = {
+    "body edit that shifts later lines": (
+        "        return total\n",
+        "        total *= 2\n        return total\n",
+    ),
+    "inserted function": (
+        "# A comment",
+        "def delta():\n    return 1\n\n\n# A comment",
+    ),
+    "module docstring removed": ('"""Module docstring."""\n', ""),
+    "comment turned into an unterminated string": (
+        "# A comment between functions.",
+        '"""A comment between functions.',
+    ),
+    "trailing code appended": ("return os.sep\n", "return os.sep\n\n\nx = 1"),
+}
+
+
+def _normalized(value: object) -> object:
+    return json.loads(json.dumps(value))
+
+
+class OutlineTests(unittest.TestCase):
+    def test_updated_outlines_match_a_full_parse(self) -> None:
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "module.py"
+            for label, (old, new) in _EDITS.items():
+                for task in (_FUNCTION_SPANS_TASK, _SYMBOLS_TASK):
+                    with self.subTest(label, task=task.key):
+                        path.write_text(_MODULE)
+                        previous = SourceFile(path, Path("module.py")).run(task)
+                        path.write_text(_MODULE.replace(old, new))
+
+                        updated = SourceFile(path, Path("module.py"))
+                        updated.prime_stale(task.key, _normalized(previous))
+                        fresh = SourceFile(path, Path("module.py"))
+
+                        self.assertEqual(
+                            _normalized(updated.run(task)),
+                            _normalized(fresh.run(task)),
+                        )
+
+    def test_refreshed_files_reuse_unchanged_symbols(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            target = root / "module.py"
+            target.write_text(_MODULE)
+            structure = StructureAnalyzerConfig(
+                max_file_lines=100, max_function_lines=3, ignore_dirs=_IGNORE
+            )
+            docstrings = DocstringAnalyzerConfig(
+                min_docstring_length=5,
+                min_symbol_lines=1,
+                weak_markers=(),
+                important_symbols_only=False,
+                ignore_dirs=_IGNORE,
+            )
+            corpus = SourceCorpus(root, _IGNORE)
+            find_structure_issues(root, structure, corpus=corpus)
+            find_docstring_gaps(root, docstrings, corpus=corpus)
+
+            target.write_text(_MODULE.replace(*_EDITS["inserted function"]))
+            corpus.refresh(["module.py"])
+            parses = corpus.parses
+            long_functions = find_structure_issues(root, structure, corpus=corpus)
+            gaps = find_docstring_gaps(root, docstrings, corpus=corpus)
+
+            self.assertEqual(corpus.parses, parses)
+            fresh = SourceCorpus(root, _IGNORE)
+            self.assertEqual(
+                long_functions, find_structure_issues(root, structure, corpus=fresh)
+            )
+            self.assertEqual(gaps, find_docstring_gaps(root, docstrings, corpus=fresh))
+            self.assertIn(
+                "Beta.method",
+                [finding.metadata.get("qualified_name") for finding in long_functions],
+            )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
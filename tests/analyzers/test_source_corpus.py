@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from ai_clean.analyzers import (
+    find_docstring_gaps,
+    find_duplicate_blocks,
+    find_structure_issues,
+    propose_organize_groups,
+)
+from ai_clean.analyzers.corpus import FileTask, SourceCorpus, SourceFile
+from ai_clean.config import (
+    DocstringAnalyzerConfig,
+    DuplicateAnalyzerConfig,
+    OrganizeAnalyzerConfig,
+    StructureAnalyzerConfig,
+)
+
+_IGNORE = (".git", "__pycache__", ".venv")
+
+
+def _count_lines(source: SourceFile) -> int:
+    return len(source.lines)
+
+
+def _count_names(source: SourceFile) -> int:
+    source.run(FileTask(key=("lines",), collect=_count_lines))
+    assert source.tree is not None
+    return len(source.tree.body)
+
+
+class SourceCorpusTests(unittest.TestCase):
+    def test_files_are_sorted_and_filtered_per_call(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "pkg").mkdir()
+            (root / "vendor").mkdir()
+            (root / "pkg" / "b.py").write_text("b = 1\n")
+            (root / "a.py").write_text("a = 1\n")
+            (root / "vendor" / "c.py").write_text("c = 1\n")
+
+            corpus = SourceCorpus(root)
+
+            self.assertEqual(
+                [entry.relative_path.as_posix() for entry in corpus.files()],
+                ["a.py", "pkg/b.py", "vendor/c.py"],
+            )
+            self.assertEqual(
+                [entry.relative_path.as_posix() for entry in corpus.files(["vendor"])],
+                ["a.py", "pkg/b.py"],
+            )
+            self.assertIs(corpus.files()[0], corpus.files(["vendor"])[0])
+
+    def test_refresh_rereads_only_changed_paths(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a.py").write_text("a = 1\n")
+            (root / "b.py").write_text("b = 1\n")
+            corpus = SourceCorpus(root)
+            first_a, first_b = corpus.files()
+            first_a.tree
+            first_b.tree
+
+            (root / "a.py").write_text("a = 2\n")
+            (root / "b.py").unlink()
+            (root / "c.py").write_text("c = 1\n")
+            corpus.refresh(["a.py", "b.py", "c.py"])
+
+            entries = corpus.files()
+            self.assertEqual(
+                [entry.relative_path.as_posix() for entry in entries], ["a.py", "c.py"]
+            )
+            self.assertIsNot(entries[0], first_a)
+            self.assertEqual(entries[0].lines, ["a = 2"])
+            self.assertEqual(corpus.reads, 3)
+
+    def test_syntax_errors_yield_no_tree(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "broken.py").write_text("def broken(:\n")
+
+            entry = SourceCorpus(root).files()[0]
+
+            self.assertIsNone(entry.tree)
+            self.assertEqual(entry.lines, ["def broken(:"])
+
+    def test_analyzers_share_reads_and_parses(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for name in ("api_alpha.py", "api_beta.py", "worker.py"):
+                (root / name).write_text(
+                    '"""API module"""\nimport httpx\n\n\ndef run():\n    return 1\n'
+                )
+
+            corpus = SourceCorpus(root)
+            find_duplicate_blocks(
+                root,
+                DuplicateAnalyzerConfig(
+                    window_size=2, min_occurrences=2, ignore_dirs=_IGNORE
+                ),
+                corpus=corpus,
+            )
+            find_structure_issues(
+                root,
+                StructureAnalyzerConfig(
+                    max_file_lines=3, max_function_lines=1, ignore_dirs=_IGNORE
+                ),
+                corpus=corpus,
+            )
+            find_docstring_gaps(
+                root,
+                DocstringAnalyzerConfig(
+                    min_docstring_length=10,
+                    min_symbol_lines=1,
+                    weak_markers=("todo",),
+                    important_symbols_only=False,
+                    ignore_dirs=_IGNORE,
+                ),
+                corpus=corpus,
+            )
+            propose_organize_groups(
+                root,
+                OrganizeAnalyzerConfig(
+                    min_group_size=2,
+                    max_group_size=3,
+                    max_groups=2,
+                    ignore_dirs=_IGNORE,
+                ),
+                corpus=corpus,
+            )
+
+            self.assertEqual(corpus.reads, 3)
+            self.assertEqual(corpus.parses, 3)
+
+    def test_transient_runs_keep_nothing_they_loaded(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a.py").write_text("a = 1\nb = 2\n")
+            corpus = SourceCorpus(root)
+            (source,) = corpus.files()
+            names = FileTask(key=("names",), collect=_count_names)
+
+            self.assertEqual(source.run_transient(names), 2)
+            self.assertFalse(source.has_result(("names",)))
+            self.assertFalse(source.has_result(("lines",)))
+            self.assertEqual(source.run_transient(names), 2)
+            self.assertEqual((corpus.reads, corpus.parses), (2, 2))
+
+            source.run(names)
+            self.assertEqual(source.run_transient(names), 2)
+            self.assertEqual((corpus.reads, corpus.parses), (3, 3))
+
+    def test_line_counts_and_slices_match_decoded_lines(self) -> None:
+        samples = {
+            "plain.py": b"a = 1\n\nb = '\xc3\xa9'\n",
+            "no_newline.py": b"a = 1\nb = 2",
+            "crlf.py": b"a = 1\r\nb = 2\r\rc\n",
+            "form_feed.py": b"a = 1\n\x0c\nb = 2\n",
+            "bad_tail.py": b"a = 1\n\xff\xfe",
+            "empty.py": b"",
+            "blank_tail.py": b"a = 1\n\n\n",
+        }
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for name, data in samples.items():
+                (root / name).write_bytes(data)
+            counted = SourceCorpus(root).files()
+            decoded = SourceCorpus(root).files()
+
+            # Tiny chunks make newline counting cross chunk boundaries.
+            chunked = patch("ai_clean.analyzers.corpus._COUNT_CHUNK", 4)
+            for source, reference in zip(counted, decoded):
+                with self.subTest(path=source.relative_path.as_posix()), chunked:
+                    self.assertEqual(source.line_count, len(reference.lines))
+                    self.assertEqual(source.line_slice(1, 3), reference.lines[1:3])
+                    source.release()
+                    self.assertEqual(source.line_slice(0, 9), reference.lines)
+                    self.assertEqual(source.content_hash, reference.content_hash)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
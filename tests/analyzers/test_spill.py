@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ai_clean.analyzers.spill import HashSpill
+
+# Distinct 61-bit hashes that share their top 12 bits.
+_CLUSTERED = [(0x123 << 49) | index for index in range(50)]
+
+
+class HashSpillTests(unittest.TestCase):
+    def test_returns_payloads_of_recurring_hashes(self) -> None:
+        hashes = [1 << 60, 5, 5, (1 << 60) - 1, 5, 1 << 60]
+        with HashSpill(1) as spill:
+            spill.add(hashes[:3], [10, 11, 12])
+            spill.add(hashes[3:], [13, 14, 15])
+
+            self.assertEqual(sorted(spill.recurring(2)), [10, 11, 12, 14, 15])
+            self.assertEqual(sorted(spill.recurring(3)), [11, 12, 14])
+            self.assertEqual(spill.records, 6)
+
+    def test_oversized_partitions_split_on_later_bits(self) -> None:
+        hashes = _CLUSTERED + _CLUSTERED[:10] + [7, 7]
+        with HashSpill(1) as spill:
+            spill.add(hashes, range(len(hashes)))
+            with patch("ai_clean.analyzers.spill._COUNT_OVERHEAD", 1 << 40):
+                recurring = sorted(spill.recurring(2))
+
+        self.assertEqual(recurring, [*range(10), *range(50, 62)])
+
+    def test_parallel_counting_matches_serial(self) -> None:
+        hashes = [value % 97 << 54 | value % 13 for value in range(4000)]
+        with HashSpill(1) as spill:
+            spill.add(hashes, range(len(hashes)))
+            serial = sorted(spill.recurring(3, jobs=1))
+            with patch("ai_clean.analyzers.spill._PARALLEL_MIN_BYTES", 1):
+                parallel = sorted(spill.recurring(3, jobs=2))
+            directory = Path(spill._directory.name)
+
+        self.assertEqual(parallel, serial)
+        self.assertTrue(serial)
+        self.assertFalse(directory.exists())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ai_clean.analyzers.corpus import SourceCorpus
+from ai_clean.analyzers.walker import walk_python_files
+
+
+def _write(root: Path, *names: str) -> None:
+    for name in names:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+
+
+def _posix(paths: list[Path]) -> list[str]:
+    return [path.as_posix() for path in paths]
+
+
+class WalkPythonFilesTests(unittest.TestCase):
+    def test_prunes_directories_before_descending(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(root, "a.py", "pkg/b.py", "pkg/.venv/lib/c.py", "node/d.py")
+            _write(root, "notes.txt")
+
+            result = walk_python_files(root, prune_dirs=(".venv", "node"))
+
+        self.assertEqual(result.mode, "scandir")
+        self.assertEqual(_posix(result.files), ["a.py", "pkg/b.py"])
+        self.assertEqual(result.skipped_dirs, 2)
+
+    def test_honors_gitignore_files_outside_a_work_tree(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(
+                root,
+                "a.py",
+                "top.py",
+                "api_gen.py",
+                "keep_gen.py",
+                "build/out.py",
+                "pkg/top.py",
+                "pkg/local.py",
+                "pkg/sub/local.py",
+                "pkg/docs/conf.py",
+            )
+            (root / ".gitignore").write_text(
+                "# generated\nbuild/\n*_gen.py\n!keep_gen.py\n/top.py\n"
+            )
+            (root / "pkg" / ".gitignore").write_text("local.py\ndocs/**\n")
+
+            result = walk_python_files(root)
+
+        self.assertEqual(_posix(result.files), ["a.py", "keep_gen.py", "pkg/top.py"])
+        self.assertEqual(result.skipped_dirs, 1)
+        self.assertEqual(result.skipped_files, 5)
+
+    def test_gitignore_can_be_disabled(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(root, "a.py", "build/out.py")
+            (root / ".gitignore").write_text("build/\n")
+
+            result = walk_python_files(root, gitignore=False)
+
+        self.assertEqual(_posix(result.files), ["a.py", "build/out.py"])
+
+    def test_follows_directory_symlinks_once(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(root, "pkg/a.py", "shared/b.py")
+            (root / "pkg" / "loop").symlink_to(root, target_is_directory=True)
+            (root / "linked").symlink_to(root / "shared", target_is_directory=True)
+
+            result = walk_python_files(root)
+
+        self.assertEqual(len(result.files), 2)
+        self.assertIn("pkg/a.py", _posix(result.files))
+        self.assertEqual(result.skipped_dirs, 2)
+
+    @unittest.skipIf(shutil.which("git") is None, "git is not installed")
+    def test_uses_git_listing_inside_a_work_tree(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            subprocess.run(["git", "init", "-q", str(root)], check=True)
+            _write(root, "tracked.py", "new.py", "dist/built.py", "vendor/v.py")
+            (root / ".gitignore").write_text("dist/\n")
+            subprocess.run(["git", "-C", str(root), "add", "tracked.py"], check=True)
+            (root / "tracked.py").unlink()
+
+            result = walk_python_files(root, prune_dirs=("vendor",))
+
+        self.assertEqual(result.mode, "git")
+        self.assertEqual(_posix(result.files), ["new.py"])
+        self.assertEqual(result.skipped_files, 1)
+
+    def test_corpus_records_skipped_counts(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(root, "a.py", "vendor/b.py", "gen/c.py")
+            (root / ".gitignore").write_text("gen/\n")
+
+            corpus = SourceCorpus(root, prune_dirs=("vendor",))
+
+            self.assertEqual(
+                [entry.relative_path.as_posix() for entry in corpus.files()],
+                ["a.py"],
+            )
+            self.assertEqual((corpus.skipped_dirs, corpus.skipped_files), (2, 0))
+
+            _write(root, "vendor/d.py")
+            corpus.refresh(["vendor/d.py"])
+            self.assertEqual(len(corpus.files()), 1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
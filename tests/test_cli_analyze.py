@@ -7,6 +7,7 @@ from contextlib import redirect_stderr, redirect_stdout
 from io import StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from ai_clean import cli
 
@@ -90,6 +91,126 @@ class AnalyzeCliTests(unittest.TestCase):
         self.assertEqual(exit_code, 0)
         self.assertIn("missing_docstring", stdout.getvalue())
 
+    def test_analyze_ndjson_stream_output(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            root.mkdir()
+            config = Path(tmp) / "ai-clean.toml"
+            config.write_text(_basic_config(), encoding="utf-8")
+            (root / "sample.py").write_text(
+                "def func():\n    return 1\n", encoding="utf-8"
+            )
+            args = ["analyze", "--root", str(root), "--config", str(config)]
+
+            streamed = StringIO()
+            with redirect_stdout(streamed):
+                exit_code = cli.main(args + ["--format", "ndjson", "--stream"])
+            batched = StringIO()
+            with redirect_stdout(batched):
+                cli.main(args + ["--format", "ndjson"])
+            as_json = StringIO()
+            with redirect_stdout(as_json):
+                cli.main(args + ["--json"])
+
+        self.assertEqual(exit_code, 0)
+        lines = [json.loads(line) for line in streamed.getvalue().splitlines()]
+        summary = lines.pop()
+        self.assertEqual(
+            summary, {"summary": {"findings": len(lines), "analyzer_errors": []}}
+        )
+        self.assertIn("missing_docstring", {line["category"] for line in lines})
+        batched_lines = [json.loads(line) for line in batched.getvalue().splitlines()]
+        self.assertEqual(batched_lines[:-1], json.loads(as_json.getvalue()))
+        self.assertEqual(
+            sorted(lines, key=lambda item: (item["category"], item["id"])),
+            batched_lines[:-1],
+        )
+
+    def test_analyze_ndjson_summary_reports_analyzer_errors(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            config = Path(tmp) / "ai-clean.toml"
+            config.write_text(_basic_config(), encoding="utf-8")
+
+            stdout = StringIO()
+            with (
+                patch(
+                    "ai_clean.analyzers.orchestrator.find_duplicate_blocks",
+                    side_effect=RuntimeError("boom"),
+                ),
+                redirect_stdout(stdout),
+            ):
+                exit_code = cli.main(
+                    [
+                        "analyze",
+                        "--root",
+                        str(root),
+                        "--config",
+                        str(config),
+                        "--format",
+                        "ndjson",
+                        "--stream",
+                        "--no-cache",
+                    ]
+                )
+
+        self.assertEqual(exit_code, 0)
+        summary = json.loads(stdout.getvalue().splitlines()[-1])["summary"]
+        self.assertEqual(
+            summary["analyzer_errors"], [{"analyzer": "duplicate", "error": "boom"}]
+        )
+
+    def test_analyze_profile_reports_analysis_stats(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            root.mkdir()
+            config = Path(tmp) / "ai-clean.toml"
+            config.write_text(_basic_config(), encoding="utf-8")
+            (root / "sample.py").write_text(
+                "def func():\n    return 1\n", encoding="utf-8"
+            )
+            args = ["analyze", "--root", str(root), "--config", str(config)]
+
+            table = StringIO()
+            with redirect_stdout(table):
+                exit_code = cli.main(args + ["--profile", "--no-cache"])
+            as_json = StringIO()
+            with redirect_stdout(as_json):
+                cli.main(args + ["--profile", "--json", "--no-cache"])
+            traced = StringIO()
+            with redirect_stdout(traced):
+                cli.main(args + ["--profile-memory", "--json", "--no-cache"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn("peak MiB", table.getvalue())
+        self.assertIn("first stage that reads", table.getvalue())
+        payload = json.loads(as_json.getvalue())
+        stats = {entry["analyzer"]: entry for entry in payload["analysis_stats"]}
+        self.assertEqual(
+            list(stats), ["prepare", "duplicate", "structure", "docstrings", "organize"]
+        )
+        self.assertEqual(stats["duplicate"]["files_scanned"], 1)
+        self.assertEqual(stats["duplicate"]["bytes_read"], 25)
+        self.assertEqual(stats["structure"]["asts_parsed"], 1)
+        self.assertEqual(
+            sum(entry["findings"] for entry in stats.values()),
+            len(payload["findings"]),
+        )
+        self.assertIsNone(stats["docstrings"]["peak_memory_bytes"])
+        self.assertEqual(stats["docstrings"]["asts_parsed"], 0)
+        traced_stats = json.loads(traced.getvalue())["analysis_stats"]
+        self.assertTrue(
+            all(entry["peak_memory_bytes"] is not None for entry in traced_stats)
+        )
+
+    def test_analyze_stream_requires_ndjson(self) -> None:
+        stderr = StringIO()
+        with redirect_stderr(stderr):
+            exit_code = cli.main(["analyze", "--stream"])
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("--stream requires --format ndjson", stderr.getvalue())
+
 
 def _basic_config() -> str:
     return (
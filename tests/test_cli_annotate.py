@@ -40,6 +40,35 @@ class AnnotateCliTests(unittest.TestCase):
             self.assertGreaterEqual(len(plan_files), 2)
             self.assertIn("Plan created", stdout.getvalue())
 
+    def test_saves_all_plans_through_one_store(self) -> None:
+        from ai_clean.metadata_stores import open_metadata_store
+
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            root.mkdir()
+            config_path = root / "ai-clean.toml"
+            config_path.write_text(_basic_config(), encoding="utf-8")
+            (root / "alpha.py").write_text(
+                "def first():\n    return 1\n\n\ndef second():\n    return 2\n",
+                encoding="utf-8",
+            )
+
+            with (
+                redirect_stdout(StringIO()),
+                patch("builtins.input", side_effect=["a", "s"]),
+                patch(
+                    "ai_clean.cli.open_metadata_store", wraps=open_metadata_store
+                ) as mock_open,
+            ):
+                exit_code = cli.main(
+                    ["annotate", "--root", str(root), "--config", str(config_path)]
+                )
+
+            self.assertEqual(exit_code, 0)
+            plan_files = sorted((root / ".ai-clean" / "plans").glob("*.json"))
+            self.assertGreaterEqual(len(plan_files), 3)
+            self.assertEqual(mock_open.call_count, 1)
+
     def test_apply_now_uses_apply_plan(self) -> None:
         finding_missing = _make_finding("missing_docstring", "alpha.py", "first")
         finding_weak = _make_finding("weak_docstring", "alpha.py", "second")
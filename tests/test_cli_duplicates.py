@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ai_clean import cli
+
+_REPO_CONFIG = Path(__file__).resolve().parents[1] / "ai-clean.toml"
+_BLOCK = "".join(f"value_{index} = compute({index})\n" for index in range(12))
+
+
+def _run(*argv: str) -> tuple[int, str]:
+    stdout = StringIO()
+    with redirect_stdout(stdout), redirect_stderr(StringIO()):
+        exit_code = cli.main(list(argv))
+    return exit_code, stdout.getvalue()
+
+
+class DuplicatesCliTests(unittest.TestCase):
+    def test_prints_clones_of_a_file_and_line_range(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            (root / "pkg").mkdir(parents=True)
+            (root / "pkg" / "a.py").write_text("import os\n" + _BLOCK)
+            (root / "b.py").write_text(_BLOCK)
+            common = ("--root", str(root), "--config", str(_REPO_CONFIG))
+
+            exit_code, text = _run("duplicates", "--file", "pkg/a.py", *common)
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(text, "pkg/a.py:2-13 -> b.py:1-12\n")
+            self.assertTrue((root / ".ai-clean" / "cache" / "duplicates.db").exists())
+
+            (root / "b.py").write_text("x = 1\n")
+            exit_code, text = _run(
+                "duplicates", "--file", "pkg/a.py", "--lines", "2-11", "--json", *common
+            )
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(text, "")
+
+            (root / "c.py").write_text(_BLOCK)
+            exit_code, text = _run(
+                "duplicates", "--file", "pkg/a.py", "--lines", "2-11", "--json", *common
+            )
+            self.assertEqual(
+                [json.loads(line) for line in text.splitlines()],
+                [
+                    {
+                        "path": "pkg/a.py",
+                        "start_line": 2,
+                        "end_line": 11,
+                        "clone_path": "c.py",
+                        "clone_start_line": 1,
+                        "clone_end_line": 10,
+                    }
+                ],
+            )
+
+    def test_rejects_missing_files_and_bad_ranges(self) -> None:
+        with TemporaryDirectory() as tmp:
+            common = ("--root", tmp, "--config", str(_REPO_CONFIG))
+            self.assertEqual(_run("duplicates", "--file", "nope.py", *common)[0], 1)
+            with self.assertRaises(SystemExit):
+                _run("duplicates", "--file", "a.py", "--lines", "5-2", *common)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -368,6 +368,79 @@ class IngestCliTests(unittest.TestCase):
             )
             self.assertTrue(updated.success)
 
+    def test_plan_reads_findings_ingested_under_a_custom_metadata_root(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            config_path = _write_config(root)
+            meta = root / "custom-meta"
+            config_path.write_text(
+                config_path.read_text(encoding="utf-8")
+                .replace((root / ".ai-clean").as_posix(), meta.as_posix())
+                .replace("temperature = 0.0", "temperature = 0.2"),
+                encoding="utf-8",
+            )
+            save_execution_result(
+                ExecutionResult(
+                    spec_id="spec-1",
+                    plan_id="plan-1",
+                    success=False,
+                    tests_passed=None,
+                    stdout="manual",
+                    stderr="",
+                    metadata={"manual_execution_required": True},
+                ),
+                meta / "results",
+            )
+            artifact_path = root / "artifact.json"
+            artifact_path.write_text(
+                json.dumps(
+                    {
+                        "plan_id": "plan-1",
+                        "diff": _sample_diff(),
+                        "stdout": "applied",
+                        "stderr": "",
+                        "tests": {
+                            "status": "ran",
+                            "command": "pytest -q",
+                            "exit_code": 0,
+                            "stdout": "",
+                            "stderr": "",
+                        },
+                        "suggestions": [
+                            {
+                                "description": "Tighten helper",
+                                "path": "src/app.py",
+                                "start_line": 10,
+                                "end_line": 12,
+                                "change_type": "refine_function",
+                                "model": "gpt-4o-mini",
+                                "prompt_hash": "abc",
+                            }
+                        ],
+                    }
+                ),
+                encoding="utf-8",
+            )
+            common = ["--root", str(root), "--config", str(config_path)]
+
+            stderr = StringIO()
+            with redirect_stdout(StringIO()), redirect_stderr(stderr):
+                ingest_code = cli.main(
+                    ["ingest", "--plan-id", "plan-1", "--artifact", str(artifact_path)]
+                    + common
+                    + ["--update-findings"]
+                )
+            self.assertEqual(ingest_code, 0, stderr.getvalue())
+            (stored,) = json.loads((meta / "findings.json").read_text())
+
+            stdout = StringIO()
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                plan_code = cli.main(["plan", stored["id"]] + common)
+
+            self.assertNotIn("Failed to load findings JSON", stderr.getvalue())
+            self.assertFalse((root / ".ai-clean" / "findings.json").exists())
+            self.assertEqual(plan_code, 0, stderr.getvalue())
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import textwrap
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ai_clean import cli
+from ai_clean.analyzers import analyze_repo
+from ai_clean.commands.plan import plan_many
+from ai_clean.config import load_config
+from ai_clean.models import Finding
+from ai_clean.plans import load_plan
+
+
+class PlanManyTests(unittest.TestCase):
+    def test_parallel_batch_matches_serial_batch(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root, config_path = _make_repo(Path(tmp))
+            config = load_config(config_path)
+            findings = analyze_repo(root, config_path, use_cache=False)
+
+            serial = plan_many(root, config, findings)
+            parallel = plan_many(root, config, findings, jobs=2)
+
+            self.assertEqual(
+                [result.finding.id for result in parallel],
+                [finding.id for finding in findings],
+            )
+            self.assertEqual(
+                [[plan for plan, _ in result.plans] for result in parallel],
+                [[plan for plan, _ in result.plans] for result in serial],
+            )
+            for result in serial:
+                self.assertIsNone(result.error)
+                for plan, path in result.plans:
+                    self.assertTrue(path.is_file())
+                    self.assertEqual(load_plan(plan.id, path.parent.parent), plan)
+
+    def test_planner_errors_are_reported_per_finding(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root, config_path = _make_repo(Path(tmp))
+            config = load_config(config_path)
+            findings = analyze_repo(root, config_path, use_cache=False)
+            unsupported = Finding(
+                id="odd-1",
+                category="advanced_cleanup",
+                description="No locations",
+                locations=[],
+            )
+
+            results = plan_many(root, config, [unsupported, findings[0]])
+
+        self.assertIsNotNone(results[0].error)
+        self.assertEqual(results[0].plans, [])
+        self.assertIsNone(results[1].error)
+        self.assertTrue(results[1].plans)
+
+
+class PlanAllCliTests(unittest.TestCase):
+    def test_plan_all_filters_by_category(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root, config_path = _make_repo(Path(tmp))
+            findings = analyze_repo(root, config_path, use_cache=False)
+            findings_path = root / ".ai-clean" / "findings.json"
+            findings_path.parent.mkdir(parents=True, exist_ok=True)
+            findings_path.write_text(
+                json.dumps([finding.model_dump(mode="json") for finding in findings])
+            )
+
+            stdout = StringIO()
+            with redirect_stdout(stdout):
+                exit_code = cli.main(
+                    [
+                        "plan",
+                        "--all",
+                        "--category",
+                        "missing_docstring",
+                        "--root",
+                        str(root),
+                        "--config",
+                        str(config_path),
+                    ]
+                )
+
+            saved = sorted(
+                path.stem for path in (root / ".ai-clean" / "plans").iterdir()
+            )
+
+        expected = sorted(
+            f"{finding.id}-docstring"
+            for finding in findings
+            if finding.category == "missing_docstring"
+        )
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(saved, expected)
+        self.assertIn(f"Created {len(expected)} plan(s)", stdout.getvalue())
+
+    def test_plan_requires_finding_id_or_all(self) -> None:
+        stderr = StringIO()
+        with redirect_stderr(stderr):
+            exit_code = cli.main(["plan"])
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("finding_id or --all", stderr.getvalue())
+
+
+def _make_repo(base: Path) -> tuple[Path, Path]:
+    root = base / "repo"
+    root.mkdir()
+    config_path = base / "ai-clean.toml"
+    config_path.write_text(_basic_config(), encoding="utf-8")
+    for name in ("alpha.py", "beta.py"):
+        (root / name).write_text(
+            "def helper():\n    return 1\n\n\nclass Widget:\n    pass\n",
+            encoding="utf-8",
+        )
+    return root, config_path
+
+
+def _basic_config() -> str:
+    return (
+        textwrap.dedent(
+            """
+        [spec_backend]
+        type = "butler"
+        default_batch_group = "default"
+
+        [executor]
+        type = "codex_shell"
+        binary = "codex"
+        apply_args = ["apply"]
+
+        [review]
+        type = "codex_review"
+        mode = "summarize-and-risk"
+
+        [git]
+        base_branch = "main"
+        refactor_branch = "refactor/ai-clean"
+
+        [tests]
+        default_command = "pytest -q"
+
+        [analyzers.duplicate]
+        window_size = 2
+        min_occurrences = 2
+        ignore_dirs = [".git", "__pycache__", ".venv"]
+
+        [analyzers.structure]
+        max_file_lines = 10
+        max_function_lines = 10
+        ignore_dirs = [".git", "__pycache__", ".venv"]
+
+        [analyzers.docstring]
+        min_docstring_length = 10
+        min_symbol_lines = 1
+        weak_markers = ["TODO"]
+        important_symbols_only = false
+        ignore_dirs = [".git", "__pycache__", ".venv"]
+
+        [analyzers.organize]
+        min_group_size = 2
+        max_group_size = 3
+        max_groups = 2
+        ignore_dirs = [".git", "__pycache__", ".venv"]
+        """
+        ).strip()
+        + "\n"
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
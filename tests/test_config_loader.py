@@ -5,7 +5,7 @@ import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from ai_clean.config import load_config
+from ai_clean.config import PromptsConfig, load_config
 from ai_clean.factories import get_executor, get_review_executor, get_spec_backend
 from ai_clean.models import CleanupPlan
 from ai_clean.paths import default_spec_path
@@ -204,6 +204,92 @@ class ConfigLoaderTests(unittest.TestCase):
             with self.assertRaisesRegex(ValueError, "max_changed_lines_per_plan"):
                 load_config(cfg_path)
 
+    def test_analyzer_jobs_default_and_validation(self) -> None:
+        with TemporaryDirectory() as tmp:
+            cfg_path = Path(tmp) / "ai-clean.toml"
+            _write_config(cfg_path)
+            base_text = cfg_path.read_text()
+            self.assertEqual(load_config(cfg_path).analyzers.jobs, 1)
+
+            cfg_path.write_text(
+                base_text.replace(
+                    "[analyzers.duplicate]",
+                    "[analyzers]\njobs = 4\n\n[analyzers.duplicate]",
+                )
+            )
+            self.assertEqual(load_config(cfg_path).analyzers.jobs, 4)
+
+            cfg_path.write_text(
+                base_text.replace(
+                    "[analyzers.duplicate]",
+                    "[analyzers]\njobs = 0\n\n[analyzers.duplicate]",
+                )
+            )
+            with self.assertRaisesRegex(ValueError, "jobs"):
+                load_config(cfg_path)
+
+    def test_tests_impact_selection_settings(self) -> None:
+        with TemporaryDirectory() as tmp:
+            cfg_path = Path(tmp) / "ai-clean.toml"
+            _write_config(cfg_path)
+            base_text = cfg_path.read_text()
+            tests = load_config(cfg_path).tests
+            self.assertFalse(tests.impact_selection)
+            self.assertEqual(tests.impact_command, "")
+
+            cfg_path.write_text(
+                base_text.replace(
+                    'default_command = "pytest -q"',
+                    'default_command = "pytest -q"\nimpact_selection = true\n'
+                    'impact_command = "pytest -x {tests}"\n'
+                    'coverage_json = "coverage.json"',
+                )
+            )
+            tests = load_config(cfg_path).tests
+            self.assertTrue(tests.impact_selection)
+            self.assertEqual(tests.impact_command, "pytest -x {tests}")
+            self.assertEqual(tests.coverage_json, "coverage.json")
+
+    def test_metadata_store_validation(self) -> None:
+        with TemporaryDirectory() as tmp:
+            cfg_path = Path(tmp) / "ai-clean.toml"
+            _write_config(cfg_path)
+            base_text = cfg_path.read_text()
+            self.assertEqual(load_config(cfg_path).metadata_store, "files")
+
+            cfg_path.write_text(base_text + '\n[metadata]\nstore = "sqlite"\n')
+            self.assertEqual(load_config(cfg_path).metadata_store, "sqlite")
+
+            cfg_path.write_text(base_text + '\n[metadata]\nstore = "redis"\n')
+            with self.assertRaisesRegex(ValueError, "metadata.store"):
+                load_config(cfg_path)
+
+    def test_prompts_section(self) -> None:
+        with TemporaryDirectory() as tmp:
+            cfg_path = Path(tmp) / "ai-clean.toml"
+            _write_config(cfg_path)
+            base_text = cfg_path.read_text()
+            self.assertEqual(load_config(cfg_path).prompts, PromptsConfig())
+
+            cfg_path.write_text(
+                base_text + "\n[prompts]\ncache = false\njobs = 8\nretries = 0\n"
+                "cache_ttl_seconds = 60\ncache_max_entries = 10\n"
+            )
+            self.assertEqual(
+                load_config(cfg_path).prompts,
+                PromptsConfig(
+                    cache=False,
+                    cache_ttl_seconds=60,
+                    cache_max_entries=10,
+                    jobs=8,
+                    retries=0,
+                ),
+            )
+
+            cfg_path.write_text(base_text + "\n[prompts]\njobs = 0\n")
+            with self.assertRaisesRegex(ValueError, "Prompts jobs"):
+                load_config(cfg_path)
+
     def test_unsupported_type(self) -> None:
         with TemporaryDirectory() as tmp:
             cfg_path = Path(tmp) / "ai-clean.toml"
@@ -229,6 +315,48 @@ class ConfigLoaderTests(unittest.TestCase):
             with self.assertRaisesRegex(ValueError, "min_occurrences"):
                 load_config(cfg_path)
 
+    def test_duplicate_mode_validation(self) -> None:
+        with TemporaryDirectory() as tmp:
+            cfg_path = Path(tmp) / "ai-clean.toml"
+            _write_config(cfg_path)
+            base_text = cfg_path.read_text()
+            self.assertEqual(load_config(cfg_path).analyzers.duplicate.mode, "lines")
+
+            cfg_path.write_text(
+                base_text.replace("window_size = 5", 'window_size = 5\nmode = "tokens"')
+            )
+            self.assertEqual(load_config(cfg_path).analyzers.duplicate.mode, "tokens")
+
+            cfg_path.write_text(
+                base_text.replace("window_size = 5", 'window_size = 5\nmode = "ast"')
+            )
+            with self.assertRaisesRegex(ValueError, "mode"):
+                load_config(cfg_path)
+
+    def test_duplicate_max_memory_validation(self) -> None:
+        with TemporaryDirectory() as tmp:
+            cfg_path = Path(tmp) / "ai-clean.toml"
+            _write_config(cfg_path)
+            base_text = cfg_path.read_text()
+            duplicate = load_config(cfg_path).analyzers.duplicate
+            self.assertEqual(duplicate.max_memory_mb, 0)
+
+            cfg_path.write_text(
+                base_text.replace(
+                    "window_size = 5", "window_size = 5\nmax_memory_mb = 512"
+                )
+            )
+            duplicate = load_config(cfg_path).analyzers.duplicate
+            self.assertEqual(duplicate.max_memory_mb, 512)
+
+            cfg_path.write_text(
+                base_text.replace(
+                    "window_size = 5", "window_size = 5\nmax_memory_mb = -1"
+                )
+            )
+            with self.assertRaisesRegex(ValueError, "max_memory_mb"):
+                load_config(cfg_path)
+
     def test_duplicate_ignore_dirs_validation(self) -> None:
         with TemporaryDirectory() as tmp:
             cfg_path = Path(tmp) / "ai-clean.toml"
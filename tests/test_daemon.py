@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from ai_clean import cli
+from ai_clean.analyzers import analyze_repo
+from ai_clean.daemon import TreeWatcher, default_socket_path, query_daemon, serve
+
+_REPO_CONFIG = Path(__file__).resolve().parents[1] / "ai-clean.toml"
+
+
+class TreeWatcherTests(unittest.TestCase):
+    def test_poll_reports_added_modified_and_removed_files(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "pkg").mkdir()
+            (root / "pkg" / "a.py").write_text("a = 1\n")
+            (root / "b.py").write_text("b = 1\n")
+            (root / "notes.txt").write_text("ignored\n")
+            watcher = TreeWatcher(root)
+
+            self.assertEqual(watcher.poll(), set())
+
+            (root / "pkg" / "a.py").write_text("a = 22\n")
+            (root / "b.py").unlink()
+            (root / "c.py").write_text("c = 1\n")
+            (root / "notes.txt").write_text("still ignored\n")
+
+            self.assertEqual(watcher.poll(), {"pkg/a.py", "b.py", "c.py"})
+            self.assertEqual(watcher.poll(), set())
+
+
+class DaemonTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name) / "repo"
+        self.root.mkdir()
+        self.config_path = self.root / "ai-clean.toml"
+        self.config_path.write_text(_REPO_CONFIG.read_text())
+        (self.root / "service.py").write_text(
+            "def handler(value):\n    return value\n", encoding="utf-8"
+        )
+
+    def _start(self) -> None:
+        ready = threading.Event()
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=serve,
+            args=(self.root, self.config_path),
+            kwargs={"interval": 0.05, "on_ready": lambda _: ready.set(), "stop": stop},
+            daemon=True,
+        )
+        thread.start()
+        self.assertTrue(ready.wait(10))
+
+        def _stop() -> None:
+            stop.set()
+            thread.join(10)
+
+        self.addCleanup(_stop)
+
+    def test_queries_match_local_analysis_and_follow_edits(self) -> None:
+        self._start()
+
+        served = query_daemon("analyze", self.root, self.config_path)
+        expected = analyze_repo(self.root, self.config_path, use_cache=False)
+        self.assertEqual(served, expected)
+
+        (self.root / "service.py").write_text(
+            '"""Service helpers."""\n\n\ndef handler(value):\n'
+            '    """Return the value unchanged for callers."""\n    return value\n',
+            encoding="utf-8",
+        )
+        (self.root / "extra.py").write_text("def extra():\n    return 2\n")
+
+        served = query_daemon("analyze", self.root, self.config_path)
+        expected = analyze_repo(self.root, self.config_path, use_cache=False)
+        self.assertEqual(served, expected)
+        self.assertIn(
+            "extra.py", json.dumps([f.model_dump(mode="json") for f in served])
+        )
+
+    def test_mismatched_root_or_disabled_client_falls_back(self) -> None:
+        self._start()
+        other = self.root / "pkg"
+        other.mkdir()
+
+        socket_path = default_socket_path(self.root)
+        self.assertIsNone(query_daemon("analyze", other, None, socket_path=socket_path))
+        with mock.patch.dict(os.environ, {"AI_CLEAN_NO_DAEMON": "1"}):
+            self.assertIsNone(query_daemon("analyze", self.root, self.config_path))
+
+    def test_socket_removed_after_stop(self) -> None:
+        self._start()
+        socket_path = default_socket_path(self.root)
+        self.assertTrue(socket_path.exists())
+
+        self.doCleanups()
+
+        self.assertFalse(socket_path.exists())
+        self.assertIsNone(query_daemon("analyze", self.root, self.config_path))
+
+    def test_cli_analyze_uses_running_daemon(self) -> None:
+        self._start()
+        expected = analyze_repo(self.root, self.config_path, use_cache=False)
+
+        stdout = StringIO()
+        with (
+            mock.patch.object(
+                cli, "analyze_repo", side_effect=AssertionError("ran locally")
+            ),
+            redirect_stdout(stdout),
+        ):
+            exit_code = cli.main(["analyze", "--root", str(self.root), "--json"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(
+            json.loads(stdout.getvalue()),
+            [finding.model_dump(mode="json") for finding in expected],
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import dataclasses
 import json
 import shlex
+import shutil
 import subprocess
 from pathlib import Path
+from typing import Sequence
 
 import pytest
 
@@ -23,7 +26,12 @@ from ai_clean.config import (
     StructureAnalyzerConfig,
     TestsConfig,
 )
-from ai_clean.factories import get_executor, get_review_executor, get_spec_backend
+from ai_clean.factories import (
+    get_batch_runner,
+    get_executor,
+    get_review_executor,
+    get_spec_backend,
+)
 from ai_clean.models import CleanupPlan, ExecutionResult
 from ai_clean.spec_backends import ButlerSpecBackend
 
@@ -297,6 +305,106 @@ def test_executor_runs_tests_after_successful_apply(monkeypatch, tmp_path):
     assert tests_meta["stderr"] == "test err"
 
 
+def test_executor_runs_only_impacted_tests_when_enabled(monkeypatch, tmp_path):
+    config = _sample_config("butler", tests_command="pytest -q")
+    config = dataclasses.replace(
+        config, tests=dataclasses.replace(config.tests, impact_selection=True)
+    )
+    executor = get_executor(config).executor
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "core.py").write_text("VALUE = 1\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_core.py").write_text("from pkg import core\n")
+    (tmp_path / "tests" / "test_misc.py").write_text("import json\n")
+    spec_path = tmp_path / "spec-demo.butler.yaml"
+    spec_path.write_text("id: spec-demo\nplan_id: plan-1\ntarget_file: pkg/core.py\n")
+
+    monkeypatch.setattr(
+        factories.shutil, "which", lambda binary: f"/usr/local/bin/{binary}"
+    )
+    test_commands: list[str] = []
+
+    def fake_run(cmd, **kwargs):
+        if not isinstance(cmd, list):
+            test_commands.append(cmd)
+
+        class Result:
+            returncode = 0
+            stdout = ""
+            stderr = ""
+
+        return Result()
+
+    monkeypatch.setattr(factories.subprocess, "run", fake_run)
+
+    result = executor.apply_spec(spec_path)
+
+    assert test_commands == ["pytest -q tests/test_core.py"]
+    assert result.metadata["tests"]["selection"] == {
+        "mode": "impact",
+        "target": "pkg/core.py",
+        "tests": ["tests/test_core.py"],
+    }
+
+    spec_path.write_text("id: spec-demo\nplan_id: plan-1\ntarget_file: notes.txt\n")
+    result = executor.apply_spec(spec_path)
+
+    assert test_commands[-1] == "pytest -q"
+    assert result.metadata["tests"]["selection"]["mode"] == "full"
+
+
+def test_executor_runs_impacted_tests_from_the_repo_root(monkeypatch, tmp_path):
+    config = _sample_config("butler", tests_command="pytest -q")
+    config = dataclasses.replace(
+        config, tests=dataclasses.replace(config.tests, impact_selection=True)
+    )
+    executor = get_executor(config).executor
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "core.py").write_text("VALUE = 1\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_core.py").write_text("from pkg import core\n")
+    specs_dir = tmp_path / ".ai-clean" / "specs"
+    specs_dir.mkdir(parents=True)
+    spec_path = specs_dir / "spec-demo.butler.yaml"
+    spec_path.write_text("id: spec-demo\nplan_id: plan-1\ntarget_file: pkg/core.py\n")
+
+    monkeypatch.setattr(
+        factories.shutil, "which", lambda binary: f"/usr/local/bin/{binary}"
+    )
+    builds: list[Path] = []
+    build_graph = factories.TestImpactIndex._build_graph
+
+    def counting_build(index):
+        builds.append(index.root)
+        build_graph(index)
+
+    monkeypatch.setattr(factories.TestImpactIndex, "_build_graph", counting_build)
+    calls: list[tuple[object, object]] = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append((cmd, kwargs.get("cwd")))
+
+        class Result:
+            returncode = 0
+            stdout = ""
+            stderr = ""
+
+        return Result()
+
+    monkeypatch.setattr(factories.subprocess, "run", fake_run)
+
+    executor.apply_spec(spec_path)
+    executor.apply_spec(spec_path)
+
+    test_calls = [call for call in calls if not isinstance(call[0], list)]
+    assert test_calls == [("pytest -q tests/test_core.py", tmp_path)] * 2
+    apply_calls = [call for call in calls if isinstance(call[0], list)]
+    assert all(cwd == spec_path.resolve().parent for _, cwd in apply_calls)
+    assert builds == [tmp_path]
+
+
 def test_executor_marks_tests_failed_without_affecting_apply_success(
     monkeypatch, tmp_path
 ):
@@ -593,3 +701,153 @@ def test_review_executor_rejects_patchy_output(monkeypatch, tmp_path):
 
     with pytest.raises(ValueError, match="advisory-only"):
         reviewer.review_change(None, "", exec_result)
+
+
+def _batch_repo(
+    tmp_path: Path, specs: Sequence[tuple[str, str, str]]
+) -> tuple[Path, Path, AiCleanConfig]:
+    """Create a git repo, a fake Codex that appends to targets, and spec files."""
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for _, target, _ in specs:
+        path = repo / target
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+        ).stdout
+
+    git("init", "-q", "-b", "main")
+    git("add", ".")
+    git("-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-qm", "i")
+
+    fake_codex = tmp_path / "fake-codex"
+    fake_codex.write_text(
+        "#!/bin/sh\n"
+        "target=$(sed -n 's/^target_file: //p' \"$1\")\n"
+        'echo "# $(basename "$1")" >> "$target"\n'
+    )
+    fake_codex.chmod(0o755)
+
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir()
+    for spec_id, target, group in specs:
+        (specs_dir / f"{spec_id}.butler.yaml").write_text(
+            f"id: {spec_id}\nplan_id: plan-{spec_id}\n"
+            f"target_file: {target}\nbatch_group: {group}\n"
+        )
+
+    config = _sample_config("butler", tests_command="true")
+    config = dataclasses.replace(
+        config,
+        executor=dataclasses.replace(
+            config.executor, binary=str(fake_codex), apply_args=()
+        ),
+    )
+    return repo, specs_dir, config
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_batch_runner_isolates_targets_in_worktrees(tmp_path):
+    repo, specs_dir, config = _batch_repo(
+        tmp_path,
+        (
+            ("a1", "alpha.py", "nightly"),
+            ("a2", "alpha.py", "nightly"),
+            ("b1", "beta.py", "nightly"),
+            ("other", "beta.py", "later"),
+        ),
+    )
+    finished: list[str] = []
+    handle = get_batch_runner(
+        config,
+        repo,
+        tmp_path / "worktrees",
+        workers=2,
+        on_result=lambda result: finished.append(result.plan_id),
+    )
+
+    results = handle.runner.apply_batch(specs_dir, "nightly")
+
+    by_plan = {result.plan_id: result for result in results}
+    assert sorted(finished) == ["plan-a1", "plan-a2", "plan-b1"]
+    assert all(result.success and result.tests_passed for result in results)
+    alpha_tree = Path(by_plan["plan-a2"].metadata["batch"]["worktree"])
+    assert (alpha_tree / "alpha.py").read_text() == (
+        "x = 1\n# a1.butler.yaml\n# a2.butler.yaml\n"
+    )
+    assert "# b1.butler.yaml" in (by_plan["plan-b1"].git_diff or "")
+    assert "alpha.py" not in (by_plan["plan-b1"].git_diff or "")
+    assert (repo / "alpha.py").read_text() == "x = 1\n"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_batch_runner_keeps_targets_with_colliding_slugs_apart(tmp_path):
+    repo, specs_dir, config = _batch_repo(
+        tmp_path,
+        (("nested", "pkg/mod.py", "nightly"), ("flat", "pkg-mod.py", "nightly")),
+    )
+    handle = get_batch_runner(config, repo, tmp_path / "worktrees", workers=2)
+
+    results = handle.runner.apply_batch(specs_dir, "nightly")
+
+    by_plan = {result.plan_id: result for result in results}
+    assert all(result.success for result in results)
+    trees = {by_plan[plan].metadata["batch"]["worktree"] for plan in by_plan}
+    branches = {by_plan[plan].metadata["batch"]["branch"] for plan in by_plan}
+    assert len(trees) == len(branches) == 2
+    nested = Path(by_plan["plan-nested"].metadata["batch"]["worktree"])
+    flat = Path(by_plan["plan-flat"].metadata["batch"]["worktree"])
+    assert (nested / "pkg" / "mod.py").read_text() == "x = 1\n# nested.butler.yaml\n"
+    assert (flat / "pkg-mod.py").read_text() == "x = 1\n# flat.butler.yaml\n"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_batch_runner_refuses_to_replace_existing_worktrees(tmp_path):
+    repo, specs_dir, config = _batch_repo(tmp_path, (("a1", "alpha.py", "nightly"),))
+    worktrees = tmp_path / "worktrees"
+    (first,) = get_batch_runner(config, repo, worktrees).runner.apply_batch(
+        specs_dir, "nightly"
+    )
+    tree = Path(first.metadata["batch"]["worktree"])
+
+    (second,) = get_batch_runner(config, repo, worktrees).runner.apply_batch(
+        specs_dir, "nightly"
+    )
+
+    assert first.success
+    assert not second.success
+    assert "already exists" in second.stderr
+    assert (tree / "alpha.py").read_text() == "x = 1\n# a1.butler.yaml\n"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_batch_runner_reports_unexpected_spec_errors_per_spec(monkeypatch, tmp_path):
+    repo, specs_dir, config = _batch_repo(
+        tmp_path,
+        (
+            ("bad", "alpha.py", "nightly"),
+            ("after", "alpha.py", "nightly"),
+            ("good", "beta.py", "nightly"),
+        ),
+    )
+    apply_spec = factories._CodexShellExecutor.apply_spec
+
+    def flaky_apply(self, spec_path, **kwargs):
+        if spec_path.name.startswith("bad"):
+            raise TypeError("unexpected spec shape")
+        return apply_spec(self, spec_path, **kwargs)
+
+    monkeypatch.setattr(factories._CodexShellExecutor, "apply_spec", flaky_apply)
+    handle = get_batch_runner(config, repo, tmp_path / "worktrees", workers=2)
+
+    results = handle.runner.apply_batch(specs_dir, "nightly")
+
+    by_plan = {result.plan_id: result for result in results}
+    assert sorted(by_plan) == ["plan-after", "plan-bad", "plan-good"]
+    assert not by_plan["plan-bad"].success
+    assert by_plan["plan-bad"].stderr == "unexpected spec shape"
+    assert by_plan["plan-after"].success and by_plan["plan-good"].success
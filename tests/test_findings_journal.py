@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from ai_clean.findings_journal import FindingsJournal
+from ai_clean.models import Finding, FindingLocation
+
+
+def _finding(finding_id: str, description: str = "demo") -> Finding:
+    return Finding(
+        id=finding_id,
+        category="advanced_cleanup",
+        description=description,
+        locations=[FindingLocation(path=Path("pkg/a.py"), start_line=1, end_line=2)],
+    )
+
+
+def _seed_snapshot(path: Path, count: int) -> None:
+    path.write_text(
+        json.dumps(
+            [_finding(f"f-{index}").model_dump(mode="json") for index in range(count)]
+        )
+    )
+
+
+def test_first_append_writes_snapshot(tmp_path: Path):
+    journal = FindingsJournal(tmp_path / "findings.json")
+
+    journal.append([_finding("a"), _finding("b")])
+
+    stored = json.loads((tmp_path / "findings.json").read_text())
+    assert [item["id"] for item in stored] == ["a", "b"]
+    assert not journal.journal_path.exists()
+    assert FindingsJournal(tmp_path / "findings.json").ids() == {"a", "b"}
+
+
+def test_append_only_writes_the_journal(tmp_path: Path):
+    path = tmp_path / "findings.json"
+    _seed_snapshot(path, 50)
+    snapshot = path.read_text()
+    journal = FindingsJournal(path)
+
+    journal.append([_finding("new"), _finding("f-3", description="updated")])
+
+    assert path.read_text() == snapshot
+    assert len(journal.journal_path.read_text().splitlines()) == 2
+    reloaded = FindingsJournal(path)
+    findings = {finding.id: finding for finding in reloaded.load()}
+    assert len(findings) == 51
+    assert findings["f-3"].description == "updated"
+    assert "new" in reloaded.ids()
+
+
+def test_journal_compacts_once_it_outgrows_the_snapshot(tmp_path: Path):
+    path = tmp_path / "findings.json"
+    _seed_snapshot(path, 2)
+    journal = FindingsJournal(path)
+
+    for index in range(10):
+        journal.append([_finding(f"new-{index}")])
+
+    stored_ids = {item["id"] for item in json.loads(path.read_text())}
+    assert len(FindingsJournal(path).load()) == 12
+    assert len(stored_ids) > 2
+    assert journal.journal_path.stat().st_size < path.stat().st_size
+
+
+def test_snapshot_rewritten_elsewhere_discards_stale_journal(tmp_path: Path):
+    path = tmp_path / "findings.json"
+    _seed_snapshot(path, 20)
+    journal = FindingsJournal(path)
+    journal.append([_finding("old")])
+    stale = path.stat().st_mtime_ns - 1_000_000_000
+    os.utime(journal.journal_path, ns=(stale, stale))
+    os.utime(journal.ids_path, ns=(stale, stale))
+
+    reloaded = FindingsJournal(path)
+
+    assert "old" not in {finding.id for finding in reloaded.load()}
+    assert "old" not in reloaded.ids()
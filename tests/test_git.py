@@ -147,3 +147,37 @@ def test_get_diff_stat_propagates_failure(monkeypatch):
 
     with pytest.raises(subprocess.CalledProcessError):
         git.get_diff_stat()
+
+
+def test_changed_files_combines_diff_and_untracked(monkeypatch, tmp_path):
+    calls: list[tuple[list[str], object]] = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append((cmd, kwargs.get("cwd")))
+        if cmd[1] == "diff":
+            return _Result(stdout="pkg/b.py\0a.py\0")
+        return _Result(stdout="new.py\0a.py\0")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    assert git.changed_files(tmp_path, "main") == ["a.py", "new.py", "pkg/b.py"]
+    assert calls == [
+        (["git", "diff", "--name-only", "-z", "--relative", "main", "--"], tmp_path),
+        (["git", "ls-files", "-z", "--others", "--exclude-standard"], tmp_path),
+    ]
+
+
+def test_changed_files_keeps_names_git_would_quote(tmp_path):
+    def run(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    run("init", "-q")
+    run("config", "user.email", "test@example.com")
+    run("config", "user.name", "Test")
+    (tmp_path / "café.py").write_text("x = 1\n")
+    run("add", "café.py")
+    run("commit", "-q", "-m", "init")
+    (tmp_path / "café.py").write_text("x = 2\n")
+    (tmp_path / "new\tname.py").write_text("y = 1\n")
+
+    assert git.changed_files(tmp_path) == ["café.py", "new\tname.py"]
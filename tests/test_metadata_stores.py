@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from ai_clean import cli
+from ai_clean.interfaces import MetadataStore
+from ai_clean.metadata_stores import (
+    FileMetadataStore,
+    SqliteMetadataStore,
+    copy_metadata,
+)
+from ai_clean.models import CleanupPlan, ExecutionResult, Finding, FindingLocation
+
+_REPO_CONFIG = Path(__file__).resolve().parents[1] / "ai-clean.toml"
+
+
+@pytest.fixture(params=["files", "sqlite"])
+def store(request, tmp_path: Path):
+    if request.param == "files":
+        backend = FileMetadataStore(
+            tmp_path / "plans", tmp_path / "results", tmp_path / "findings.json"
+        )
+    else:
+        backend = SqliteMetadataStore(tmp_path / "metadata.db")
+    yield backend
+    backend.close()
+
+
+def _plan(plan_id: str) -> CleanupPlan:
+    return CleanupPlan(
+        id=plan_id,
+        finding_id=f"finding-{plan_id}",
+        title="Demo",
+        intent="Clean up something",
+        steps=["do one thing"],
+        constraints=[],
+        tests_to_run=["pytest -q"],
+    )
+
+
+def _result(plan_id: str, *, success: bool, manual: bool = False) -> ExecutionResult:
+    return ExecutionResult(
+        spec_id=f"{plan_id}-spec",
+        plan_id=plan_id,
+        success=success,
+        tests_passed=success or None,
+        stdout="",
+        stderr="",
+        metadata={"manual_execution_required": manual},
+    )
+
+
+def _finding(finding_id: str, category: str, *paths: str) -> Finding:
+    return Finding(
+        id=finding_id,
+        category=category,
+        description="demo",
+        locations=[
+            FindingLocation(path=Path(path), start_line=1, end_line=2)
+            for path in paths
+        ],
+    )
+
+
+def test_store_satisfies_protocol(store):
+    assert isinstance(store, MetadataStore)
+
+
+def test_plans_and_results_round_trip_with_status(store):
+    store.save_plans([_plan("b"), _plan("a"), _plan("c"), _plan("d")])
+    store.save_results(
+        [
+            _result("a", success=True),
+            _result("b", success=False),
+            _result("d", success=False, manual=True),
+        ]
+    )
+
+    assert store.load_plan("a") == _plan("a")
+    assert [plan.id for plan in store.list_plans()] == ["a", "b", "c", "d"]
+    assert store.plan_statuses() == {
+        "a": "applied",
+        "b": "failed",
+        "c": "planned",
+        "d": "manual",
+    }
+    assert [plan.id for plan in store.list_plans(status="failed")] == ["b"]
+    assert store.load_result("b") == _result("b", success=False)
+    assert [result.plan_id for result in store.list_results()] == ["a", "b", "d"]
+
+
+def test_missing_objects_raise_file_not_found(store):
+    with pytest.raises(FileNotFoundError):
+        store.load_plan("missing")
+    with pytest.raises(FileNotFoundError):
+        store.load_result("missing")
+
+
+def test_findings_upsert_and_filter(store):
+    store.save_findings(
+        [
+            _finding("dup-1", "duplicate_block", "pkg/a.py", "pkg/b.py"),
+            _finding("doc-1", "missing_docstring", "pkg/a.py"),
+        ]
+    )
+    store.save_findings([_finding("dup-1", "duplicate_block", "pkg/c.py")])
+
+    assert [f.id for f in store.list_findings()] == ["doc-1", "dup-1"]
+    assert [f.id for f in store.list_findings(category="duplicate_block")] == [
+        "dup-1"
+    ]
+    assert [f.id for f in store.list_findings(path="pkg/a.py")] == ["doc-1"]
+    assert [f.id for f in store.list_findings(path="pkg/c.py")] == ["dup-1"]
+
+    store.save_findings([_finding("new-1", "large_file", "x.py")], replace=True)
+    assert [f.id for f in store.list_findings()] == ["new-1"]
+
+
+def test_sqlite_store_uses_wal(tmp_path: Path):
+    store = SqliteMetadataStore(tmp_path / "metadata.db")
+    store.close()
+
+    with sqlite3.connect(tmp_path / "metadata.db") as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_export_writes_file_layout(tmp_path: Path):
+    source = SqliteMetadataStore(tmp_path / "metadata.db")
+    source.save_plans([_plan("a")])
+    source.save_results([_result("a", success=True)])
+    source.save_findings([_finding("doc-1", "missing_docstring", "pkg/a.py")])
+    layout = FileMetadataStore(
+        tmp_path / "out" / "plans",
+        tmp_path / "out" / "results",
+        tmp_path / "out" / "findings.json",
+    )
+
+    counts = copy_metadata(source, layout)
+    source.close()
+
+    assert counts == (1, 1, 1)
+    assert CleanupPlan.from_json((tmp_path / "out/plans/a.json").read_text()) == (
+        _plan("a")
+    )
+    assert (tmp_path / "out/results/a.json").is_file()
+    assert [f.id for f in layout.list_findings()] == ["doc-1"]
+
+
+def test_cli_imports_and_lists_from_sqlite_store(tmp_path: Path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    config_path = tmp_path / "ai-clean.toml"
+    config_path.write_text(
+        _REPO_CONFIG.read_text() + '\n[metadata]\nstore = "sqlite"\n'
+    )
+    layout = FileMetadataStore(
+        tmp_path / "legacy" / "plans",
+        tmp_path / "legacy" / "results",
+        tmp_path / "legacy" / "findings.json",
+    )
+    layout.save_plans([_plan("a"), _plan("b")])
+    layout.save_results([_result("a", success=True)])
+    layout.save_findings(
+        [
+            _finding("dup-1", "duplicate_block", "pkg/a.py"),
+            _finding("doc-1", "missing_docstring", "pkg/b.py"),
+        ]
+    )
+    common = ["--root", str(root), "--config", str(config_path)]
+
+    with redirect_stdout(StringIO()):
+        assert (
+            cli.main(["metadata", "import", "--dir", str(tmp_path / "legacy"), *common])
+            == 0
+        )
+    stdout = StringIO()
+    with redirect_stdout(stdout):
+        assert cli.main(["list", "plans", "--status", "planned", *common]) == 0
+        assert (
+            cli.main(
+                ["list", "findings", "--category", "duplicate_block", "--json", *common]
+            )
+            == 0
+        )
+
+    lines = stdout.getvalue().splitlines()
+    assert lines[0].startswith("b | planned | finding-b")
+    assert len(lines) == 2
+    assert json.loads(lines[1])["id"] == "dup-1"
+    assert (root / ".ai-clean" / "metadata.db").is_file()
+    assert not list((root / ".ai-clean" / "plans").glob("*.json"))
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import ai_clean.factories as factories
+from ai_clean.config import load_config
+from ai_clean.interfaces import PromptAttachment, ReviewContext
+from ai_clean.models import CleanupPlan, ExecutionResult
+from ai_clean.prompt_runners import (
+    CachingPromptRunner,
+    PromptRequest,
+    PromptResponseCache,
+    prompt_cache_key,
+    run_prompts,
+)
+
+REPO_CONFIG = Path(__file__).resolve().parents[1] / "ai-clean.toml"
+
+
+class StubRunner:
+    """Local stand-in for Codex: echoes prompts and counts calls."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0) -> None:
+        self.calls: list[str] = []
+        self.failures = failures
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def run(self, prompt, attachments):
+        with self._lock:
+            self.calls.append(prompt)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            fail = self.failures > 0
+            self.failures -= fail
+        try:
+            time.sleep(self.delay)
+            if fail:
+                raise RuntimeError("transient")
+            return f"answer:{prompt}"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_cache_key_covers_attachment_content():
+    first = [PromptAttachment(path=Path("a.py"), content="x = 1\n")]
+    second = [PromptAttachment(path=Path("a.py"), content="x = 2\n")]
+
+    assert prompt_cache_key("p", first) == prompt_cache_key("p", list(first))
+    assert prompt_cache_key("p", first) != prompt_cache_key("p", second)
+    assert prompt_cache_key("p", first) != prompt_cache_key("p", first, "model")
+
+
+def test_caching_runner_answers_repeat_prompts_from_disk(tmp_path):
+    stub = StubRunner()
+    attachments = [PromptAttachment(path=Path("a.py"), content="x = 1\n")]
+    runner = CachingPromptRunner(stub, PromptResponseCache(tmp_path))
+
+    assert runner.run("review", attachments) == "answer:review"
+    reopened = CachingPromptRunner(stub, PromptResponseCache(tmp_path))
+    assert reopened.run("review", attachments) == "answer:review"
+    reopened.run("review", [PromptAttachment(path=Path("a.py"), content="x = 2\n")])
+
+    assert stub.calls == ["review", "review"]
+    assert (reopened.hits, reopened.misses) == (1, 1)
+
+
+def test_caching_runner_does_not_cache_failures(tmp_path):
+    stub = StubRunner(failures=1)
+    runner = CachingPromptRunner(stub, PromptResponseCache(tmp_path))
+
+    try:
+        runner.run("p", [])
+    except RuntimeError:
+        pass
+    assert runner.run("p", []) == "answer:p"
+    assert len(stub.calls) == 2
+
+
+def test_caching_runner_collapses_concurrent_identical_prompts(tmp_path):
+    stub = StubRunner(delay=0.2)
+    runner = CachingPromptRunner(stub, PromptResponseCache(tmp_path))
+    results: list[str] = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(runner.run("same", [])))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["answer:same"] * 4
+    assert stub.calls == ["same"]
+
+
+def test_caching_runner_returns_responses_when_the_cache_write_fails(tmp_path):
+    class FullCache(PromptResponseCache):
+        def put(self, key, response):
+            raise OSError("disk full")
+
+    stub = StubRunner(delay=0.2)
+    runner = CachingPromptRunner(stub, FullCache(tmp_path))
+    results: list[str] = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(runner.run("same", [])))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=3)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert results == ["answer:same"] * 2
+    assert stub.calls == ["same"]
+
+
+def test_cache_expires_entries_after_ttl(tmp_path):
+    cache = PromptResponseCache(tmp_path, ttl_seconds=60)
+    cache.put("key", "value")
+    assert cache.get("key") == "value"
+
+    entry = tmp_path / "key.json"
+    payload = json.loads(entry.read_text())
+    payload["created"] -= 120
+    entry.write_text(json.dumps(payload))
+
+    assert cache.get("key") is None
+    assert not entry.exists()
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = PromptResponseCache(tmp_path, max_entries=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    os.utime(tmp_path / "a.json", (1_000, 1_000))
+    os.utime(tmp_path / "b.json", (2_000, 2_000))
+    assert cache.get("a") == "1"  # now the most recently used
+
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_run_prompts_keeps_order_dedupes_and_bounds_concurrency():
+    stub = StubRunner(delay=0.05)
+    requests = [PromptRequest(f"p{index % 5}") for index in range(10)]
+
+    results = run_prompts(stub, requests, jobs=2, retries=0)
+
+    assert results == [f"answer:p{index % 5}" for index in range(10)]
+    assert sorted(stub.calls) == [f"p{index}" for index in range(5)]
+    assert stub.max_active <= 2
+
+
+def test_run_prompts_retries_and_reports_persistent_failures():
+    flaky = StubRunner(failures=1)
+    assert run_prompts(flaky, [PromptRequest("p")], retries=1, backoff_seconds=0) == [
+        "answer:p"
+    ]
+
+    broken = StubRunner(failures=10)
+    (result,) = run_prompts(broken, [PromptRequest("p")], retries=2, backoff_seconds=0)
+    assert isinstance(result, RuntimeError)
+    assert len(broken.calls) == 3
+
+
+def test_rerunning_reviews_on_unchanged_plans_skips_codex(monkeypatch, tmp_path):
+    stub = StubRunner()
+    monkeypatch.setattr(factories, "_CodexPromptRunner", lambda: stub)
+    config = dataclasses.replace(
+        load_config(REPO_CONFIG), metadata_root=tmp_path / ".ai-clean"
+    )
+    contexts = [_review_context(f"plan-{index}") for index in range(3)]
+
+    first = factories.get_review_executor(config).reviewer.review_changes(contexts)
+    second = factories.get_review_executor(config).reviewer.review_changes(contexts)
+
+    assert [review["summary"] for review in first] == [
+        review["summary"] for review in second
+    ]
+    assert all("plan-" in review["metadata"]["prompt"] for review in second)
+    assert len(stub.calls) == 3
+    assert list((tmp_path / ".ai-clean" / "prompt-cache").glob("*.json"))
+
+
+def _review_context(plan_id: str) -> ReviewContext:
+    plan = CleanupPlan(
+        id=plan_id,
+        finding_id="f-1",
+        title="Title",
+        intent="Improve docs",
+        steps=["a"],
+        constraints=[],
+        tests_to_run=[],
+    )
+    result = ExecutionResult(
+        spec_id=f"{plan_id}-spec",
+        plan_id=plan_id,
+        success=True,
+        tests_passed=True,
+        stdout="ok",
+        stderr="",
+    )
+    return ReviewContext(plan=plan, diff="diff", exec_result=result)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from ai_clean.test_impact import TestImpactIndex
+
+
+def _write(root: Path, relative: str, text: str) -> None:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _make_repo(root: Path) -> None:
+    _write(root, "pkg/__init__.py", "")
+    _write(root, "pkg/core.py", "VALUE = 1\n")
+    _write(root, "pkg/util.py", "from .core import VALUE\n")
+    _write(root, "pkg/cli.py", "from pkg import util\n")
+    _write(root, "tests/test_util.py", "import pkg.util\n")
+    _write(root, "tests/test_cli.py", "from pkg.cli import main\n")
+    _write(root, "tests/test_other.py", "import json\n")
+
+
+def test_selects_tests_that_transitively_import_the_file(tmp_path):
+    _make_repo(tmp_path)
+    index = TestImpactIndex(tmp_path)
+
+    assert index.select("pkg/core.py") == ["tests/test_cli.py", "tests/test_util.py"]
+    assert index.select("pkg/cli.py") == ["tests/test_cli.py"]
+    assert index.select("tests/test_other.py") == ["tests/test_other.py"]
+
+
+def test_unknown_impact_returns_none(tmp_path):
+    _make_repo(tmp_path)
+    _write(tmp_path, "scripts/orphan.py", "X = 1\n")
+    index = TestImpactIndex(tmp_path)
+
+    assert index.select("scripts/orphan.py") is None
+    assert index.select("README.md") is None
+
+
+def test_coverage_contexts_add_tests(tmp_path):
+    _make_repo(tmp_path)
+    _write(tmp_path, "scripts/orphan.py", "X = 1\n")
+    coverage = tmp_path / "coverage.json"
+    coverage.write_text(
+        json.dumps(
+            {
+                "files": {
+                    "scripts/orphan.py": {
+                        "contexts": {"1": ["tests/test_other.py::test_it|run", ""]}
+                    }
+                }
+            }
+        )
+    )
+    index = TestImpactIndex(tmp_path, coverage_json=coverage)
+
+    assert index.select("scripts/orphan.py") == ["tests/test_other.py"]